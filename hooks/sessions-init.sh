@@ -16,6 +16,13 @@ if [ -f "$CLI_SRC" ] && [ ! -f "$CLI_DEST" ]; then
     ln -sf "$CLI_SRC" "$CLI_DEST"
 fi
 
+# Warm the session index, search index and agent health cache in the background
+# so the first /council doesn't pay for a cold session scan or CLI probes.
+# Detached and budgeted — never delays session start.
+if [ -f "$CLI_SRC" ] && command -v python3 &>/dev/null; then
+    (python3 "$CLI_SRC" warmup --budget-ms 15000 </dev/null >/dev/null 2>&1 &)
+fi
+
 # First-run prerequisite check — only runs once after install.
 SENTINEL="$HOME/.claude/council/.prereqs-checked"
 if [ ! -f "$SENTINEL" ]; then
@@ -9,23 +9,56 @@ Every subcommand outputs JSON to stdout. Errors go to stderr.
 """
 
 import argparse
+import cProfile
+import glob
+import hashlib
 import json
+import math
+import mmap
 import os
 import re
+import shlex
 import shutil
+import sqlite3
 import subprocess
 import sys
+import tempfile
+import threading
 import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, the concurrency governor is a no-op
+    fcntl = None
+
 __version__ = "0.3.0"
 
 # ---------------------------------------------------------------------------
 # Directories
 # ---------------------------------------------------------------------------
 
-SESSIONS_DIR = Path.home() / ".claude" / "council" / "sessions"
+COUNCIL_DIR = Path.home() / ".claude" / "council"
+SESSIONS_DIR = COUNCIL_DIR / "sessions"
+CASSETTES_DIR = COUNCIL_DIR / "cassettes"
+SEARCH_DB = COUNCIL_DIR / "search.db"
+CONTEXT_CACHE_DB = COUNCIL_DIR / "context-cache.db"  # per-file digests for --context-file/--context-glob
+HEALTH_CACHE = COUNCIL_DIR / "health.json"
+SESSION_INDEX = COUNCIL_DIR / "index.json"
+CONFIG_FILE = COUNCIL_DIR / "config.json"
+LOCKS_DIR = COUNCIL_DIR / "locks"
+BREAKERS_FILE = COUNCIL_DIR / "breakers.json"
+SPOOL_DIR = COUNCIL_DIR / "spool"
+PERSONAS_DIR = COUNCIL_DIR / "personas"  # user catalogs; more dirs/files via COUNCIL_PERSONA_PATH
+PERSONA_CACHE = COUNCIL_DIR / "personas.cache.json"
+METRICS_FILE = COUNCIL_DIR / "metrics.json"
+GROUNDING_FILE = COUNCIL_DIR / "grounding.json"
+BLOBS_DIR = COUNCIL_DIR / "blobs"  # content-addressed large text fields, shared across sessions
+BLOB_REFS = BLOBS_DIR / "refs.json"
 ARCHIVE_DIR = Path.home() / "Documents" / "council"
 
 # ---------------------------------------------------------------------------
@@ -285,16 +318,186 @@ STOP_WORDS = {
     "were", "while",
 }
 
+# ---------------------------------------------------------------------------
+# Profiling (opt-in: --profile or COUNCIL_PROFILE=1)
+# ---------------------------------------------------------------------------
+
+PROFILE = {"enabled": False, "stages": {}, "counters": {}}
+
+
+@contextmanager
+def profile_stage(name):
+    """Time a named stage (accumulates if entered more than once)."""
+    if not PROFILE["enabled"]:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = (time.perf_counter() - start) * 1000
+        PROFILE["stages"][name] = PROFILE["stages"].get(name, 0) + elapsed
+
+
+def profile_count(name, n=1):
+    """Bump a profiling counter (files scanned, bytes read/written, ...)."""
+    if PROFILE["enabled"]:
+        PROFILE["counters"][name] = PROFILE["counters"].get(name, 0) + n
+
+
+def profile_start(args):
+    """Enable profiling if requested. Returns a running cProfile.Profile or None."""
+    enabled = getattr(args, "profile", False) or os.environ.get("COUNCIL_PROFILE", "") not in ("", "0")
+    if not enabled:
+        return None
+    PROFILE.update({"enabled": True, "stages": {}, "counters": {}, "start": time.perf_counter()})
+    if getattr(args, "profile_out", None) or os.environ.get("COUNCIL_PROFILE_OUT"):
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+    return None
+
+
+def profile_finish(args, profiler, output):
+    """Attach a 'timings' block to the command output and dump cProfile stats if requested."""
+    if not PROFILE["enabled"]:
+        return output
+    timings = {
+        "total_ms": round((time.perf_counter() - PROFILE["start"]) * 1000, 2),
+        "stages": {k: round(v, 2) for k, v in PROFILE["stages"].items()},
+        "files_scanned": 0,
+        "bytes_read": 0,
+        "bytes_written": 0,
+        "sessions_scored": 0,
+        **PROFILE["counters"],
+    }
+    if profiler:
+        profiler.disable()
+        out_path = getattr(args, "profile_out", None) or os.environ.get("COUNCIL_PROFILE_OUT")
+        profiler.dump_stats(out_path)
+        timings["cprofile"] = out_path
+    output["timings"] = timings
+    return output
+
+
+# ---------------------------------------------------------------------------
+# Telemetry (cumulative counters/histograms for `metrics`; COUNCIL_TELEMETRY=0 disables)
+# ---------------------------------------------------------------------------
+
+# Bucket upper bounds in seconds
+DISPATCH_BUCKETS = (1, 2.5, 5, 10, 20, 30, 60, 120, 300)
+HISTORIAN_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1)
+LOCK_BUCKETS = (0.001, 0.005, 0.025, 0.1, 0.25, 1, 5)
+
+TELEMETRY = {"counters": {}, "histograms": {}}
+_TELEMETRY_LOCK = threading.Lock()
+
+
+def _telemetry_enabled():
+    return os.environ.get("COUNCIL_TELEMETRY", "1") not in ("", "0")
+
+
+def _escape_label(value):
+    """Escape a label value for the exposition format: backslash, newline, double quote."""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _metric_labels(labels):
+    """Render labels as the exposition-format label set ('' when there are none)."""
+    if not labels:
+        return ""
+    return ",".join(f'{k}="{_escape_label(v)}"' for k, v in sorted(labels.items()))
+
+
+def telemetry_count(name, labels=None, n=1):
+    """Bump a counter in this process; flushed to METRICS_FILE when the command exits."""
+    if not _telemetry_enabled():
+        return
+    key = _metric_labels(labels)
+    with _TELEMETRY_LOCK:
+        series = TELEMETRY["counters"].setdefault(name, {})
+        series[key] = series.get(key, 0) + n
+
+
+def telemetry_observe(name, value, buckets, labels=None):
+    """Record one observation (seconds) into a histogram."""
+    if not _telemetry_enabled():
+        return
+    key = _metric_labels(labels)
+    with _TELEMETRY_LOCK:
+        hist = TELEMETRY["histograms"].setdefault(name, {"le": list(buckets), "series": {}})
+        entry = hist["series"].setdefault(key, {"counts": [0] * len(buckets), "sum": 0.0, "count": 0})
+        for i, bound in enumerate(buckets):
+            if value <= bound:
+                entry["counts"][i] += 1
+                break
+        entry["sum"] += value
+        entry["count"] += 1
+
+
+def _read_metrics():
+    try:
+        data = json.loads(METRICS_FILE.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {"counters": {}, "histograms": {}}
+    return data if isinstance(data, dict) else {"counters": {}, "histograms": {}}
+
+
+def telemetry_flush():
+    """Merge this process's telemetry into METRICS_FILE (one locked read-modify-write per process)."""
+    with _TELEMETRY_LOCK:
+        pending = {"counters": TELEMETRY["counters"], "histograms": TELEMETRY["histograms"]}
+        TELEMETRY.update(counters={}, histograms={})
+    if not pending["counters"] and not pending["histograms"]:
+        return
+    try:
+        # Not lock_name: telemetry about this lock would land after the flush
+        with locked_json_update(METRICS_FILE) as stored:
+            counters = stored.setdefault("counters", {})
+            for name, series in pending["counters"].items():
+                target = counters.setdefault(name, {})
+                for key, n in series.items():
+                    target[key] = target.get(key, 0) + n
+            histograms = stored.setdefault("histograms", {})
+            for name, hist in pending["histograms"].items():
+                target = histograms.setdefault(name, {"le": hist["le"], "series": {}})
+                if target["le"] != hist["le"]:
+                    # Buckets changed between versions: start the histogram over
+                    target = histograms[name] = {"le": hist["le"], "series": {}}
+                for key, entry in hist["series"].items():
+                    current = target["series"].setdefault(key, {"counts": [0] * len(hist["le"]), "sum": 0.0, "count": 0})
+                    current["counts"] = [a + b for a, b in zip(current["counts"], entry["counts"])]
+                    current["sum"] += entry["sum"]
+                    current["count"] += entry["count"]
+            stored.setdefault("created_at", time.time())
+            stored["updated_at"] = time.time()
+    except OSError:
+        pass
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Set by the global --compact-json flag (or COUNCIL_COMPACT_JSON=1)
+OUTPUT = {"compact": os.environ.get("COUNCIL_COMPACT_JSON", "") not in ("", "0")}
+
+
 def emit(data):
-    """Print JSON to stdout."""
-    json.dump(data, sys.stdout, indent=2, default=str)
+    """Print JSON to stdout (indented, or single-line in compact mode)."""
+    if OUTPUT["compact"]:
+        json.dump(data, sys.stdout, separators=(",", ":"), default=str)
+    else:
+        json.dump(data, sys.stdout, indent=2, default=str)
     sys.stdout.write("\n")
 
 
+def emit_line(data):
+    """Print one NDJSON record and flush, for streaming output."""
+    sys.stdout.write(json.dumps(data, separators=(",", ":"), default=str) + "\n")
+    sys.stdout.flush()
+
+
 def err(msg):
     """Print error to stderr and exit."""
     print(f"error: {msg}", file=sys.stderr)
@@ -309,6 +512,101 @@ def read_stdin_json():
         err(f"invalid JSON on stdin: {e}")
 
 
+def read_session_file(path):
+    """Read and parse a session JSON file, counting the I/O when profiling."""
+    raw = path.read_text()
+    profile_count("files_scanned")
+    if PROFILE["enabled"]:  # encoding a large session just to measure it isn't free
+        profile_count("bytes_read", len(raw.encode()))
+    return json.loads(raw)
+
+
+def _tmp_path(path):
+    """A temp name beside path that's unique to this process and thread."""
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def atomic_write_text(path, text):
+    """Write text beside path and rename it into place, so readers never see a partial file."""
+    tmp = _tmp_path(path)
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
+def write_session_file(path, data):
+    """Serialize a session to disk, moving large text fields into the blob store.
+
+    Sessions are read without the session lock (list, historian, index), and
+    quorum stragglers rewrite them from detached processes, so the write is
+    atomic.
+    """
+    stored, hashes = externalize_blobs(data)
+    raw = json.dumps(stored, indent=2)
+    atomic_write_text(path, raw)
+    if PROFILE["enabled"]:
+        profile_count("bytes_written", len(raw.encode()))
+    _update_blob_refs(_blob_owner(path), hashes)
+
+
+def flock_exclusive(fd, name):
+    """Take an exclusive flock on fd, recording acquisitions and contended waits under lock=`name`."""
+    telemetry_count("council_lock_acquisitions_total", {"lock": name})
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return
+    except BlockingIOError:
+        pass
+    start = time.monotonic()
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    telemetry_observe("council_lock_wait_seconds", time.monotonic() - start, LOCK_BUCKETS, {"lock": name})
+
+
+@contextmanager
+def locked_json_update(path, lock_name=None, indent=None, write=True):
+    """Read-modify-write a JSON object file under an exclusive flock on its .lock sibling.
+
+    Yields the stored object ({} if missing, unreadable or not an object)
+    for the block to change in place; it is written back atomically on a
+    clean exit, and only if it changed. lock_name records the lock's
+    contention in telemetry.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(path.with_suffix(".lock"), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            if lock_name:
+                flock_exclusive(fd, lock_name)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, json.JSONDecodeError):
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+        before = json.dumps(data, sort_keys=True)
+        yield data
+        if write and json.dumps(data, sort_keys=True) != before:
+            atomic_write_text(path, json.dumps(data, indent=indent))
+    finally:
+        os.close(fd)  # closing releases the flock
+
+
+@contextmanager
+def session_lock(path):
+    """Serialize read-modify-write of one session file across processes (no-op without fcntl)."""
+    if fcntl is None:
+        yield
+        return
+    LOCKS_DIR.mkdir(parents=True, exist_ok=True)
+    fd = os.open(LOCKS_DIR / f"session-{Path(path).stem}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        flock_exclusive(fd, "session")
+        yield
+    finally:
+        os.close(fd)
+
+
 def extract_keywords(text):
     """Extract meaningful keywords from text."""
     words = re.findall(r"[a-z]+", text.lower())
@@ -323,12 +621,255 @@ def slugify(text, max_len=40):
     return slug
 
 
+def load_config():
+    """Read the optional user config (~/.claude/council/config.json). Returns {} if absent or invalid."""
+    try:
+        config = json.loads(CONFIG_FILE.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return config if isinstance(config, dict) else {}
+
+
 def ensure_dirs():
     """Create session and archive directories if needed."""
     SESSIONS_DIR.mkdir(parents=True, exist_ok=True)
     ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
 
 
+# Bumped whenever normalize_legacy_keys learns a new rewrite or the on-disk
+# format changes; files stamped with the current version are already
+# normalized and skip it on read. 3: large text fields are blob references.
+SCHEMA_VERSION = 3
+
+
+# ---------------------------------------------------------------------------
+# Blob store (large session text stored once, referenced by SHA-256)
+# ---------------------------------------------------------------------------
+
+BLOB_MIN_BYTES = 2048  # strings at least this long are stored as blobs (COUNCIL_BLOB_MIN_BYTES, 0 = never)
+BLOB_GC_GRACE = 600  # unreferenced blobs younger than this survive gc (a writer may be about to reference them)
+# Kept inline: read by list/historian from the raw file, or edited in place by the skill
+BLOB_INLINE_KEYS = {"id", "question", "topic", "note", "synthesis", "synthesis_compact"}
+
+
+def _blob_min_bytes():
+    try:
+        return int(os.environ.get("COUNCIL_BLOB_MIN_BYTES", BLOB_MIN_BYTES))
+    except ValueError:
+        return BLOB_MIN_BYTES
+
+
+def _blob_path(digest):
+    return BLOBS_DIR / digest[:2] / f"{digest}.txt"
+
+
+def _is_blob_ref(value):
+    return isinstance(value, dict) and "$blob" in value and len(value) == 2
+
+
+def _blob_owner(path):
+    """Reference owner for a session file: its ID (also for *.json.tmp siblings)."""
+    return Path(path).name.split(".", 1)[0]
+
+
+def _blob_chunks(text, min_bytes):
+    """Split text before paragraph breaks into chunks of at least min_bytes.
+
+    Cuts depend only on the text before them, so strings that share a
+    prefix (the same --prior-context followed by different historian
+    blocks) share its chunks.
+    """
+    chunks, current = [], ""
+    for piece in re.split(r"(?=\n\n)", text):
+        current += piece
+        if len(current) >= min_bytes:
+            chunks.append(current)
+            current = ""
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _put_chunk(raw):
+    digest = hashlib.sha256(raw).hexdigest()
+    path = _blob_path(digest)
+    if path.exists():
+        os.utime(path)  # refresh so a concurrent gc's grace period covers the new reference
+    else:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(raw)
+        os.replace(tmp, path)
+        profile_count("bytes_written", len(raw))
+    return digest
+
+
+def put_blob(text, min_bytes=BLOB_MIN_BYTES):
+    """Store text as content-addressed chunks. Returns the reference dict."""
+    digests = [_put_chunk(chunk.encode()) for chunk in _blob_chunks(text, min_bytes)]
+    return {"$blob": digests, "bytes": len(text.encode())}
+
+
+def get_blob(ref):
+    """Text for a blob reference (a marker for any chunk that has gone missing)."""
+    parts = []
+    for digest in ref["$blob"]:
+        try:
+            raw = _blob_path(digest).read_bytes()
+        except OSError:
+            parts.append(f"[missing blob {digest}]")
+            continue
+        profile_count("bytes_read", len(raw))
+        parts.append(raw.decode())
+    return "".join(parts)
+
+
+def externalize_blobs(data, min_bytes=None):
+    """Copy of data with large strings replaced by blob references. Returns (data, set of digests)."""
+    min_bytes = _blob_min_bytes() if min_bytes is None else min_bytes
+    hashes = set()
+
+    def walk(value, key=None):
+        if isinstance(value, str):
+            if min_bytes and key not in BLOB_INLINE_KEYS and len(value) >= min_bytes:
+                ref = put_blob(value, min_bytes)
+                hashes.update(ref["$blob"])
+                return ref
+            return value
+        if _is_blob_ref(value):
+            hashes.update(value["$blob"])
+            return value
+        if isinstance(value, dict):
+            return {k: walk(v, k) for k, v in value.items()}
+        if isinstance(value, list):
+            return [walk(v, key) for v in value]
+        return value
+
+    return walk(data), hashes
+
+
+def resolve_blobs(data):
+    """Replace blob references with their text (only those present in data)."""
+    if _is_blob_ref(data):
+        return get_blob(data)
+    if isinstance(data, dict):
+        return {k: resolve_blobs(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [resolve_blobs(v) for v in data]
+    return data
+
+
+def _read_blob_refs():
+    try:
+        refs = json.loads(BLOB_REFS.read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+    return refs if isinstance(refs, dict) and isinstance(refs.get("sessions"), dict) else None
+
+
+def _update_blob_refs(owner, hashes):
+    """Record which blobs a session references (rewritten only when the set changes)."""
+    if not hashes and not BLOB_REFS.exists():
+        return
+    try:
+        with locked_json_update(BLOB_REFS, "blob_refs") as refs:
+            if not isinstance(refs.get("sessions"), dict):
+                refs["sessions"] = {}
+            if hashes:
+                refs["sessions"][owner] = sorted(hashes)
+            else:
+                refs["sessions"].pop(owner, None)
+    except OSError:
+        pass
+
+
+def _scan_blob_refs():
+    """Rebuild the reference table from the session files themselves."""
+    sessions = {}
+    for f in session_files():
+        try:
+            _, hashes = externalize_blobs(read_session(f), min_bytes=0)
+        except (OSError, json.JSONDecodeError):
+            continue
+        if hashes:
+            sessions[_blob_owner(f)] = sorted(hashes)
+    return {"sessions": sessions}
+
+
+def _blob_files():
+    return [p for p in BLOBS_DIR.glob("??/*.txt")] if BLOBS_DIR.exists() else []
+
+
+def _blob_counts(refs):
+    counts = {}
+    for hashes in refs["sessions"].values():
+        for digest in hashes:
+            counts[digest] = counts.get(digest, 0) + 1
+    return counts
+
+
+def _blobs_stats_logic():
+    """Blob store size, reference counts and the space saved by sharing."""
+    refs = _read_blob_refs() or _scan_blob_refs()
+    counts = _blob_counts(refs)
+    blobs = unreferenced = total = logical = 0
+    for path in _blob_files():
+        size = path.stat().st_size
+        blobs += 1
+        total += size
+        refcount = counts.get(path.stem, 0)
+        unreferenced += refcount == 0
+        logical += size * refcount
+    return {
+        "blobs": blobs,
+        "bytes": total,
+        "unreferenced": unreferenced,
+        "sessions": len(refs["sessions"]),
+        "shared_bytes_saved": max(0, logical - total),
+        "min_bytes": _blob_min_bytes(),
+    }
+
+
+def _blobs_gc_logic(dry_run=False, rebuild=False):
+    """Drop references from deleted sessions, then delete blobs nothing references."""
+    with locked_json_update(BLOB_REFS, "blob_refs", write=not dry_run) as refs:
+        if rebuild or not isinstance(refs.get("sessions"), dict):
+            refs.clear()
+            refs.update(_scan_blob_refs())  # no table (or asked to rebuild): never gc blind
+        live = {_blob_owner(f) for f in session_files()}
+        dropped = sorted(owner for owner in refs["sessions"] if owner not in live)
+        for owner in dropped:
+            del refs["sessions"][owner]
+        counts = _blob_counts(refs)
+
+        removed, freed = [], 0
+        cutoff = time.time() - BLOB_GC_GRACE
+        for path in _blob_files():
+            st = path.stat()
+            if counts.get(path.stem) or st.st_mtime > cutoff:
+                continue
+            removed.append(path.stem)
+            freed += st.st_size
+            if not dry_run:
+                path.unlink(missing_ok=True)
+    return {"removed": len(removed), "bytes_freed": freed, "dropped_sessions": dropped,
+            "referenced": len(counts), "dry_run": dry_run}
+
+
+def upgrade_session(data):
+    """Bring session data to the current schema. A no-op for current-version files."""
+    if data.get("schema_version") == SCHEMA_VERSION:
+        return data
+    data = normalize_legacy_keys(data)
+    data["schema_version"] = SCHEMA_VERSION
+    return data
+
+
+def read_session(path):
+    """Read a session file at the current schema. Every reader but migrate-schema goes through here."""
+    return upgrade_session(read_session_file(path))
+
+
 def normalize_legacy_keys(data):
     """Normalize session data in-memory: legacy keys, field names, response formats."""
     # Normalize personas dict
@@ -380,56 +921,588 @@ def normalize_legacy_keys(data):
     return data
 
 
-def load_session(session_id):
-    """Load a session by ID, searching for matching file. Normalizes schema on read."""
+# Lowercase Crockford base32 (no i, l, o, u) for the sortable ID suffix
+ID_ALPHABET = "0123456789abcdefghjkmnpqrstvwxyz"
+
+
+def _base32(value, width):
+    """Encode a non-negative int as fixed-width Crockford base32."""
+    chars = []
+    for _ in range(width):
+        value, rem = divmod(value, 32)
+        chars.append(ID_ALPHABET[rem])
+    return "".join(reversed(chars))
+
+
+def new_session_id(now, slug):
+    """Time-sortable unique session ID: YYYY-MM-DD-HH-MM-<ms><random>-slug.
+
+    The readable minute prefix is kept; 4 base32 chars of milliseconds within
+    the minute keep IDs sortable, and 6 random chars (30 bits) keep councils
+    started in the same millisecond on the same topic apart.
+    """
+    ms = now.second * 1000 + now.microsecond // 1000
+    suffix = _base32(ms, 4) + _base32(random.getrandbits(30), 6)
+    return f"{now:%Y-%m-%d-%H-%M}-{suffix}-{slug or 'session'}"
+
+
+def session_path(session_id):
+    """Sharded file path for a session: SESSIONS_DIR/YYYY/MM/<id>.json (from the ID's date prefix)."""
+    m = re.match(r"(\d{4})-(\d{2})-\d{2}-", session_id)
+    if not m:
+        return SESSIONS_DIR / f"{session_id}.json"
+    return SESSIONS_DIR / m.group(1) / m.group(2) / f"{session_id}.json"
+
+
+def session_files():
+    """All session JSON files in the store (sharded, plus legacy flat files)."""
+    return [*SESSIONS_DIR.glob("*/*/*.json"), *SESSIONS_DIR.glob("*.json")]
+
+
+def load_session(session_id, resolve=True):
+    """Load a session by ID. Upgrades legacy schemas on read (current-version files skip it).
+
+    Checks the sharded path derived from the ID, then the legacy flat path.
+    Sharded files are always named after their ID, so a miss only scans the
+    legacy flat files (whose names may not match their ID).
+    With resolve=False, blob references are left for the caller to resolve.
+    """
+    finish = resolve_blobs if resolve else (lambda d: d)
+    for f in (session_path(session_id), SESSIONS_DIR / f"{session_id}.json"):
+        if f.exists():
+            try:
+                data = read_session(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+            if data.get("id", f.stem) == session_id:
+                return finish(data), f
     for f in SESSIONS_DIR.glob("*.json"):
         try:
-            data = json.loads(f.read_text())
-            if data.get("id") == session_id:
-                return normalize_legacy_keys(data), f
-        except (json.JSONDecodeError, KeyError):
+            data = read_session(f)
+        except (OSError, json.JSONDecodeError):
             continue
+        if data.get("id") == session_id:
+            return finish(data), f
     return None, None
 
 
+def _migrate_layout_logic():
+    """Move flat session files into the YYYY/MM shards. Returns dict with 'moved', 'skipped', 'errors'."""
+    moved, skipped, errors = [], 0, []
+    for f in SESSIONS_DIR.glob("*.json"):
+        try:
+            session_id = json.loads(f.read_text()).get("id") or f.stem
+        except (OSError, json.JSONDecodeError) as e:
+            errors.append({"file": str(f), "error": str(e)})
+            continue
+        target = session_path(session_id)
+        if target == f:
+            skipped += 1
+            continue
+        if target.exists():
+            errors.append({"file": str(f), "error": f"target exists: {target}"})
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(f, target)
+        moved.append({"id": session_id, "file": str(target)})
+    return {"moved": moved, "skipped": skipped, "errors": errors, "count": len(moved)}
+
+
+def _migrate_schema_logic():
+    """Rewrite every session file still on a legacy schema. Returns dict with 'upgraded', 'current', 'errors'."""
+    upgraded, current, errors = [], 0, []
+    for f in session_files():
+        try:
+            with session_lock(f):
+                data = read_session_file(f)
+                if data.get("schema_version") == SCHEMA_VERSION:
+                    current += 1
+                    continue
+                data = upgrade_session(data)
+                write_session_file(f, data)
+        except (OSError, json.JSONDecodeError) as e:
+            errors.append({"file": str(f), "error": str(e)})
+            continue
+        upgraded.append({"id": data.get("id", f.stem), "file": str(f)})
+    return {"upgraded": upgraded, "current": current, "errors": errors, "count": len(upgraded)}
+
+
+def _session_summary(data, f):
+    """The metadata list/historian need from a session."""
+    return {
+        "id": data.get("id", f.stem),
+        "type": data.get("type", "council"),
+        "date": data.get("date", "unknown"),
+        "topic": data.get("topic", "unknown"),
+        "question": data.get("question", ""),
+        "rounds": len(data.get("rounds", [])),
+        "archived": data.get("archived", False),
+        "rating": data.get("rating"),
+        "outcome": data.get("outcome"),
+        "file": str(f),
+    }
+
+
+def _load_session_index():
+    try:
+        return json.loads(SESSION_INDEX.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _save_session_index(index):
+    try:
+        tmp = SESSION_INDEX.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(index))
+        os.replace(tmp, SESSION_INDEX)
+    except OSError:
+        pass
+
+
+def iter_sessions():
+    """Yield session summaries one at a time, most recent first.
+
+    Summaries come from the session index (keyed by path, mtime and size), so
+    only new or modified files are read; the index is rewritten if anything
+    changed.
+    """
+    index = _load_session_index()
+    fresh = {}
+    changed = False
+    for f in sorted(session_files(), key=lambda f: f.name, reverse=True):
+        path = str(f)
+        try:
+            st = f.stat()
+        except OSError:
+            continue
+        entry = index.get(path)
+        if entry and entry["mtime"] == st.st_mtime and entry["size"] == st.st_size:
+            telemetry_count("council_cache_requests_total", {"cache": "session_index", "result": "hit"})
+            fresh[path] = entry
+            yield entry["summary"]
+            continue
+        try:
+            summary = _session_summary(read_session(f), f)
+        except (json.JSONDecodeError, KeyError):
+            continue
+        telemetry_count("council_cache_requests_total", {"cache": "session_index", "result": "miss"})
+        fresh[path] = {"mtime": st.st_mtime, "size": st.st_size, "summary": summary}
+        changed = True
+        yield summary
+    if changed or len(fresh) != len(index):
+        _save_session_index(fresh)
+
+
 def list_sessions():
     """List all sessions sorted by date (most recent first)."""
-    sessions = []
-    for f in sorted(SESSIONS_DIR.glob("*.json"), reverse=True):
+    return list(iter_sessions())
+
+
+def parse_rounds_spec(spec, total):
+    """Resolve a --rounds spec ('all', 'last:N', 'N' or 'N-M', 1-based) to round numbers."""
+    if spec in (None, "all"):
+        return list(range(1, total + 1))
+    m = re.fullmatch(r"last:(\d+)", spec)
+    if m:
+        n = int(m.group(1))
+        return list(range(max(1, total - n + 1), total + 1)) if n else []
+    m = re.fullmatch(r"(\d+)(?:-(\d+))?", spec)
+    if m:
+        first = int(m.group(1))
+        last = int(m.group(2) or first)
+        return [n for n in range(first, last + 1) if 1 <= n <= total]
+    raise ValueError(f"invalid --rounds spec: {spec} (use all, last:N, N or N-M)")
+
+
+def project_session(data, fields=None, rounds=None):
+    """Project a session down to the requested fields and rounds.
+
+    `fields` is a comma-separated list of top-level keys; `rounds.X` selects
+    keys inside each round (the round number is always kept).
+    """
+    total = len(data.get("rounds", []))
+    wanted = set(parse_rounds_spec(rounds, total))
+    selected = [r for i, r in enumerate(data.get("rounds", []), 1) if r.get("round", i) in wanted]
+
+    if not fields:
+        return {**data, "rounds": selected} if rounds else data
+
+    names = [f.strip() for f in fields.split(",") if f.strip()]
+    top = [f for f in names if not f.startswith("rounds.")]
+    round_keys = [f.split(".", 1)[1] for f in names if f.startswith("rounds.")]
+    projected = {k: data[k] for k in top if k in data and k != "rounds"}
+    if "rounds" in top:
+        projected["rounds"] = selected
+    elif round_keys:
+        projected["rounds"] = [
+            {"round": r.get("round"), **{k: r[k] for k in round_keys if k in r}} for r in selected
+        ]
+    return projected
+
+
+def normalize_persona_name(name):
+    """Index key for a persona name or alias: lowercase, single-spaced, no leading 'the'."""
+    key = " ".join(name.lower().split())
+    return key[4:] if key.startswith("the ") else key
+
+
+def _persona_catalog_files():
+    """User/team catalog files: PERSONAS_DIR/*.json, then each COUNCIL_PERSONA_PATH entry (dir or file)."""
+    entries = [str(PERSONAS_DIR)] + [p for p in os.environ.get("COUNCIL_PERSONA_PATH", "").split(os.pathsep) if p]
+    files = []
+    for entry in entries:
+        path = Path(entry).expanduser()
+        if path.is_dir():
+            files.extend(sorted(path.glob("*.json")))
+        elif path.is_file():
+            files.append(path)
+    return files
+
+
+def _string_list(value):
+    """value as a list of strings (a lone string becomes a one-item list), or None if it isn't one."""
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list) and all(isinstance(v, str) for v in value):
+        return list(value)
+    return None
+
+
+def _compile_persona_catalog(files):
+    """Merge the built-in catalog with user catalog files into a lookup-ready structure.
+
+    A catalog file looks like:
+        {"personas": {"The Security Reviewer": {"description": "...", "type": "specialist",
+                                                "aliases": ["secrev"]}},
+         "topics": {"security": ["The Contrarian", "The Risk Analyst", "The Security Reviewer"]},
+         "topic_keywords": {"security": ["auth", "vulnerability"]}}
+    Later files override earlier ones (and the built-ins) by normalized name.
+    """
+    personas = {name: dict(data) for name, data in ALL_PERSONAS.items()}
+    topics = {topic: list(names) for topic, names in TOPIC_TO_PERSONAS.items()}
+    topic_keywords = {topic: list(kws) for topic, kws in TOPIC_KEYWORDS.items()}
+    index = {normalize_persona_name(name): name for name in personas}
+    errors = []
+
+    for f in files:
         try:
-            data = json.loads(f.read_text())
-            sessions.append({
-                "id": data.get("id", f.stem),
-                "type": data.get("type", "council"),
-                "date": data.get("date", "unknown"),
-                "topic": data.get("topic", "unknown"),
-                "question": data.get("question", ""),
-                "rounds": len(data.get("rounds", [])),
-                "archived": data.get("archived", False),
-                "rating": data.get("rating"),
-                "outcome": data.get("outcome"),
-                "file": str(f),
-            })
-        except (json.JSONDecodeError, KeyError):
+            catalog = json.loads(f.read_text())
+        except (OSError, json.JSONDecodeError) as e:
+            errors.append(f"{f}: {e}")
             continue
-    return sessions
+        if not isinstance(catalog, dict):
+            errors.append(f"{f}: must be a JSON object")
+            continue
+        sections = {}
+        for section in ("personas", "topics", "topic_keywords"):
+            sections[section] = catalog.get(section) or {}
+            if not isinstance(sections[section], dict):
+                errors.append(f"{f}: {section} must be an object")
+                sections[section] = {}
+        for name, data in sections["personas"].items():
+            if not isinstance(data, dict) or not data.get("description") or not isinstance(data["description"], str):
+                errors.append(f"{f}: persona {name!r} has no description")
+                continue
+            aliases = _string_list(data.get("aliases") or [])  # "aliases": "secrev" is one alias
+            if aliases is None:
+                errors.append(f"{f}: persona {name!r} aliases must be strings")
+                continue
+            key = normalize_persona_name(name)
+            old = index.get(key)
+            if old and old != name:
+                personas.pop(old, None)
+            personas[name] = {"type": "specialist", **data, "aliases": aliases, "source": str(f)}
+            index[key] = name
+            for alias in aliases:
+                index[normalize_persona_name(alias)] = name
+        for topic, names in sections["topics"].items():
+            names = _string_list(names)
+            if names is None:
+                errors.append(f"{f}: topic {topic!r} must list persona names")
+                continue
+            topics[topic] = names
+        for topic, kws in sections["topic_keywords"].items():
+            kws = _string_list(kws)
+            if kws is None:
+                errors.append(f"{f}: topic_keywords {topic!r} must list strings")
+                continue
+            topic_keywords.setdefault(topic, []).extend(kw for kw in kws if kw not in topic_keywords[topic])
+
+    # Aliases can't shadow a real persona name, and topics resolve to canonical names
+    for name in personas:
+        index[normalize_persona_name(name)] = name
+    for topic, names in topics.items():
+        topics[topic] = [index.get(normalize_persona_name(n), n) for n in names]
+
+    return {"personas": personas, "index": index, "topics": topics,
+            "topic_keywords": topic_keywords, "errors": errors}
+
+
+_PERSONA_CATALOG = {}
+# Part of the PERSONA_CACHE key: bump when _compile_persona_catalog's output
+# or the built-in personas/topics change, so stale compiled catalogs are dropped.
+PERSONA_CATALOG_SCHEMA = 2
+
+
+def persona_catalog():
+    """The merged persona catalog, compiled once per process.
+
+    With no user catalogs this is just the built-ins. Otherwise the compiled
+    result is cached in PERSONA_CACHE, keyed by each file's path, mtime and
+    size, so large team catalogs are only re-merged when they change. The
+    files are globbed and stat'ed on the first lookup only.
+    """
+    if "catalog" in _PERSONA_CATALOG:
+        return _PERSONA_CATALOG["catalog"]
+    files, stamp = [], []
+    for f in _persona_catalog_files():
+        try:
+            st = f.stat()
+        except OSError:
+            continue
+        files.append(f)
+        stamp.append([str(f), st.st_mtime, st.st_size])
+
+    catalog = None
+    if files:
+        try:
+            cached = json.loads(PERSONA_CACHE.read_text())
+            if cached.get("stamp") == stamp and cached.get("schema") == PERSONA_CATALOG_SCHEMA:
+                catalog = cached["catalog"]
+        except (OSError, json.JSONDecodeError, KeyError):
+            pass
+    if files:
+        telemetry_count("council_cache_requests_total",
+                        {"cache": "persona_catalog", "result": "miss" if catalog is None else "hit"})
+    if catalog is None:
+        catalog = _compile_persona_catalog(files)
+        if files:
+            try:
+                atomic_write_text(PERSONA_CACHE, json.dumps({"stamp": stamp, "schema": PERSONA_CATALOG_SCHEMA, "catalog": catalog}))
+            except OSError:
+                pass
+    _PERSONA_CATALOG["catalog"] = catalog
+    return catalog
 
 
 def lookup_persona(name):
-    """Look up a persona by name (case-insensitive, with or without 'The ')."""
-    # Try exact match first
-    if name in ALL_PERSONAS:
-        return name, ALL_PERSONAS[name]
-    # Try with "The " prefix
-    with_the = f"The {name}"
-    if with_the in ALL_PERSONAS:
-        return with_the, ALL_PERSONAS[with_the]
-    # Case-insensitive search
-    lower = name.lower().strip()
-    for pname, pdata in ALL_PERSONAS.items():
-        if pname.lower() == lower or pname.lower().replace("the ", "") == lower:
-            return pname, pdata
-    return None, None
+    """Look up a persona by name or alias (case-insensitive, with or without 'The ')."""
+    catalog = persona_catalog()
+    pname = catalog["index"].get(normalize_persona_name(name))
+    if pname is None:
+        return None, None
+    return pname, catalog["personas"][pname]
+
+
+# ---------------------------------------------------------------------------
+# Response digesting (local pre-digest for the synthesis prompt)
+# ---------------------------------------------------------------------------
+
+CLAIM_TAGS = ("ANCHORED", "INFERRED", "SPECULATIVE")
+CLAIM_TAG_RE = re.compile(r"\[(ANCHORED|INFERRED|SPECULATIVE)\]", re.IGNORECASE)
+RECOMMENDATION_RE = re.compile(r"RECOMMENDATION:\s*(.+)", re.IGNORECASE)
+DEFAULT_DIGEST_TOKENS = 1200
+CHARS_PER_TOKEN = 4
+
+
+def split_sentences(text):
+    """Split advisor text into sentences (line breaks and bullets count as boundaries)."""
+    parts = re.split(r"(?<=[.!?])\s+|\n+", text)
+    return [p.strip(" -*\t") for p in parts if p.strip(" -*\t")]
+
+
+def extract_recommendation(text):
+    """Return the final 'RECOMMENDATION: ...' sentence, or None."""
+    matches = RECOMMENDATION_RE.findall(text)
+    return f"RECOMMENDATION: {matches[-1].strip()}" if matches else None
+
+
+def extract_claims(text):
+    """Return [{'tag', 'text'}] for every sentence carrying a claim tag (tag stripped from the text)."""
+    claims = []
+    for sentence in split_sentences(text):
+        if RECOMMENDATION_RE.search(sentence):
+            continue
+        for tag in CLAIM_TAG_RE.findall(sentence):
+            claims.append({
+                "tag": tag.upper(),
+                "text": re.sub(r"\s+([.,;:!?])", r"\1", CLAIM_TAG_RE.sub("", sentence)).strip(" :-—"),
+            })
+    return claims
+
+
+def _analyze_response(text):
+    """Parse an advisor response: claim-tag counts and ratios, claims, recommendation, format flags."""
+    counts = {tag.lower(): 0 for tag in CLAIM_TAGS}
+    for tag in CLAIM_TAG_RE.findall(text):
+        counts[tag.lower()] += 1
+    total = sum(counts.values())
+    recommendation = extract_recommendation(text)
+
+    missing = []
+    if not total:
+        missing.append("claim_tags")
+    if not recommendation:
+        missing.append("recommendation")
+
+    return {
+        "tags": counts,
+        "tagged_claims": total,
+        "ratios": {tag: round(n / total, 3) if total else 0 for tag, n in counts.items()},
+        "claims": extract_claims(text),
+        "recommendation": recommendation,
+        "missing": missing,
+        "words": len(text.split()),
+    }
+
+
+def _analysis_block(analysis, headers):
+    """Render per-seat analysis as a compact pre-audit block for the synthesis prompt."""
+    lines = []
+    totals = {tag.lower(): 0 for tag in CLAIM_TAGS}
+    for agent, header in headers.items():
+        a = analysis.get(agent)
+        if not a:
+            continue
+        for tag, n in a["tags"].items():
+            totals[tag] += n
+        line = (f"- {header}: {a['tags']['anchored']} anchored / {a['tags']['inferred']} inferred / "
+                f"{a['tags']['speculative']} speculative")
+        if a["tagged_claims"]:
+            line += f" ({round(a['ratios']['speculative'] * 100)}% speculative)"
+        if a["missing"]:
+            line += f" — missing: {', '.join(a['missing'])}"
+        lines.append(line)
+        speculative = [c["text"] for c in a["claims"] if c["tag"] == "SPECULATIVE"]
+        if speculative:
+            lines.append(f"  Speculative claims: {' | '.join(speculative[:3])}")
+
+    total = sum(totals.values())
+    share = round(totals["speculative"] / total * 100) if total else 0
+    lines.append(f"- Council overall: {total} tagged claims, {share}% speculative")
+    return "\n".join(lines)
+
+
+# ---------------------------------------------------------------------------
+# Position drift (follow-up rounds vs the previous round)
+# ---------------------------------------------------------------------------
+
+DRIFT_RECOMMENDATION_OVERLAP = 0.5  # recommendation-line keyword overlap below this = changed recommendation
+DRIFT_REFINED_SIMILARITY = 0.3  # whole-response keyword overlap below this = substantially rewritten
+DRIFT_TAG_SHIFT = 0.25  # a claim-tag ratio moving this much = evidence mix changed
+
+
+def _keyword_jaccard(a, b):
+    sa, sb = extract_keywords(a or ""), extract_keywords(b or "")
+    union = sa | sb
+    return round(len(sa & sb) / len(union), 3) if union else 1.0
+
+
+def _position_drift(previous_round, responses, analysis):
+    """Per-seat movement since the previous round: held, refined or shifted.
+
+    Compares each seat's RECOMMENDATION line, its whole response (keyword
+    Jaccard) and its claim-tag mix with the same seat one round earlier.
+    """
+    prev_analysis = previous_round.get("analysis") or {}
+    seats = {}
+    for seat, text in responses.items():
+        prev_text = previous_round.get(seat)
+        if not isinstance(prev_text, str) or not prev_text or not text:
+            continue
+        prev = prev_analysis.get(seat) or _analyze_response(prev_text)
+        cur = analysis.get(seat) or _analyze_response(text)
+        overlap = _keyword_jaccard(prev["recommendation"], cur["recommendation"])
+        changed = bool(prev["recommendation"] and cur["recommendation"]) and overlap < DRIFT_RECOMMENDATION_OVERLAP
+        similarity = _keyword_jaccard(prev_text, text)
+        tag_shift = {tag: round(cur["ratios"][tag] - prev["ratios"][tag], 3) for tag in cur["ratios"]}
+        if changed:
+            status = "shifted"
+        elif similarity < DRIFT_REFINED_SIMILARITY or max(abs(v) for v in tag_shift.values()) >= DRIFT_TAG_SHIFT:
+            status = "refined"
+        else:
+            status = "held"
+        entry = {"status": status, "recommendation_changed": changed, "recommendation_overlap": overlap,
+                 "similarity": similarity, "tag_shift": tag_shift}
+        if changed:
+            entry["previous_recommendation"] = prev["recommendation"]
+            entry["recommendation"] = cur["recommendation"]
+        seats[seat] = entry
+    return {
+        "from_round": previous_round.get("round"),
+        "seats": seats,
+        "shifted": sorted(seat for seat, d in seats.items() if d["status"] == "shifted"),
+    }
+
+
+def _drift_block(drift, headers):
+    """Render position drift as a compact delta block for the synthesis prompt."""
+    lines = []
+    for agent, header in headers.items():
+        d = drift["seats"].get(agent)
+        if not d:
+            continue
+        moved = [f"{tag} {'+' if v > 0 else ''}{round(v * 100)}pts" for tag, v in d["tag_shift"].items() if abs(v) >= 0.1]
+        detail = f"similarity to last round {d['similarity']}" + (f"; {', '.join(moved)}" if moved else "")
+        if d["status"] == "shifted":
+            lines.append(f"- {header}: SHIFTED ({detail})\n  Was: {d['previous_recommendation']}\n  Now: {d['recommendation']}")
+        else:
+            lines.append(f"- {header}: {d['status']} ({detail})")
+    return "\n".join(lines)
+
+
+def _digest_response(text, budget_chars, question_keywords):
+    """Compress one response to its recommendation, tagged claims and top sentences within budget."""
+    recommendation = extract_recommendation(text)
+    sentences = [s for s in split_sentences(text) if not RECOMMENDATION_RE.search(s)]
+
+    # Score untagged sentences by keyword density, boosting overlap with the question
+    freq = {}
+    for word in extract_keywords(text):
+        freq[word] = len(re.findall(rf"\b{re.escape(word)}\b", text.lower()))
+
+    def score(sentence):
+        words = extract_keywords(sentence)
+        if not words:
+            return 0
+        return sum(freq.get(w, 0) + (2 if w in question_keywords else 0) for w in words) / len(words)
+
+    tagged = [i for i, s in enumerate(sentences) if CLAIM_TAG_RE.search(s)]
+    ranked = sorted((i for i in range(len(sentences)) if i not in tagged),
+                    key=lambda i: score(sentences[i]), reverse=True)
+
+    used = len(recommendation or "")
+    keep = set()
+    for i in tagged + ranked:
+        if used + len(sentences[i]) + 1 > budget_chars:
+            continue
+        keep.add(i)
+        used += len(sentences[i]) + 1
+
+    lines = [sentences[i] for i in sorted(keep)]
+    if recommendation:
+        lines.append(recommendation)
+    return " ".join(lines)
+
+
+def _digest_responses(texts, question, budget_tokens=DEFAULT_DIGEST_TOKENS):
+    """Digest each agent's text within an overall token budget. Returns (digests, stats)."""
+    per_seat_chars = max(1, budget_tokens * CHARS_PER_TOKEN // max(1, len(texts)))
+    question_keywords = extract_keywords(question)
+    digests, per_seat = {}, {}
+    for agent, text in texts.items():
+        digest = text if len(text) <= per_seat_chars else _digest_response(text, per_seat_chars, question_keywords)
+        digests[agent] = digest
+        per_seat[agent] = {"original_chars": len(text), "digest_chars": len(digest)}
+    original = sum(v["original_chars"] for v in per_seat.values())
+    digested = sum(v["digest_chars"] for v in per_seat.values())
+    return digests, {
+        "budget_tokens": budget_tokens,
+        "original_chars": original,
+        "digest_chars": digested,
+        "reduction": round(1 - digested / original, 3) if original else 0,
+        "per_seat": per_seat,
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -438,11 +1511,13 @@ def lookup_persona(name):
 
 def _historian_logic(question):
     """Find past sessions related to a question. Returns dict with 'related' and 'query_keywords'."""
+    start = time.perf_counter()
     question_keywords = extract_keywords(question)
     if not question_keywords:
         return {"related": [], "query_keywords": [], "message": "no keywords extracted from question"}
 
     sessions = list_sessions()
+    profile_count("sessions_scored", len(sessions))
     scored = []
     for s in sessions:
         session_text = f"{s['topic']} {s['question']}"
@@ -483,12 +1558,15 @@ def _historian_logic(question):
     scored.sort(key=lambda x: x["relevance_score"], reverse=True)
     related = [s for s in scored if s["relevance_score"] > 0.05][:3]
 
+    telemetry_observe("council_historian_lookup_seconds", time.perf_counter() - start, HISTORIAN_BUCKETS)
     return {"related": related, "query_keywords": sorted(question_keywords)}
 
 
 def _assign_logic(question, topic=None, personas_str=None, fun=False, seats=3):
     """Assign personas to agents. Returns dict with 'assignment', 'personas', 'agents', 'fun_applied'."""
     question_lower = question.lower()
+    catalog = persona_catalog()
+    detected_topic = topic if topic in catalog["topics"] else None
 
     if personas_str:
         names = [n.strip() for n in personas_str.split(",")]
@@ -499,28 +1577,28 @@ def _assign_logic(question, topic=None, personas_str=None, fun=False, seats=3):
                 personas.append(pname)
             else:
                 return {"error": f"unknown persona: {n}"}
-    elif topic and topic in TOPIC_TO_PERSONAS:
-        personas = list(TOPIC_TO_PERSONAS[topic])
+    elif topic and topic in catalog["topics"]:
+        personas = list(catalog["topics"][topic])
     else:
         scores = {}
-        for category, keywords in TOPIC_KEYWORDS.items():
+        for category, keywords in catalog["topic_keywords"].items():
             score = sum(1 for kw in keywords if kw in question_lower)
             if score > 0:
                 scores[category] = score
         detected_topic = max(scores, key=scores.get) if scores else "architecture"
-        personas = list(TOPIC_TO_PERSONAS.get(detected_topic, TOPIC_TO_PERSONAS["architecture"]))
+        personas = list(catalog["topics"].get(detected_topic, catalog["topics"]["architecture"]))
 
     if len(personas) > seats:
         personas = personas[:seats]
     while len(personas) < seats:
-        available = [p for p in SPECIALIST_PERSONAS if p not in personas]
+        available = [p for p, d in catalog["personas"].items() if d.get("type") == "specialist" and p not in personas]
         if available:
             personas.append(random.choice(available))
         else:
             break
 
     if fun:
-        fun_persona = random.choice(list(FUN_PERSONAS.keys()))
+        fun_persona = random.choice([p for p, d in catalog["personas"].items() if d.get("type") == "fun"])
         replaceable = [i for i, p in enumerate(personas) if p != "The Contrarian"]
         if replaceable:
             idx = random.choice(replaceable)
@@ -532,7 +1610,7 @@ def _assign_logic(question, topic=None, personas_str=None, fun=False, seats=3):
         pname = personas[i] if i < len(personas) else personas[-1]
         assignment[agent] = {
             "persona": pname,
-            "description": ALL_PERSONAS.get(pname, {}).get("description", ""),
+            "description": catalog["personas"].get(pname, {}).get("description", ""),
         }
 
     return {
@@ -540,17 +1618,100 @@ def _assign_logic(question, topic=None, personas_str=None, fun=False, seats=3):
         "personas": personas,
         "agents": agents,
         "fun_applied": fun,
+        "topic": detected_topic,
     }
 
 
-def _prompt_logic(persona_name, question, prior_context=None, context=None, grounding_facts=None):
-    """Build an agent prompt for a new session. Returns dict with 'prompt' and 'persona'."""
+PROMPT_LAYOUTS = ("classic", "cache")
+
+
+def _prompt_layout(requested=None):
+    """Prompt layout from the flag, else COUNCIL_PROMPT_LAYOUT, else classic."""
+    layout = requested or os.environ.get("COUNCIL_PROMPT_LAYOUT") or "classic"
+    return layout if layout in PROMPT_LAYOUTS else "classic"
+
+
+def _cache_prompt_prefix(question, prior_context=None, context=None, grounding_facts=None):
+    """The seat-independent head of a cache-layout prompt: instructions, tagging rules, context, question.
+
+    Identical for every seat (and every round of a session), so providers
+    that cache prompt prefixes can reuse it; only the persona block differs.
+    """
+    prior_block = f"\n{prior_context}\n" if prior_context else ""
+    grounding_block = ""
+    if grounding_facts:
+        today = datetime.now().strftime("%Y-%m-%d")
+        grounding_block = f"\nGROUNDING FACTS (verified by the mediator — treat as authoritative, do not contradict):\n{grounding_facts}\nDo not speculate about these topics — the facts above are current as of {today}.\n"
+    context_block = f"\nCONTEXT:\n{context}\n" if context else ""
+
+    return f"""You are one member of a council of AI advisors being consulted on a question. Each advisor plays an assigned role, given at the end of this prompt.
+Be specific and opinionated — don't hedge. If you disagree with conventional wisdom, say so.
+
+Respond concisely (under 500 words). Focus on your strongest recommendation and key reasoning, filtered through your assigned role.
+
+For each key claim, tag it with one of:
+- [ANCHORED] — based on specific data, evidence, or established fact
+- [INFERRED] — logical deduction from known information
+- [SPECULATIVE] — opinion, gut feel, or hypothesis without direct evidence
+
+End your response with a single sentence starting with "RECOMMENDATION: I recommend..." that captures your core advice.
+{prior_block}{grounding_block}{context_block}
+QUESTION:
+{question}
+"""
+
+
+def _cache_persona_block(pname, desc):
+    return f"""
+YOUR ROLE: You are playing **{pname}** — {desc}
+Stay in character. Let this perspective shape your analysis, priorities, and recommendations."""
+
+
+def _cache_followup_block(previous_position, other_positions, mediator_synthesis, user_followup):
+    """Round-specific tail appended after the seat's round-1 prompt, keeping the whole round-1 prompt as prefix."""
+    mediator = f"\nTHE MEDIATOR SAID: {mediator_synthesis}\n" if mediator_synthesis else ""
+    return f"""
+
+FOLLOW-UP — the discussion continues.
+
+YOUR PREVIOUS POSITION: {previous_position}
+
+THE OTHER ADVISORS SAID:
+{other_positions}
+{mediator}
+THE USER NOW SAYS: {user_followup}
+
+Respond to the user's follow-up. You may revise your position if the user raises a good point, or defend it if you still disagree. Stay in character and concise (under 300 words).
+
+Tag key claims as [ANCHORED], [INFERRED], or [SPECULATIVE].
+
+End with a single sentence starting with "RECOMMENDATION: I recommend..." that captures your updated core advice."""
+
+
+def _prefix_report(prompts):
+    """Per-seat size and hash of the prefix shared by every seat's prompt."""
+    shared = os.path.commonprefix(list(prompts.values())) if prompts else ""
+    digest = hashlib.sha256(shared.encode()).hexdigest()[:16]
+    return {seat: {"prompt_chars": len(prompt), "shared_prefix_chars": len(shared), "shared_prefix_hash": digest}
+            for seat, prompt in prompts.items()}
+
+
+def _prompt_logic(persona_name, question, prior_context=None, context=None, grounding_facts=None, layout="classic"):
+    """Build an agent prompt for a new session. Returns dict with 'prompt' and 'persona'.
+
+    layout="cache" puts everything shared by the seats first and the persona
+    last (see _cache_prompt_prefix); "classic" is the original role-first layout.
+    """
     pname, pdata = lookup_persona(persona_name)
     if not pname:
         return {"error": f"unknown persona: {persona_name}"}
 
     desc = pdata["description"]
 
+    if layout == "cache":
+        prefix = _cache_prompt_prefix(question, prior_context, context, grounding_facts)
+        return {"prompt": prefix + _cache_persona_block(pname, desc), "persona": pname, "prefix": prefix}
+
     prior_block = ""
     if prior_context:
         prior_block = f"\n{prior_context}\n"
@@ -585,14 +1746,13 @@ End your response with a single sentence starting with "RECOMMENDATION: I recomm
     return {"prompt": prompt.strip(), "persona": pname}
 
 
-def _session_create_logic(question, topic=None, personas_json_str=None, labels_json_str=None, prior_context=None):
+def _session_create_logic(question, topic=None, personas_json_str=None, labels_json_str=None, prior_context=None,
+                          prompt_layout=None, prompt_prefix=None):
     """Create a new session. Returns dict with 'id', 'file', 'session'."""
     ensure_dirs()
     now = datetime.now()
     topic_val = topic or question[:50]
     slug = slugify(topic_val)
-    session_id = now.strftime(f"%Y-%m-%d-%H-%M-{slug}")
-    filename = f"{session_id}.json"
 
     try:
         personas = json.loads(personas_json_str) if personas_json_str else {}
@@ -605,7 +1765,7 @@ def _session_create_logic(question, topic=None, personas_json_str=None, labels_j
         return {"error": "invalid JSON for labels"}
 
     session = {
-        "id": session_id,
+        "id": None,
         "topic": topic_val,
         "question": question,
         "date": now.strftime("%Y-%m-%d"),
@@ -614,11 +1774,31 @@ def _session_create_logic(question, topic=None, personas_json_str=None, labels_j
         "prior_context": prior_context,
         "rounds": [],
         "archived": False,
+        "schema_version": SCHEMA_VERSION,
     }
-
-    filepath = SESSIONS_DIR / filename
-    filepath.write_text(json.dumps(session, indent=2))
-    return {"id": session_id, "file": str(filepath), "session": session}
+    if prompt_layout == "cache":
+        # Follow-up prompts start with this exact text so every round shares the prefix
+        session["prompt_layout"] = prompt_layout
+        session["prompt_prefix"] = prompt_prefix
+
+    # Claim the file exclusively so a colliding ID can never overwrite another session
+    for _ in range(5):
+        session["id"] = new_session_id(now, slug)
+        filepath = session_path(session["id"])
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with open(filepath, "x"):
+                pass
+        except FileExistsError:
+            continue
+        try:
+            write_session_file(filepath, session)
+        except BaseException:
+            filepath.unlink(missing_ok=True)  # an empty claimed file would block this ID for good
+            raise
+        telemetry_count("council_councils_total")
+        return {"id": session["id"], "file": str(filepath), "session": session}
+    return {"error": "could not allocate a unique session ID"}
 
 
 def _similarity_logic(responses):
@@ -662,8 +1842,9 @@ def _similarity_logic(responses):
 
 
 def _synthesis_prompt_logic(responses, question, personas_json_str=None, labels_json_str=None,
-                            prior_context=None, agent_status=None, mode=None, compact=False):
-    """Build a synthesis prompt from agent responses. Returns dict with 'prompt'."""
+                            prior_context=None, agent_status=None, mode=None, compact=False,
+                            synthesis_input="full", digest_tokens=DEFAULT_DIGEST_TOKENS, analysis=None, drift=None):
+    """Build a synthesis prompt from agent responses. Returns dict with 'prompt' (and 'digest' stats in digest mode)."""
     # Normalize legacy keys
     for old, new in LEGACY_KEY_MAP.items():
         if old in responses and new not in responses:
@@ -682,6 +1863,16 @@ def _synthesis_prompt_logic(responses, question, personas_json_str=None, labels_
     label_values = [labels_map.get(a, "") for a in AGENT_ORDER if a in responses]
     all_same_label = len(set(label_values)) <= 1 and all(label_values)
 
+    texts = {}
+    for agent in AGENT_ORDER:
+        if agent in responses:
+            resp = responses[agent]
+            texts[agent] = resp.get("response", "") if isinstance(resp, dict) else str(resp)
+
+    digest_stats = None
+    if synthesis_input == "digest":
+        texts, digest_stats = _digest_responses(texts, question, budget_tokens=digest_tokens)
+
     responses_block = ""
     advisor_headers = []
     for agent in AGENT_ORDER:
@@ -689,10 +1880,9 @@ def _synthesis_prompt_logic(responses, question, personas_json_str=None, labels_
             resp = responses[agent]
             if isinstance(resp, dict):
                 persona = resp.get("persona", personas_map.get(agent, "Unknown"))
-                text = resp.get("response", "")
             else:
                 persona = personas_map.get(agent, "Unknown")
-                text = str(resp)
+            text = texts[agent]
             label = labels_map.get(agent, agent)
             if all_same_label:
                 header = f"**{persona}**"
@@ -723,20 +1913,38 @@ def _synthesis_prompt_logic(responses, question, personas_json_str=None, labels_
     matrix_positions = " | ".join("[2-5 word position]" for _ in advisor_headers)
 
     status_line = ""
+    if agent_status in ("cache", "cached"):
+        agent_status = _agent_status_logic()
     if agent_status:
         try:
             agent_status_obj = json.loads(agent_status) if isinstance(agent_status, str) else agent_status
             status_parts = []
-            for cli in ["codex", "gemini", "claude"]:
-                if cli in agent_status_obj.get("agents", {}):
-                    info = agent_status_obj["agents"][cli]
-                    status_parts.append(f"{info['label'].split(' ')[0]} {'OK' if info['available'] else 'Missing'}")
+            for cli, info in agent_status_obj.get("agents", {}).items():
+                if cli in BUILTIN_ADAPTERS or info["available"]:
+                    state = "OK" if info["available"] else "Missing"
+                    if info["available"] and info.get("breaker", "closed") != "closed":
+                        state = f"Breaker {info['breaker']}"
+                    status_parts.append(f"{info['label'].split(' ')[0]} {state}")
             cli_helper = "Active" if agent_status_obj.get("cli_helper_active", True) else "Inactive"
             mode_val = mode or "parallel"
             status_line = f"\n*Agents: {', '.join(status_parts)} | CLI Helper: {cli_helper} | Mode: {mode_val}*"
         except (json.JSONDecodeError, KeyError):
             pass
 
+    analysis_block = ""
+    audit_instruction = "[If any consensus point rests primarily on [SPECULATIVE] claims from multiple advisors, flag it. If all key claims are anchored or inferred, write \"All key claims grounded.\" 1-2 sentences.]"
+    if analysis:
+        headers = {agent: h[0] for agent, h in zip([a for a in AGENT_ORDER if a in responses], advisor_headers)}
+        analysis_block = f"\nEVIDENCE PRE-AUDIT (claim tags parsed locally — use these counts instead of re-counting):\n{_analysis_block(analysis, headers)}\n"
+        audit_instruction = "[Use the EVIDENCE PRE-AUDIT above. If any consensus point rests primarily on the listed speculative claims, flag it; note any advisor missing tags or a RECOMMENDATION. Otherwise write \"All key claims grounded.\" 1-2 sentences.]"
+
+    drift_block = ""
+    if drift and drift.get("seats"):
+        headers = {agent: h[0] for agent, h in zip([a for a in AGENT_ORDER if a in responses], advisor_headers)}
+        drift_block = (f"\nPOSITION DRIFT SINCE ROUND {drift['from_round']} (computed locally — use this instead of re-reading "
+                       f"earlier rounds; in each advisor summary, say whether they held, refined or shifted their position):\n"
+                       f"{_drift_block(drift, headers)}\n")
+
     tip = random.choice(TIPS)
 
     full_format = f"""Produce a briefing in this EXACT format:
@@ -748,7 +1956,7 @@ def _synthesis_prompt_logic(responses, question, personas_json_str=None, labels_
 
 {advisor_lines}
 
-**Evidence Audit:** [If any consensus point rests primarily on [SPECULATIVE] claims from multiple advisors, flag it. If all key claims are anchored or inferred, write "All key claims grounded." 1-2 sentences.]
+**Evidence Audit:** {audit_instruction}
 
 **What To Do Next:**
 - [ ] [Concrete action item starting with a verb — the single most important next step]
@@ -793,27 +2001,60 @@ Then output a compact version of the briefing in this EXACT format:
 
 > Say "show full brief" or use `--full` for per-advisor positions, disagreement matrix, and evidence audit."""
 
+    responses_heading = "AGENT RESPONSES:"
+    if digest_stats:
+        responses_heading = "AGENT RESPONSES (digested locally — recommendation, tagged claims and key sentences; full text is saved in the session):"
+
     prompt = f"""You are the neutral mediator for a council of AI advisors. Synthesize their responses.
 
 QUESTION: {question}
 {prior_line}
-AGENT RESPONSES:
+{responses_heading}
 {responses_block}
-
+{analysis_block}{drift_block}
 {full_format}{compact_block}"""
 
-    return {"prompt": prompt.strip()}
+    result = {"prompt": prompt.strip()}
+    if digest_stats:
+        result["digest"] = digest_stats
+    return result
+
+
+def _session_update_logic(session_id, update):
+    """Apply update(data) to a session under its lock, re-reading it first. Returns the data, or None if missing.
+
+    Quorum stragglers write late arrivals into the session from detached
+    processes, so every read-modify-write of a session goes through here.
+    """
+    data, filepath = load_session(session_id, resolve=False)
+    if not data:
+        return None
+    with session_lock(filepath):
+        data, filepath = load_session(session_id)
+        if not data:
+            return None
+        update(data)
+        write_session_file(filepath, data)
+    return data
 
 
 def _session_append_logic(session_id, round_data):
     """Append round data to a session. Returns dict with 'id', 'round', 'session'."""
-    data, filepath = load_session(session_id)
+    with profile_stage("session_load"):
+        data, filepath = load_session(session_id, resolve=False)
     if not data:
         return {"error": f"session not found: {session_id}"}
 
-    round_data["round"] = len(data.get("rounds", [])) + 1
-    data.setdefault("rounds", []).append(round_data)
-    filepath.write_text(json.dumps(data, indent=2))
+    with session_lock(filepath):
+        data, filepath = load_session(session_id)  # re-read: a late arrival may have landed meanwhile
+        if not data:
+            return {"error": f"session not found: {session_id}"}
+        round_data["round"] = len(data.get("rounds", [])) + 1
+        data.setdefault("rounds", []).append(round_data)
+        _merge_late_arrivals(data)
+        with profile_stage("session_write"):
+            write_session_file(filepath, data)
+    telemetry_count("council_rounds_total")
     return {"id": session_id, "round": round_data["round"], "session": data}
 
 
@@ -884,8 +2125,9 @@ def cmd_parse(args):
 def cmd_topic(args):
     """Classify the topic of a question."""
     question = args.question.lower()
+    catalog = persona_catalog()
     scores = {}
-    for category, keywords in TOPIC_KEYWORDS.items():
+    for category, keywords in catalog["topic_keywords"].items():
         score = sum(1 for kw in keywords if kw in question)
         if score > 0:
             scores[category] = score
@@ -898,7 +2140,7 @@ def cmd_topic(args):
     emit({
         "topic": topic,
         "scores": scores,
-        "personas": TOPIC_TO_PERSONAS.get(topic, TOPIC_TO_PERSONAS["architecture"]),
+        "personas": catalog["topics"].get(topic, catalog["topics"]["architecture"]),
     })
 
 
@@ -934,6 +2176,23 @@ def cmd_prompt(args):
         mediator_synthesis = args.mediator_synthesis or ""
         user_followup = args.user_followup or ""
 
+        session = None
+        if args.session_id:
+            session, _ = load_session(args.session_id)
+            if not session:
+                err(f"session not found: {args.session_id}")
+        layout = _prompt_layout(args.layout or (session or {}).get("prompt_layout"))
+        if layout == "cache":
+            # Round-1 prompt verbatim, then the round's material: every round shares its prefix
+            prefix = (session or {}).get("prompt_prefix") or _cache_prompt_prefix(
+                args.question, args.prior_context, args.context, args.grounding_facts)
+            prompt = prefix + _cache_persona_block(pname, desc) + _cache_followup_block(
+                args.previous_position, other_positions, mediator_synthesis, user_followup)
+            emit({"prompt": prompt, "persona": pname, "layout": layout,
+                  "shared_prefix_chars": len(prefix),
+                  "shared_prefix_hash": hashlib.sha256(prefix.encode()).hexdigest()[:16]})
+            return
+
         prompt = f"""You are a member of a council of AI advisors in an ongoing discussion.
 
 YOUR ROLE: You are playing **{pname}** — {desc}
@@ -959,9 +2218,10 @@ End with a single sentence starting with "RECOMMENDATION: I recommend..." that c
         emit({"prompt": prompt.strip(), "persona": pname})
     else:
         # New session prompt
-        result = _prompt_logic(args.persona, args.question, prior_context=args.prior_context, context=args.context, grounding_facts=getattr(args, 'grounding_facts', None))
+        result = _prompt_logic(args.persona, args.question, prior_context=args.prior_context, context=args.context, grounding_facts=getattr(args, 'grounding_facts', None), layout=_prompt_layout(args.layout))
         if "error" in result:
             err(result["error"])
+        result.pop("prefix", None)
         emit(result)
 
 
@@ -984,10 +2244,144 @@ def cmd_synthesis_prompt(args):
         agent_status=args.agent_status,
         mode=args.mode,
         compact=args.compact,
+        synthesis_input=args.synthesis_input,
+        digest_tokens=args.digest_tokens,
     )
     emit(result)
 
 
+# ---------------------------------------------------------------------------
+# Archive (Markdown export to ARCHIVE_DIR)
+# ---------------------------------------------------------------------------
+
+ARCHIVE_MARKER = "<!-- council-session: {id} -->"
+
+
+def _advisor_keys(rnd):
+    """Advisor keys present in a round, in seat order (advisor_1, advisor_2, ..., advisor_10)."""
+    keys = [k for k in rnd if re.fullmatch(r"advisor_\d+", k)]
+    return sorted(keys, key=lambda k: int(k.split("_")[1]))
+
+
+def _advisor_display_names(session):
+    """Display name per advisor, following the briefing's Labeling Logic."""
+    personas = session.get("personas", {})
+    labels = session.get("labels") or {}
+    label_values = [labels.get(a, "") for a in personas]
+    all_same_label = len(set(label_values)) <= 1
+    names = {}
+    for agent, persona in personas.items():
+        label = labels.get(agent, "")
+        if label and not all_same_label:
+            names[agent] = f"{label} as {persona}"
+        else:
+            names[agent] = persona or agent.replace("_", " ").title()
+    return names
+
+
+def _render_archive(session):
+    """Yield the Markdown archive for a session, chunk by chunk."""
+    names = _advisor_display_names(session)
+    rounds = session.get("rounds", [])
+
+    yield ARCHIVE_MARKER.format(id=session.get("id", "")) + "\n"
+    yield f"# Council Session: {session.get('topic', 'Untitled')}\n\n"
+    yield f"**Date:** {session.get('date', 'unknown')}  \n"
+    if session.get("type"):
+        yield f"**Type:** {session['type']}  \n"
+    if names:
+        yield f"**Personas:** {', '.join(names.values())}  \n"
+    yield f"**Rounds:** {len(rounds)}\n\n"
+    yield f"## Question\n\n{session.get('question', '')}\n\n"
+
+    if session.get("prior_context"):
+        yield f"## Prior Context\n\n{session['prior_context']}\n\n"
+
+    for rnd in rounds:
+        yield f"## Round {rnd.get('round', '?')}\n\n"
+        if rnd.get("user_followup"):
+            yield f"**User follow-up:** {rnd['user_followup']}\n\n"
+        yield "### Briefing\n\n"
+        yield f"{rnd.get('synthesis') or '*No synthesis recorded for this round.*'}\n\n"
+        advisors = _advisor_keys(rnd)
+        if advisors:
+            yield "### Advisor Responses\n\n"
+        for agent in advisors:
+            yield f"#### {names.get(agent, agent.replace('_', ' ').title())}\n\n"
+            yield f"{rnd[agent]}\n\n"
+
+    outcome = session.get("outcome")
+    if session.get("rating") or isinstance(outcome, dict):
+        yield "## Follow-Through\n\n"
+        if session.get("rating"):
+            yield f"**Rating:** {session['rating']}/5  \n"
+        if isinstance(outcome, dict):
+            yield f"**Outcome:** {outcome.get('status', 'unknown')} ({outcome.get('date', '')}) — {outcome.get('note', '')}\n"
+
+
+def _archive_target(session, archive_dir):
+    """Pick the archive path: YYYY-MM-DD-slug.md, or the session ID if another session owns that name.
+
+    A free dated name is claimed with an exclusive create (holding just the
+    marker line), so two sessions archived at once can't both pick it.
+    """
+    slug = slugify(session.get("topic") or session.get("question", "")[:50]) or "session"
+    path = archive_dir / f"{session.get('date', 'undated')}-{slug}.md"
+    marker = ARCHIVE_MARKER.format(id=session.get("id", ""))
+    try:
+        with open(path, "x") as fh:
+            fh.write(marker + "\n")
+        return path
+    except FileExistsError:
+        pass
+    with open(path) as fh:
+        owner = fh.readline().strip()
+    if owner != marker:
+        path = archive_dir / f"{session.get('id', slug)}.md"
+    return path
+
+
+def _archive_session_file(session_file, archive_dir=None):
+    """Render one session file to Markdown and mark it archived. Returns a result dict."""
+    archive_dir = archive_dir or ARCHIVE_DIR
+    try:
+        data = resolve_blobs(read_session(session_file))
+    except (OSError, json.JSONDecodeError) as e:
+        return {"file": str(session_file), "error": str(e)}
+
+    tmp = None
+    try:
+        target = _archive_target(data, archive_dir)
+        tmp = _tmp_path(target)
+        with open(tmp, "w") as fh:
+            for chunk in _render_archive(data):
+                fh.write(chunk)
+        os.replace(tmp, target)
+
+        # Re-read under the lock: a late arrival may have landed while we rendered
+        with session_lock(session_file):
+            data = read_session(session_file)
+            data["archived"] = True
+            data["archive_file"] = str(target)
+            write_session_file(session_file, data)
+    except (OSError, json.JSONDecodeError) as e:
+        if tmp:
+            tmp.unlink(missing_ok=True)
+        return {"file": str(session_file), "error": str(e)}
+    return {"id": data.get("id"), "archive_file": str(target)}
+
+
+def _archive_logic(session_files, archive_dir=None, workers=8):
+    """Archive many sessions concurrently. Returns dict with 'archived', 'errors', 'count'."""
+    archive_dir = archive_dir or ARCHIVE_DIR
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    archived, errors = [], []
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(session_files)))) as pool:
+        for result in pool.map(lambda f: _archive_session_file(f, archive_dir), session_files):
+            (errors if "error" in result else archived).append(result)
+    return {"archived": archived, "errors": errors, "count": len(archived)}
+
+
 # ---------------------------------------------------------------------------
 # Subcommand: session
 # ---------------------------------------------------------------------------
@@ -1000,65 +2394,45 @@ def cmd_session(args):
     if action == "create":
         if not args.question:
             err("--question required for session create")
-        now = datetime.now()
-        topic = args.topic or args.question[:50]
-        slug = slugify(topic)
-        session_id = now.strftime(f"%Y-%m-%d-%H-%M-{slug}")
-        filename = f"{session_id}.json"
-
-        try:
-            personas = json.loads(args.personas_json) if args.personas_json else {}
-        except json.JSONDecodeError:
-            err("invalid JSON for --personas")
-
-        try:
-            labels = json.loads(args.labels_json) if args.labels_json else {}
-        except json.JSONDecodeError:
-            err("invalid JSON for --labels")
-
-        session = {
-            "id": session_id,
-            "topic": topic,
-            "question": args.question,
-            "date": now.strftime("%Y-%m-%d"),
-            "personas": personas,
-            "labels": labels,
-            "prior_context": args.prior_context,
-            "rounds": [],
-            "archived": False,
-        }
-
-        filepath = SESSIONS_DIR / filename
-        filepath.write_text(json.dumps(session, indent=2))
-        emit({"id": session_id, "file": str(filepath), "session": session})
+        result = _session_create_logic(
+            args.question,
+            topic=args.topic,
+            personas_json_str=args.personas_json,
+            labels_json_str=args.labels_json,
+            prior_context=args.prior_context,
+        )
+        if "error" in result:
+            err(result["error"])
+        emit({"id": result["id"], "file": result["file"]})
 
     elif action == "load":
         if not args.id:
             err("--id required for session load")
-        data, filepath = load_session(args.id)
+        data, filepath = load_session(args.id, resolve=False)
         if not data:
             err(f"session not found: {args.id}")
-        emit({"session": data, "file": str(filepath)})
+        try:
+            data = project_session(data, fields=args.fields, rounds=args.rounds)
+        except ValueError as e:
+            err(str(e))
+        # Only the blobs that survived the projection are read
+        emit({"session": resolve_blobs(data), "file": str(filepath)})
 
     elif action == "append":
         if not args.id:
             err("--id required for session append")
-        data, filepath = load_session(args.id)
-        if not data:
-            err(f"session not found: {args.id}")
-
-        if args.stdin:
-            round_data = read_stdin_json()
-        else:
+        if not args.stdin:
             err("--stdin required: pipe round data as JSON")
-
-        # Assign round number
-        round_data["round"] = len(data.get("rounds", [])) + 1
-        data.setdefault("rounds", []).append(round_data)
-        filepath.write_text(json.dumps(data, indent=2))
-        emit({"id": args.id, "round": round_data["round"], "session": data})
+        result = _session_append_logic(args.id, read_stdin_json())
+        if "error" in result:
+            err(result["error"])
+        emit({"id": args.id, "round": result["round"], "rounds": len(result["session"]["rounds"])})
 
     elif action == "list":
+        if args.ndjson:
+            for summary in iter_sessions():
+                emit_line(summary)
+            return
         sessions = list_sessions()
         emit({"sessions": sessions, "count": len(sessions)})
 
@@ -1067,11 +2441,8 @@ def cmd_session(args):
             err("--id required for session rate")
         if args.rating is None:
             err("--rating required (1-5)")
-        data, filepath = load_session(args.id)
-        if not data:
+        if not _session_update_logic(args.id, lambda data: data.update(rating=args.rating)):
             err(f"session not found: {args.id}")
-        data["rating"] = args.rating
-        filepath.write_text(json.dumps(data, indent=2))
         emit({"id": args.id, "rating": args.rating})
 
     elif action == "outcome":
@@ -1079,16 +2450,38 @@ def cmd_session(args):
             err("--id required for session outcome")
         if not args.status:
             err("--status required")
-        data, filepath = load_session(args.id)
-        if not data:
-            err(f"session not found: {args.id}")
-        data["outcome"] = {
+        outcome = {
             "status": args.status,
             "note": args.note or "",
             "date": datetime.now().strftime("%Y-%m-%d"),
         }
-        filepath.write_text(json.dumps(data, indent=2))
-        emit({"id": args.id, "outcome": data["outcome"]})
+        if not _session_update_logic(args.id, lambda data: data.update(outcome=outcome)):
+            err(f"session not found: {args.id}")
+        emit({"id": args.id, "outcome": outcome})
+
+    elif action == "migrate":
+        layout = _migrate_layout_logic()
+        emit({"layout": layout, "schema": _migrate_schema_logic(), "schema_version": SCHEMA_VERSION})
+
+    elif action == "archive":
+        if args.all_unarchived:
+            files = [Path(s["file"]) for s in list_sessions() if not s["archived"]]
+        elif args.id:
+            _, filepath = load_session(args.id)
+            if not filepath:
+                err(f"session not found: {args.id}")
+            files = [filepath]
+        else:
+            err("--id or --all-unarchived required for session archive")
+        emit(_archive_logic(files))
+
+    elif action == "late":
+        if not args.id:
+            err("--id required for session late")
+        result = _session_late_logic(args.id, resynthesize=args.resynthesize)
+        if "error" in result:
+            err(result["error"])
+        emit(result)
 
     else:
         err(f"unknown session action: {action}")
@@ -1103,6 +2496,161 @@ def cmd_historian(args):
     emit(_historian_logic(args.question))
 
 
+# ---------------------------------------------------------------------------
+# Subcommand: search (SQLite FTS5 index over session text)
+# ---------------------------------------------------------------------------
+
+SEARCH_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime REAL,
+    size INTEGER,
+    session_id TEXT,
+    topic TEXT,
+    date TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS docs USING fts5(
+    text,
+    session_id UNINDEXED,
+    round UNINDEXED,
+    seat UNINDEXED,
+    field UNINDEXED,
+    path UNINDEXED,
+    tokenize = 'porter unicode61'
+);
+"""
+
+
+def _search_connect():
+    """Open (and create if needed) the search index."""
+    COUNCIL_DIR.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(SEARCH_DB)
+    try:
+        conn.executescript(SEARCH_SCHEMA)
+    except sqlite3.OperationalError as e:
+        conn.close()
+        err(f"search index unavailable (SQLite FTS5 required): {e}")
+    return conn
+
+
+def _search_rows(data):
+    """Yield (text, round, seat, field) rows for every searchable piece of a session."""
+    topic, question = data.get("topic", ""), data.get("question", "")
+    yield question if topic in question else f"{topic}\n{question}", None, None, "question"
+    for rnd in data.get("rounds", []):
+        num = rnd.get("round")
+        if rnd.get("user_followup"):
+            yield rnd["user_followup"], num, None, "followup"
+        for agent in _advisor_keys(rnd):
+            if rnd[agent]:
+                yield str(rnd[agent]), num, agent, "response"
+        if rnd.get("synthesis"):
+            yield rnd["synthesis"], num, None, "synthesis"
+    outcome = data.get("outcome")
+    if isinstance(outcome, dict) and outcome.get("note"):
+        yield outcome["note"], None, None, "outcome"
+
+
+def _search_refresh(conn):
+    """Re-index new or modified session files and drop deleted ones. Returns counts."""
+    indexed = {path: (mtime, size) for path, mtime, size in conn.execute("SELECT path, mtime, size FROM files")}
+    seen = set()
+    updated = 0
+    with conn:
+        for f in session_files():
+            path = str(f)
+            seen.add(path)
+            try:
+                st = f.stat()
+            except OSError:
+                continue
+            if indexed.get(path) == (st.st_mtime, st.st_size):
+                continue
+            try:
+                data = resolve_blobs(read_session(f))
+            except (OSError, json.JSONDecodeError):
+                continue
+            session_id = data.get("id", f.stem)
+            conn.execute("DELETE FROM docs WHERE path = ?", (path,))
+            conn.executemany(
+                "INSERT INTO docs (text, session_id, round, seat, field, path) VALUES (?, ?, ?, ?, ?, ?)",
+                [(text, session_id, rnd, seat, field, path) for text, rnd, seat, field in _search_rows(data)],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO files (path, mtime, size, session_id, topic, date) VALUES (?, ?, ?, ?, ?, ?)",
+                (path, st.st_mtime, st.st_size, session_id, data.get("topic", ""), data.get("date", "")),
+            )
+            updated += 1
+
+        removed = [path for path in indexed if path not in seen]
+        for path in removed:
+            conn.execute("DELETE FROM docs WHERE path = ?", (path,))
+            conn.execute("DELETE FROM files WHERE path = ?", (path,))
+    return {"updated": updated, "removed": len(removed)}
+
+
+def _search_refresh_all():
+    """Bring the search index up to date. Returns counts."""
+    conn = _search_connect()
+    try:
+        return _search_refresh(conn)
+    finally:
+        conn.close()
+
+
+def _search_logic(query, limit=10, match_any=False):
+    """Ranked full-text search over questions, responses, syntheses and outcome notes."""
+    terms = re.findall(r"\w+", query.lower())
+    if not terms:
+        return {"error": "no searchable terms in query"}
+    fts_query = (" OR " if match_any else " ").join(f'"{t}"' for t in terms)
+
+    start = time.perf_counter()
+    conn = _search_connect()
+    try:
+        refreshed = _search_refresh(conn)
+        rows = conn.execute(
+            """
+            SELECT d.session_id, d.round, d.seat, d.field,
+                   snippet(docs, 0, '**', '**', '…', 16), bm25(docs), f.topic, f.date
+            FROM docs d JOIN files f ON f.path = d.path
+            WHERE docs MATCH ?
+            ORDER BY bm25(docs)
+            LIMIT ?
+            """,
+            (fts_query, limit),
+        ).fetchall()
+    finally:
+        conn.close()
+
+    hits = [{
+        "session_id": session_id,
+        "round": rnd,
+        "seat": seat,
+        "field": field,
+        "snippet": snippet,
+        "score": round(-score, 3),
+        "topic": topic,
+        "date": date,
+    } for session_id, rnd, seat, field, snippet, score, topic, date in rows]
+
+    return {
+        "query": query,
+        "hits": hits,
+        "count": len(hits),
+        "index": refreshed,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 2),
+    }
+
+
+def cmd_search(args):
+    """Full-text search across every session's question, responses, syntheses and outcomes."""
+    result = _search_logic(args.query, limit=args.limit, match_any=args.any)
+    if "error" in result:
+        err(result["error"])
+    emit(result)
+
+
 # ---------------------------------------------------------------------------
 # Subcommand: similarity
 # ---------------------------------------------------------------------------
@@ -1121,87 +2669,330 @@ def cmd_similarity(args):
 # Subcommand: agents (fast PATH check)
 # ---------------------------------------------------------------------------
 
-AGENT_CLIS = {
-    "codex": {"label": "Codex (OpenAI)", "install": "npm install -g @openai/codex"},
-    "gemini": {"label": "Gemini (Google)", "install": "npm install -g @google/gemini-cli"},
-    "claude": {"label": "Claude (Anthropic)", "install": "https://docs.anthropic.com/en/docs/claude-code"},
+# Built-in provider adapters. "command" mirrors the Agent Configuration table
+# in SKILL.md: "{prompt}" is replaced with the prompt text, "{prompt_file}"
+# with the path of a temp file holding it; prompt_via "stdin" pipes it
+# instead. User adapters in config.json "adapters" take the same fields.
+BUILTIN_ADAPTERS = {
+    "codex": {
+        "label": "Codex (OpenAI)",
+        "install": "npm install -g @openai/codex",
+        "command": ["codex", "exec", "--skip-git-repo-check", "-"],
+        "prompt_via": "stdin",
+    },
+    "gemini": {
+        "label": "Gemini (Google)",
+        "install": "npm install -g @google/gemini-cli",
+        "command": ["gemini", "-p", "{prompt}", "-o", "text"],
+        "prompt_via": "arg",
+    },
+    "claude": {
+        "label": "Claude (Anthropic)",
+        "install": "https://docs.anthropic.com/en/docs/claude-code",
+        "command": ["claude", "-p", "{prompt}", "--no-session-persistence"],
+        "prompt_via": "arg",
+    },
 }
+PROMPT_VIAS = ("stdin", "arg", "file")
+OUTPUT_FORMATS = ("text", "json")
+
+_ADAPTERS = None
+
+
+def _normalize_adapter(name, spec, builtin=False):
+    """Validate one adapter spec and fill in defaults. Raises ValueError on a bad spec."""
+    if not isinstance(spec, dict):
+        raise ValueError("must be an object")
+    command = spec.get("command")
+    if isinstance(command, str):
+        command = shlex.split(command)
+    if not isinstance(command, list) or not command or not all(isinstance(p, str) for p in command):
+        raise ValueError("command must be a non-empty list of strings (or a shell-style string)")
+    prompt_via = spec.get("prompt_via") or (
+        "file" if any("{prompt_file}" in p for p in command) else "arg" if any("{prompt}" in p for p in command) else "stdin")
+    if prompt_via not in PROMPT_VIAS:
+        raise ValueError(f"prompt_via must be one of {', '.join(PROMPT_VIAS)}")
+    placeholder = {"arg": "{prompt}", "file": "{prompt_file}"}.get(prompt_via)
+    if placeholder and not any(placeholder in p for p in command):
+        raise ValueError(f"prompt_via {prompt_via} needs a {placeholder} placeholder in command")
+    output = spec.get("output", "text")
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(f"output must be one of {', '.join(OUTPUT_FORMATS)}")
+    version_args = spec.get("version_args", ["--version"])
+    if isinstance(version_args, str):
+        version_args = shlex.split(version_args)
+    for key in ("timeout", "max_concurrent"):
+        value = spec.get(key)
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0):
+            raise ValueError(f"{key} must be a positive number")
+    return {
+        "label": spec.get("label") or name,
+        "install": spec.get("install", ""),
+        "command": command,
+        "prompt_via": prompt_via,
+        "binary": spec.get("binary") or command[0],
+        "version_args": list(version_args),
+        "timeout": spec.get("timeout"),
+        "max_concurrent": int(spec["max_concurrent"]) if spec.get("max_concurrent") else None,
+        "output": output,
+        "output_field": spec.get("output_field", "response"),
+        "builtin": builtin,
+        # Breaker substitution only moves seats onto user adapters that opt in
+        "substitute": spec.get("substitute", builtin),
+    }
 
 
-def cmd_agents(args):
-    """Fast check: which agent CLIs are on PATH (shutil.which only)."""
+def _load_adapters(config=None):
+    """Built-ins overlaid with config.json "adapters". Returns (adapters, errors).
+
+    A config entry named like a built-in is merged over it (e.g. just a
+    longer timeout for gemini); any other name defines a new adapter. Bad
+    entries are left out and reported by name.
+    """
+    config = config if config is not None else load_config()
+    user = config.get("adapters") or {}
+    if not isinstance(user, dict):
+        return {name: _normalize_adapter(name, spec, True) for name, spec in BUILTIN_ADAPTERS.items()}, {
+            "adapters": "must be an object keyed by adapter name"}
+    adapters, errors = {}, {}
+    for name in list(BUILTIN_ADAPTERS) + [n for n in user if n not in BUILTIN_ADAPTERS]:
+        builtin = name in BUILTIN_ADAPTERS
+        spec = user.get(name)
+        if builtin and isinstance(spec, dict):
+            spec = {**BUILTIN_ADAPTERS[name], **spec}
+        elif builtin:
+            spec = BUILTIN_ADAPTERS[name]
+        if not re.fullmatch(r"[a-z0-9][a-z0-9_-]*", name):
+            errors[name] = "name must be lowercase letters, digits, '-' or '_'"
+            continue
+        try:
+            adapters[name] = _normalize_adapter(name, spec, builtin)
+        except ValueError as e:
+            errors[name] = str(e)
+            if builtin:
+                adapters[name] = _normalize_adapter(name, BUILTIN_ADAPTERS[name], True)
+    return adapters, errors
+
+
+def provider_adapters():
+    """The adapter registry (built-ins plus config.json "adapters"), loaded once per process."""
+    global _ADAPTERS
+    if _ADAPTERS is None:
+        _ADAPTERS = _load_adapters()
+    return _ADAPTERS[0]
+
+
+def adapter_errors():
+    """Config adapters that failed validation, name -> reason."""
+    provider_adapters()
+    return _ADAPTERS[1]
+
+
+HEALTH_TTL = 6 * 3600  # seconds; override with COUNCIL_HEALTH_TTL
+
+
+def _binary_mtime(path):
+    """mtime of an agent binary (following symlinks), or None."""
+    try:
+        return os.stat(path).st_mtime if path else None
+    except OSError:
+        return None
+
+
+def _read_health_cache():
+    """Return the cached agent health if still valid, else None.
+
+    Valid means: younger than the TTL, recorded under the same PATH, and every
+    recorded binary still has the mtime it had when probed (so upgrades and
+    uninstalls invalidate it). Costs a few stat() calls — no process spawns.
+    """
+    try:
+        cache = json.loads(HEALTH_CACHE.read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+    try:
+        ttl = float(os.environ.get("COUNCIL_HEALTH_TTL", HEALTH_TTL))
+    except ValueError:
+        ttl = HEALTH_TTL
+    if time.time() - cache.get("checked_at", 0) > ttl:
+        return None
+    if cache.get("path_env") != os.environ.get("PATH", ""):
+        return None
+    adapters = provider_adapters()
+    if set(cache.get("agents", {})) != set(adapters):
+        return None
+    if any(info.get("binary", cli) != adapters[cli]["binary"] for cli, info in cache["agents"].items()):
+        return None
+    for info in cache["agents"].values():
+        if info.get("path") and _binary_mtime(info["path"]) != info.get("mtime"):
+            return None
+    return cache
+
+
+def _write_health_cache(agents, python=None):
+    """Persist agent health (and python info, if probed) for later fast reads."""
+    cache = {
+        "checked_at": time.time(),
+        "path_env": os.environ.get("PATH", ""),
+        "agents": {cli: {**info, "mtime": _binary_mtime(info.get("path"))} for cli, info in agents.items()},
+    }
+    if python:
+        cache["python"] = python
+    try:
+        COUNCIL_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = HEALTH_CACHE.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(cache, indent=2))
+        os.replace(tmp, HEALTH_CACHE)
+    except OSError:
+        pass
+    return cache
+
+
+def _agent_status_logic(refresh=False):
+    """Agent availability for the detection block and briefing header.
+
+    Served from the health cache when valid; otherwise a PATH check
+    (shutil.which only) that seeds the cache.
+    """
+    cache = None if refresh else _read_health_cache()
+    source = "cache"
+    if not refresh:
+        telemetry_count("council_cache_requests_total", {"cache": "health", "result": "miss" if cache is None else "hit"})
+    if cache is None:
+        agents = {}
+        for cli, adapter in provider_adapters().items():
+            path = shutil.which(adapter["binary"])
+            agents[cli] = {"available": path is not None, "path": path, "binary": adapter["binary"]}
+        cache = _write_health_cache(agents)
+        source = "path"
+
+    breakers = breaker_states()
     agents = {}
-    for cli, info in AGENT_CLIS.items():
-        path = shutil.which(cli)
+    for cli, info in provider_adapters().items():
+        cached = cache["agents"].get(cli, {})
         agents[cli] = {
-            "available": path is not None,
-            "path": path,
+            "available": cached.get("available", False),
+            "path": cached.get("path"),
             "label": info["label"],
             "install": info["install"],
+            "breaker": breakers[cli],
         }
+        if not info["builtin"]:
+            agents[cli]["adapter"] = "config"
+        if "healthy" in cached:
+            agents[cli]["healthy"] = cached["healthy"]
+            agents[cli]["version"] = cached.get("version")
 
     available = [c for c, a in agents.items() if a["available"]]
     missing = [c for c, a in agents.items() if not a["available"]]
 
-    if len(available) == 3:
+    # The suggestion is about the default seat mapping, i.e. the built-ins
+    builtin_available = [c for c in available if c in BUILTIN_ADAPTERS]
+    if len(builtin_available) == len(BUILTIN_ADAPTERS):
         mode_suggestion = "all-3"
     elif len(available) == 0:
         mode_suggestion = "none"
-    elif available == ["claude"]:
+    elif builtin_available == ["claude"]:
         mode_suggestion = "claude-only"
     else:
         mode_suggestion = "partial"
 
-    emit({
+    output = {
         "agents": agents,
         "available": available,
         "missing": missing,
         "count": len(available),
         "mode_suggestion": mode_suggestion,
-    })
+        "source": source,
+        "checked_at": datetime.fromtimestamp(cache["checked_at"]).isoformat(timespec="seconds"),
+    }
+    if adapter_errors():
+        output["adapter_errors"] = adapter_errors()
+    return output
+
+
+def cmd_agents(args):
+    """Fast check: which agent CLIs are available (health cache, else shutil.which)."""
+    emit(_agent_status_logic(refresh=args.refresh))
 
 
 # ---------------------------------------------------------------------------
 # Subcommand: doctor (thorough health check)
 # ---------------------------------------------------------------------------
 
+def _probe_agent(cli):
+    """Run the adapter's version check (`<binary> --version` by default). Returns the doctor entry for one agent."""
+    info = provider_adapters()[cli]
+    path = shutil.which(info["binary"])
+    version = None
+    healthy = False
+    error = None
+    if path:
+        try:
+            result = subprocess.run(
+                [info["binary"], *info["version_args"]],
+                capture_output=True, text=True, timeout=10,
+            )
+            version = result.stdout.strip() or result.stderr.strip()
+            healthy = result.returncode == 0
+            if not healthy:
+                error = f"exit code {result.returncode}"
+        except subprocess.TimeoutExpired:
+            error = "timed out"
+        except FileNotFoundError:
+            error = "not found"
+        except Exception as e:
+            error = str(e)
+    else:
+        error = "not on PATH"
+
+    return {
+        "available": path is not None,
+        "healthy": healthy,
+        "path": path,
+        "binary": info["binary"],
+        "version": version,
+        "label": info["label"],
+        "install": info["install"],
+        "error": error,
+    }
+
+
+def _probe_python():
+    """Locate python3 and its version."""
+    python_path = shutil.which("python3")
+    python_version = None
+    if python_path:
+        try:
+            result = subprocess.run(
+                ["python3", "--version"],
+                capture_output=True, text=True, timeout=5,
+            )
+            python_version = result.stdout.strip()
+        except Exception:
+            pass
+    return {"path": python_path, "version": python_version}
+
+
+def _probe_all():
+    """Probe every agent CLI and python3 concurrently, refreshing the health cache."""
+    adapters = provider_adapters()
+    with ThreadPoolExecutor(max_workers=len(adapters) + 1) as pool:
+        python_future = pool.submit(_probe_python)
+        agent_futures = {cli: pool.submit(_probe_agent, cli) for cli in adapters}
+        agents = {cli: f.result() for cli, f in agent_futures.items()}
+        python = python_future.result()
+    _write_health_cache(
+        {cli: {k: a[k] for k in ("available", "healthy", "path", "binary", "version", "error")} for cli, a in agents.items()},
+        python,
+    )
+    return agents, python
+
+
 def cmd_doctor(args):
     """Thorough health check: run --version on each CLI, verify dirs, check helpers."""
-    # Agent CLI checks (actually run --version)
-    agents = {}
-    for cli, info in AGENT_CLIS.items():
-        path = shutil.which(cli)
-        version = None
-        healthy = False
-        error = None
-        if path:
-            try:
-                result = subprocess.run(
-                    [cli, "--version"],
-                    capture_output=True, text=True, timeout=10,
-                )
-                version = result.stdout.strip() or result.stderr.strip()
-                healthy = result.returncode == 0
-                if not healthy:
-                    error = f"exit code {result.returncode}"
-            except subprocess.TimeoutExpired:
-                error = "timed out"
-            except FileNotFoundError:
-                error = "not found"
-            except Exception as e:
-                error = str(e)
-        else:
-            error = "not on PATH"
-
-        agents[cli] = {
-            "available": path is not None,
-            "healthy": healthy,
-            "path": path,
-            "version": version,
-            "label": info["label"],
-            "install": info["install"],
-            "error": error,
-        }
+    # Agent CLI checks (actually run --version, all probes concurrently)
+    agents, python = _probe_all()
 
     # Directory checks
     dirs = {
@@ -1209,7 +3000,7 @@ def cmd_doctor(args):
             "path": str(SESSIONS_DIR),
             "exists": SESSIONS_DIR.exists(),
             "is_dir": SESSIONS_DIR.is_dir() if SESSIONS_DIR.exists() else False,
-            "file_count": len(list(SESSIONS_DIR.glob("*.json"))) if SESSIONS_DIR.is_dir() else 0,
+            "file_count": len(list(session_files())) if SESSIONS_DIR.is_dir() else 0,
         },
         "archive": {
             "path": str(ARCHIVE_DIR),
@@ -1235,18 +3026,7 @@ def cmd_doctor(args):
                 "is_symlink": p.is_symlink() if p.exists() else False,
             }
 
-    # Python check
-    python_path = shutil.which("python3")
-    python_version = None
-    if python_path:
-        try:
-            result = subprocess.run(
-                ["python3", "--version"],
-                capture_output=True, text=True, timeout=5,
-            )
-            python_version = result.stdout.strip()
-        except Exception:
-            pass
+    catalog = persona_catalog()
 
     available = [c for c, a in agents.items() if a["healthy"]]
     missing = [c for c, a in agents.items() if not a["available"]]
@@ -1257,10 +3037,16 @@ def cmd_doctor(args):
         "available": available,
         "missing": missing,
         "unhealthy": unhealthy,
+        "adapter_errors": adapter_errors(),
         "directories": dirs,
         "cli_helper": cli_helper,
-        "python": {"path": python_path, "version": python_version},
-        "healthy": len(unhealthy) == 0 and dirs["sessions"]["exists"] and dirs["archive"]["exists"],
+        "python": python,
+        "persona_catalog": {
+            "files": [str(f) for f in _persona_catalog_files()],
+            "personas": len(catalog["personas"]),
+            "errors": catalog["errors"],
+        },
+        "healthy": len(unhealthy) == 0 and not adapter_errors() and dirs["sessions"]["exists"] and dirs["archive"]["exists"],
     })
 
 
@@ -1273,25 +3059,512 @@ def cmd_tip(args):
     emit({"tip": random.choice(TIPS)})
 
 
+# ---------------------------------------------------------------------------
+# Subcommand: warmup (SessionStart: refresh indexes and health cache)
+# ---------------------------------------------------------------------------
+
+WARMUP_STAMP = COUNCIL_DIR / ".warmup"
+WARMUP_MIN_INTERVAL = 60  # seconds; concurrent windows starting together warm up once
+
+
+def _warmup_logic(budget_ms=15000):
+    """Refresh the agent health cache, session index and search index within a time budget.
+
+    Steps run cheapest-first; once the budget is spent the rest are skipped
+    (each step is incremental, so the next warm-up or command picks up where
+    this one stopped).
+    """
+    start = time.monotonic()
+    steps = [
+        ("health_cache", lambda: "fresh" if _read_health_cache() else _probe_all() and "probed"),
+        ("session_index", lambda: sum(1 for _ in iter_sessions())),
+        ("search_index", lambda: _search_refresh_all()),
+    ]
+    done, skipped = {}, []
+    for name, step in steps:
+        if (time.monotonic() - start) * 1000 > budget_ms:
+            skipped.append(name)
+            continue
+        step_start = time.monotonic()
+        try:
+            result = step()
+        except (Exception, SystemExit) as e:  # a failing step must never break SessionStart
+            result = {"error": str(e) or type(e).__name__}
+        done[name] = {"result": result, "elapsed_ms": int((time.monotonic() - step_start) * 1000)}
+    return {"steps": done, "skipped": skipped, "elapsed_ms": int((time.monotonic() - start) * 1000)}
+
+
+def cmd_warmup(args):
+    """Warm caches off the critical path (run in the background by the SessionStart hook)."""
+    ensure_dirs()
+    try:
+        if time.time() - WARMUP_STAMP.stat().st_mtime < WARMUP_MIN_INTERVAL and not args.force:
+            emit({"skipped": "warmed up recently"})
+            return
+    except OSError:
+        pass
+    WARMUP_STAMP.touch()
+    emit(_warmup_logic(budget_ms=args.budget_ms))
+
+
+# ---------------------------------------------------------------------------
+# Subcommand: blobs (blob store stats and garbage collection)
+# ---------------------------------------------------------------------------
+
+def cmd_blobs(args):
+    """Report on or garbage-collect the blob store."""
+    if args.blobs_action == "stats":
+        emit(_blobs_stats_logic())
+    else:
+        emit(_blobs_gc_logic(dry_run=args.dry_run, rebuild=args.rebuild))
+
+
+# ---------------------------------------------------------------------------
+# Subcommand: metrics (Prometheus / OpenMetrics exposition of the telemetry)
+# ---------------------------------------------------------------------------
+
+# name -> (type, help). Counter names keep their _total suffix here.
+METRIC_FAMILIES = {
+    "council_councils_total": ("counter", "Councils started (sessions created)."),
+    "council_rounds_total": ("counter", "Rounds appended to sessions."),
+    "council_dispatch_seconds": ("histogram", "Live advisor/synthesis CLI latency by provider and outcome."),
+    "council_dispatch_timeouts_total": ("counter", "Advisor CLI runs killed at their timeout."),
+    "council_dispatch_truncated_total": ("counter", "Advisor CLI runs returned as partial output."),
+    "council_seat_substitutions_total": ("counter", "Seats re-routed to another provider (breaker open or CLI missing)."),
+    "council_breaker_trips_total": ("counter", "Provider circuit breakers opened."),
+    "council_late_arrivals_total": ("counter", "Quorum seats that answered after dispatch returned."),
+    "council_cache_requests_total": ("counter", "Cache lookups by cache and result (hit/miss)."),
+    "council_historian_lookup_seconds": ("histogram", "Historian related-session lookup time."),
+    "council_lock_acquisitions_total": ("counter", "File locks taken, by lock (session, blob_refs, grounding, breakers)."),
+    "council_lock_wait_seconds": ("histogram", "Time spent blocked on a file lock another process held."),
+    "council_sessions": ("gauge", "Session files in the store (as of the last session index refresh)."),
+    "council_sessions_archived": ("gauge", "Sessions marked archived."),
+    "council_session_rounds": ("gauge", "Rounds across all sessions."),
+    "council_session_store_bytes": ("gauge", "Total size of the session files."),
+    "council_session_index_updated_seconds": ("gauge", "Unix time the session index was last refreshed."),
+}
+
+
+def _metric_float(value):
+    if isinstance(value, int):
+        return str(value)
+    return repr(float(value))
+
+
+def _session_store_gauges():
+    """Store size and counts from the session index, without touching the session files."""
+    index = _load_session_index()
+    summaries = [entry.get("summary", {}) for entry in index.values()]
+    gauges = {
+        "council_sessions": len(index),
+        "council_sessions_archived": sum(1 for s in summaries if s.get("archived")),
+        "council_session_rounds": sum(s.get("rounds", 0) for s in summaries),
+        "council_session_store_bytes": sum(entry.get("size", 0) for entry in index.values()),
+    }
+    try:
+        gauges["council_session_index_updated_seconds"] = SESSION_INDEX.stat().st_mtime
+    except OSError:
+        pass
+    return gauges
+
+
+def _render_metrics(stored, gauges, fmt):
+    """Render telemetry in the Prometheus text format or OpenMetrics (fmt='openmetrics')."""
+    openmetrics = fmt == "openmetrics"
+    lines = []
+    for name, (kind, help_text) in METRIC_FAMILIES.items():
+        family = name[:-len("_total")] if openmetrics and kind == "counter" else name
+        lines.append(f"# HELP {family} {help_text}")
+        lines.append(f"# TYPE {family} {kind}")
+        if kind == "counter":
+            series = stored.get("counters", {}).get(name) or {}
+            if not series and name in ("council_councils_total", "council_rounds_total"):
+                series = {"": 0}  # unlabelled counters start at zero so dashboards have a series
+            for key, value in sorted(series.items()):
+                lines.append(f"{name}{{{key}}} {value}" if key else f"{name} {value}")
+        elif kind == "gauge":
+            if name in gauges:
+                lines.append(f"{name} {_metric_float(gauges[name])}")
+        else:
+            hist = stored.get("histograms", {}).get(name)
+            if not hist:
+                continue
+            for key, entry in sorted(hist["series"].items()):
+                prefix = f"{key}," if key else ""
+                cumulative = 0
+                for bound, count in zip(hist["le"], entry["counts"]):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{{prefix}le="{_metric_float(bound)}"}} {cumulative}')
+                lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {entry["count"]}')
+                labels = f"{{{key}}}" if key else ""
+                lines.append(f"{name}_sum{labels} {_metric_float(entry['sum'])}")
+                lines.append(f"{name}_count{labels} {entry['count']}")
+    if openmetrics:
+        lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def _metrics_logic(fmt="openmetrics"):
+    """Telemetry as exposition text, or a dict for fmt='json'."""
+    stored = _read_metrics()
+    gauges = _session_store_gauges()
+    if fmt == "json":
+        return {
+            "counters": stored.get("counters", {}),
+            "histograms": stored.get("histograms", {}),
+            "gauges": gauges,
+            "since": stored.get("created_at"),
+            "updated_at": stored.get("updated_at"),
+        }
+    return _render_metrics(stored, gauges, fmt)
+
+
+def cmd_metrics(args):
+    """Expose council telemetry for Prometheus (stdout or a node_exporter textfile)."""
+    if args.textfile:
+        # node_exporter's textfile collector reads the Prometheus text format
+        fmt = args.format or "prometheus"
+        if fmt == "json":
+            err("--textfile needs --format prometheus or openmetrics")
+        text = _metrics_logic(fmt)
+        path = Path(args.textfile).expanduser()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            tmp.write_text(text)
+            os.replace(tmp, path)  # the collector must never see a half-written file
+        except OSError as e:
+            err(f"could not write {path}: {e}")
+        emit({"textfile": str(path), "format": fmt, "bytes": len(text.encode())})
+        return
+    fmt = args.format or "openmetrics"
+    result = _metrics_logic(fmt)
+    if fmt == "json":
+        emit(result)
+    else:
+        sys.stdout.write(result)
+
+
+# ---------------------------------------------------------------------------
+# Context files (--context-file / --context-glob)
+# ---------------------------------------------------------------------------
+
+CONTEXT_BUDGET = 32 * 1024  # bytes of file context per council (--context-budget / --context-tokens)
+CONTEXT_FILE_CAP = 12 * 1024  # larger files are digested to their head plus an outline of the rest
+CONTEXT_MMAP_BYTES = 1024 * 1024  # files at least this big are scanned through mmap, not read whole
+CONTEXT_MAX_FILES = 200  # files considered per council (explicit files first, then glob matches)
+CONTEXT_MIN_PARTIAL = 1024  # don't include a truncated file with less room than this
+CONTEXT_CACHE_ROWS = 2000  # least recently used digests beyond this are evicted
+CONTEXT_CACHE_TIMEOUT = 5  # seconds to wait on another council's cache write before reading uncached
+OUTLINE_RE = re.compile(
+    rb"^[ \t]*(?:(?:async[ \t]+)?def |class |function |export |interface |type |struct |enum |impl "
+    rb"|(?:pub[ \t]+)?fn |func |#{1,6} )[^\n]*", re.M)
+
+CONTEXT_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY, mtime REAL, size INTEGER, sha256 TEXT,
+    mode TEXT, text TEXT, keywords TEXT, used_at REAL
+);
+"""
+
+
+def _digest_buffer(buf, size):
+    """Digest file bytes (bytes or an mmap): sha256 plus the text to include. None for binary files."""
+    if b"\0" in buf[:8192]:
+        return None
+    sha = hashlib.sha256(buf).hexdigest()
+    if size <= CONTEXT_FILE_CAP:
+        return {"sha256": sha, "mode": "full", "text": bytes(buf).decode("utf-8", "replace")}
+
+    head = bytes(buf[:CONTEXT_FILE_CAP // 2])
+    head = head[:head.rfind(b"\n") + 1] or head
+    lineno, pos, outline, used = head.count(b"\n") + 1, len(head), [], 0
+    for m in OUTLINE_RE.finditer(buf, len(head)):
+        lineno += bytes(buf[pos:m.start()]).count(b"\n")  # mmap has no count()
+        pos = m.start()
+        line = f"{lineno}: {m.group().decode('utf-8', 'replace').strip()}"
+        used += len(line) + 1
+        if used > CONTEXT_FILE_CAP // 2:
+            outline.append("...")
+            break
+        outline.append(line)
+    text = head.decode("utf-8", "replace")
+    text += f"\n[... {size - len(head)} more bytes. Outline of the rest (line: definition):]\n" + "\n".join(outline)
+    return {"sha256": sha, "mode": "digest", "text": text}
+
+
+def _read_context_file(path, size):
+    with open(path, "rb") as fh:
+        if size >= CONTEXT_MMAP_BYTES:
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _digest_buffer(mm, size)
+        return _digest_buffer(fh.read(), size)
+
+
+def _context_candidates(files=None, globs=None):
+    """Explicit files first, then glob matches (sorted), de-duplicated by real path."""
+    matches = [m for g in globs or [] for m in sorted(glob.glob(os.path.expanduser(g), recursive=True))]
+    candidates, seen = [], set()
+    for explicit, paths in ((True, files or []), (False, matches)):
+        for p in paths:
+            real = os.path.realpath(os.path.expanduser(p))
+            if real in seen or not os.path.isfile(real):
+                continue
+            seen.add(real)
+            candidates.append((p, real, explicit))
+    return candidates[:CONTEXT_MAX_FILES]
+
+
+def _context_cache_connect():
+    """Open the digest cache, or None if it can't be opened (files are then read uncached)."""
+    try:
+        COUNCIL_DIR.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(CONTEXT_CACHE_DB, timeout=CONTEXT_CACHE_TIMEOUT)
+        conn.executescript(CONTEXT_CACHE_SCHEMA)
+    except (OSError, sqlite3.Error):
+        return None
+    return conn
+
+
+def _context_cache_store(conn, inserts, touched):
+    """Save new digests and bump used_at for hits in one short transaction, then evict; best effort."""
+    try:
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)", inserts)
+            conn.executemany("UPDATE files SET used_at = ? WHERE path = ?", touched)
+            conn.execute("DELETE FROM files WHERE path NOT IN (SELECT path FROM files ORDER BY used_at DESC LIMIT ?)",
+                         (CONTEXT_CACHE_ROWS,))
+    except sqlite3.Error:
+        pass  # another council holds the cache; these digests are cached next time
+    finally:
+        conn.close()
+
+
+def _context_files_logic(question, files=None, globs=None, budget=CONTEXT_BUDGET):
+    """Read, dedupe, rank and fit files into a byte budget. Returns dict with 'context' and a report.
+
+    Digests are cached per path by mtime and size, so unchanged files are
+    not read again by later councils on the same repository. If another
+    council holds the cache past CONTEXT_CACHE_TIMEOUT, files are read uncached.
+    """
+    missing = [p for p in files or [] if not os.path.isfile(os.path.expanduser(p))]
+    candidates = _context_candidates(files, globs)
+    question_keywords = extract_keywords(question)
+    conn = _context_cache_connect()
+    now = time.time()
+    docs, skipped, digests = [], [{"path": p, "reason": "not found"} for p in missing], set()
+    hits = misses = 0
+    inserts, touched = [], []
+    for shown, real, explicit in candidates:
+        try:
+            st = os.stat(real)
+        except OSError:
+            skipped.append({"path": shown, "reason": "unreadable"})
+            continue
+        row = None
+        if conn:
+            try:
+                row = conn.execute("SELECT sha256, mode, text, keywords FROM files WHERE path = ? AND mtime = ? AND size = ?",
+                                   (real, st.st_mtime, st.st_size)).fetchone()
+            except sqlite3.Error:
+                conn.close()
+                conn = None
+        if row:
+            hits += 1
+            doc = {"sha256": row[0], "mode": row[1], "text": row[2], "keywords": set(json.loads(row[3]))}
+            touched.append((now, real))
+        else:
+            misses += 1
+            try:
+                doc = _read_context_file(real, st.st_size)
+            except (OSError, ValueError):
+                skipped.append({"path": shown, "reason": "unreadable"})
+                continue
+            except Exception as e:  # one bad file must not sink the council
+                skipped.append({"path": shown, "reason": f"digest failed: {type(e).__name__}"})
+                continue
+            # Binary files are cached too, so they're skipped without a read next time
+            doc = doc or {"sha256": None, "mode": "binary", "text": ""}
+            doc["keywords"] = extract_keywords(doc["text"])
+            inserts.append((real, st.st_mtime, st.st_size, doc["sha256"], doc["mode"], doc["text"],
+                            json.dumps(sorted(doc["keywords"])), now))
+        if doc["mode"] == "binary":
+            skipped.append({"path": shown, "reason": "binary"})
+            continue
+        if doc["sha256"] in digests:
+            skipped.append({"path": shown, "reason": "duplicate content"})
+            continue
+        digests.add(doc["sha256"])
+        path_keywords = extract_keywords(re.sub(r"[^A-Za-z0-9]+", " ", shown))
+        overlap = len(question_keywords & doc["keywords"]) + 2 * len(question_keywords & path_keywords)
+        docs.append(dict(doc, path=shown, explicit=explicit, bytes=st.st_size,
+                         score=overlap / len(question_keywords) if question_keywords else 0))
+    if conn:
+        _context_cache_store(conn, inserts, touched)
+    telemetry_count("council_cache_requests_total", {"cache": "context_files", "result": "hit"}, hits)
+    telemetry_count("council_cache_requests_total", {"cache": "context_files", "result": "miss"}, misses)
+
+    # Most relevant first: explicit files, then by question overlap, smaller files breaking ties
+    docs.sort(key=lambda d: (not d["explicit"], -d["score"], len(d["text"])))
+    blocks, included, used = [], [], 0
+    for doc in docs:
+        header = f"--- FILE: {doc['path']}" + (" (digest: head + outline)" if doc["mode"] == "digest" else "") + " ---\n"
+        text, mode = doc["text"], doc["mode"]
+        # The budget is in UTF-8 bytes, not characters
+        room = budget - used - len(header.encode())
+        if len(text.encode()) > room:
+            if room < CONTEXT_MIN_PARTIAL:
+                skipped.append({"path": doc["path"], "reason": "budget"})
+                continue
+            cut = text.encode()[:room - 60].decode("utf-8", "ignore")
+            text = cut[:cut.rfind("\n") + 1 or len(cut)] + "[... truncated to fit the context budget]"
+            mode = "truncated"
+        blocks.append(header + text.rstrip("\n"))
+        used += len(header.encode()) + len(text.encode())
+        included.append({"path": doc["path"], "bytes": doc["bytes"], "mode": mode, "score": round(doc["score"], 3)})
+    return {
+        "context": "\n\n".join(blocks),
+        "files": included,
+        "skipped": skipped,
+        "bytes": used,
+        "budget": budget,
+        "cache_hits": hits,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Subcommand: grounding (cache of the mediator's pre-dispatch research)
+# ---------------------------------------------------------------------------
+
+GROUNDING_TTL = 72 * 3600  # seconds cached facts stay fresh (--ttl, COUNCIL_GROUNDING_TTL)
+GROUNDING_MATCH = 0.5  # query keyword overlap that counts as the same question
+GROUNDING_MAX_ATTACH = 5  # cached entries pipeline attaches at most
+GROUNDING_KEEP_STALE = 30 * 86400  # expired entries are dropped this long after expiry (get --include-stale)
+
+
+def grounding_key(query):
+    """Normalized cache key: the query's keywords, sorted (word order and filler don't matter)."""
+    return " ".join(sorted(extract_keywords(query)))
+
+
+def _grounding_ttl(ttl=None):
+    if ttl is not None:
+        return ttl
+    try:
+        return int(os.environ.get("COUNCIL_GROUNDING_TTL", GROUNDING_TTL))
+    except ValueError:
+        return GROUNDING_TTL
+
+
+def _read_grounding():
+    try:
+        data = json.loads(GROUNDING_FILE.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _grounding_put_logic(query, facts, topic=None, sources=None, ttl=None, checked_at=None):
+    """Cache facts for a query (replacing any entry with the same key). Returns the stored entry."""
+    key = grounding_key(query)
+    if not key:
+        return {"error": "no keywords in query"}
+    if not facts or not facts.strip():
+        return {"error": "no facts to store"}
+    now = time.time()
+    entry = {
+        "key": key,
+        "query": query,
+        "topic": topic,
+        "facts": facts.strip(),
+        "sources": sources or [],
+        "checked_at": checked_at or now,
+        "expires_at": (checked_at or now) + _grounding_ttl(ttl),
+    }
+    with locked_json_update(GROUNDING_FILE, "grounding", indent=2) as cache:
+        for k in [k for k, e in cache.items() if e.get("expires_at", 0) + GROUNDING_KEEP_STALE <= now]:
+            del cache[k]
+        cache[key] = entry
+    return entry
+
+
+def _grounding_get_logic(query=None, topic=None, include_stale=False, limit=GROUNDING_MAX_ATTACH):
+    """Cached facts for a query and/or topic, best match first, each with its age and freshness."""
+    now = time.time()
+    keywords = extract_keywords(query) if query else set()
+    matches = []
+    for entry in _read_grounding().values():
+        fresh = entry.get("expires_at", 0) > now
+        if not fresh and not include_stale:
+            continue
+        entry_keywords = set(entry["key"].split())
+        union = keywords | entry_keywords
+        score = len(keywords & entry_keywords) / len(union) if union else 0
+        # Same question (close keyword match), or same topic and at least one shared keyword
+        same_topic = topic and entry.get("topic") == topic and (score > 0 or not query)
+        if score >= GROUNDING_MATCH or same_topic:
+            matches.append(dict(entry, score=round(score, 3), fresh=fresh,
+                                age_hours=round((now - entry["checked_at"]) / 3600, 1)))
+    matches.sort(key=lambda e: (e["score"], e["checked_at"]), reverse=True)
+    return {"facts": matches[:limit], "count": len(matches[:limit])}
+
+
+def format_grounding(entries, explicit=None):
+    """Render cached entries (plus any explicit --grounding-facts) as one grounding block with timestamps."""
+    parts = [explicit.strip()] if explicit and explicit.strip() else []
+    for entry in entries:
+        if entry["facts"] in parts:
+            continue
+        checked = datetime.fromtimestamp(entry["checked_at"]).strftime("%Y-%m-%d")
+        sources = f"; sources: {', '.join(entry['sources'])}" if entry.get("sources") else ""
+        parts.append(f"{entry['facts']}\n(checked {checked}{sources})")
+    return "\n\n".join(parts) or None
+
+
+def cmd_grounding(args):
+    """Get or put cached grounding facts."""
+    if args.grounding_action == "put":
+        facts = args.facts
+        if args.stdin:
+            facts = sys.stdin.read()
+        if not args.query:
+            err("--query required for grounding put")
+        result = _grounding_put_logic(args.query, facts, topic=args.topic, sources=args.source, ttl=args.ttl)
+        if "error" in result:
+            err(result["error"])
+        emit(result)
+    else:
+        if not args.query and not args.topic:
+            err("--query or --topic required for grounding get")
+        result = _grounding_get_logic(args.query, args.topic, include_stale=args.include_stale)
+        result["grounding_facts"] = format_grounding(result["facts"])
+        emit(result)
+
+
 # ---------------------------------------------------------------------------
 # Subcommand: pipeline (pre-dispatch: historian + assign + prompts + session create)
 # ---------------------------------------------------------------------------
 
-def cmd_pipeline(args):
-    """Single call replacing historian + assign + prompt (x3) + session create + mkdir."""
+def _pipeline_logic(question, topic=None, personas_str=None, fun=False, seats=3, prior_context=None,
+                    context=None, grounding_facts=None, labels_json_str=None, prompt_layout=None,
+                    grounding=None, grounding_sources=None, context_files=None, context_globs=None,
+                    context_budget=None):
+    """Historian + assign + prompts + session create. Returns the pipeline output dict (or {'error'})."""
     ensure_dirs()
 
-    question = args.question
-    topic = args.topic
-    personas_str = args.personas
-    fun = args.fun
-    seats = args.seats or 3
-    prior_context = args.prior_context
-    context = args.context
-    labels_json_str = args.labels_json
+    # 0. File context: read, dedupe, rank and budget --context-file/--context-glob
+    context_report = None
+    if context_files or context_globs:
+        with profile_stage("context_files"):
+            context_report = _context_files_logic(question, context_files, context_globs,
+                                                  budget=context_budget or CONTEXT_BUDGET)
+        if context_report["context"]:
+            context = f"{context}\n\n{context_report['context']}" if context else context_report["context"]
+        context_report.pop("context")
 
     # 1. Historian lookup
-    historian_result = _historian_logic(question)
+    with profile_stage("historian"):
+        historian_result = _historian_logic(question)
 
     # Build prior context block from historian results
     historian_context = prior_context or ""
@@ -1310,39 +3583,70 @@ def cmd_pipeline(args):
             historian_context = block
 
     # 2. Assign personas
-    assign_result = _assign_logic(question, topic=topic, personas_str=personas_str, fun=fun, seats=seats)
+    with profile_stage("assign"):
+        assign_result = _assign_logic(question, topic=topic, personas_str=personas_str, fun=fun, seats=seats)
     if "error" in assign_result:
-        err(assign_result["error"])
+        return assign_result
 
     assignment = assign_result["assignment"]
     personas_list = assign_result["personas"]
 
+    # 2b. Grounding cache: keep the mediator's facts for related questions, attach fresh cached ones
+    grounding_info = None
+    if (grounding or os.environ.get("COUNCIL_GROUNDING") or "auto") == "auto":
+        with profile_stage("grounding"):
+            grounding_topic = topic or assign_result["topic"]
+            stored = False
+            if grounding_facts:
+                stored = "error" not in _grounding_put_logic(question, grounding_facts, topic=grounding_topic,
+                                                             sources=grounding_sources)
+            explicit = (grounding_facts or "").strip()
+            cached = [e for e in _grounding_get_logic(question, grounding_topic)["facts"] if e["facts"] != explicit]
+            if cached:
+                grounding_facts = format_grounding(cached, grounding_facts)
+            grounding_info = {
+                "stored": stored,
+                "attached": [{k: e.get(k) for k in ("query", "topic", "age_hours", "sources")} for e in cached],
+            }
+
     # 3. Build prompts for each advisor
+    layout = _prompt_layout(prompt_layout)
     prompts = {}
+    prompt_prefix = None
     for agent, info in assignment.items():
-        prompt_result = _prompt_logic(
-            info["persona"], question,
-            prior_context=historian_context if historian_context else None,
-            context=context,
-            grounding_facts=getattr(args, 'grounding_facts', None),
-        )
+        with profile_stage("prompts"):
+            prompt_result = _prompt_logic(
+                info["persona"], question,
+                prior_context=historian_context if historian_context else None,
+                context=context,
+                grounding_facts=grounding_facts,
+                layout=layout,
+            )
         if "error" in prompt_result:
-            err(prompt_result["error"])
+            return prompt_result
         prompts[agent] = prompt_result["prompt"]
+        prompt_prefix = prompt_result.get("prefix")
 
-    # 4. Create session
+    # 4. Agent availability for the briefing header (health cache — no process spawns)
+    with profile_stage("agent_status"):
+        agent_status = _agent_status_logic()
+
+    # 5. Create session
     personas_json_map = {agent: info["persona"] for agent, info in assignment.items()}
-    session_result = _session_create_logic(
-        question,
-        topic=topic,
-        personas_json_str=json.dumps(personas_json_map),
-        labels_json_str=labels_json_str,
-        prior_context=historian_context if historian_context else None,
-    )
+    with profile_stage("session_create"):
+        session_result = _session_create_logic(
+            question,
+            topic=topic,
+            personas_json_str=json.dumps(personas_json_map),
+            labels_json_str=labels_json_str,
+            prior_context=historian_context if historian_context else None,
+            prompt_layout=layout,
+            prompt_prefix=prompt_prefix,
+        )
     if "error" in session_result:
-        err(session_result["error"])
+        return session_result
 
-    emit({
+    return {
         "session_id": session_result["id"],
         "session_file": session_result["file"],
         "historian": historian_result,
@@ -1350,34 +3654,1051 @@ def cmd_pipeline(args):
         "prompts": prompts,
         "personas": personas_list,
         "fun_applied": assign_result["fun_applied"],
-    })
+        "agent_status": agent_status,
+        "prompt_layout": layout,
+        "prompt_cache": _prefix_report(prompts),
+        "grounding": grounding_info,
+        "context_files": context_report,
+    }
+
+
+def cmd_pipeline(args):
+    """Single call replacing historian + assign + prompt (x3) + session create + mkdir."""
+    profiler = profile_start(args)
+    result = _pipeline_logic(args.question, **_pipeline_kwargs(args))
+    if "error" in result:
+        err(result["error"])
+    emit(profile_finish(args, profiler, result))
+
+
+def _pipeline_kwargs(args):
+    """_pipeline_logic keyword arguments from the flags shared by pipeline and run."""
+    return {
+        "topic": args.topic,
+        "personas_str": args.personas,
+        "fun": args.fun,
+        "seats": args.seats or 3,
+        "prior_context": args.prior_context,
+        "context": args.context,
+        "grounding_facts": args.grounding_facts,
+        "labels_json_str": args.labels_json,
+        "prompt_layout": args.prompt_layout,
+        "grounding": args.grounding,
+        "grounding_sources": args.grounding_source,
+        "context_files": args.context_file,
+        "context_globs": args.context_glob,
+        "context_budget": args.context_tokens * CHARS_PER_TOKEN if args.context_tokens else args.context_budget,
+    }
 
 
 # ---------------------------------------------------------------------------
-# Subcommand: finalize (post-dispatch: similarity + synthesis-prompt + session append)
+# Cassettes (record/replay of advisor CLI calls)
 # ---------------------------------------------------------------------------
 
-def cmd_finalize(args):
-    """Single call replacing similarity + synthesis-prompt + session append."""
+DEFAULT_SEAT_TIMEOUT = 60
+DEFAULT_MAX_SEAT_BYTES = 256 * 1024  # per-seat stdout cap; override with --max-bytes / COUNCIL_MAX_SEAT_BYTES
+STDERR_KEEP = 16 * 1024
+
+
+def _cassette_dir(cassette):
+    """Resolve a cassette name (under CASSETTES_DIR) or path to a directory."""
+    path = Path(cassette).expanduser()
+    if path.is_absolute() or os.sep in cassette:
+        return path
+    return CASSETTES_DIR / cassette
+
+
+def _cassette_key(cli, prompt):
+    """Stable key for one advisor invocation."""
+    return hashlib.sha256(f"{cli}\0{prompt}".encode()).hexdigest()[:16]
+
+
+def _cassette_record(cassette_dir, seat, cli, argv, prompt, stdout, stderr, exit_code, elapsed_ms, timed_out,
+                     truncated=False):
+    """Write one advisor invocation to the cassette directory."""
+    cassette_dir.mkdir(parents=True, exist_ok=True)
+    entry = {
+        "seat": seat,
+        "agent": cli,
+        "argv": argv,
+        "prompt": prompt,
+        "stdout": stdout,
+        "stderr": stderr,
+        "exit_code": exit_code,
+        "elapsed_ms": elapsed_ms,
+        "timed_out": timed_out,
+        "truncated": truncated,
+        "recorded_at": datetime.now().isoformat(timespec="seconds"),
+    }
+    path = cassette_dir / f"{seat}-{cli}-{_cassette_key(cli, prompt)}.json"
+    atomic_write_text(path, json.dumps(entry, indent=2))
+
+
+def _cassette_lookup(cassette_dir, seat, cli, prompt, fallback=False):
+    """Find a recorded invocation. Returns (entry, match) or (None, None).
+
+    Matches on the exact prompt (any seat). With fallback, a miss replays
+    the most recent recording for the same seat and agent, so replays
+    survive prompt drift (dates, historian context) — match "seat". Corrupt
+    recordings are skipped.
+    """
+    key = _cassette_key(cli, prompt)
+    candidates = [cassette_dir / f"{seat}-{cli}-{key}.json"]
+    candidates += sorted(cassette_dir.glob(f"*-{cli}-{key}.json"))
+    for path in candidates:
+        try:
+            return json.loads(path.read_text()), "exact"
+        except (OSError, json.JSONDecodeError):
+            continue
+    if not fallback:
+        return None, None
+
+    recorded = []
+    for path in cassette_dir.glob(f"{seat}-{cli}-*.json"):
+        try:
+            recorded.append(json.loads(path.read_text()))
+        except (OSError, json.JSONDecodeError):
+            continue
+    if recorded:
+        recorded.sort(key=lambda e: e.get("recorded_at", ""))
+        return recorded[-1], "seat"
+    return None, None
+
+
+# ---------------------------------------------------------------------------
+# Concurrency governor (machine-wide per-provider slots via flock)
+# ---------------------------------------------------------------------------
+
+DEFAULT_MAX_CONCURRENT = 3  # per provider, across every Claude Code window
+GOVERNOR_POLL = 0.05  # seconds between slot attempts while queued
+
+
+def _provider_limit(cli, config=None):
+    """Max concurrent processes for a provider.
+
+    COUNCIL_MAX_CONCURRENT_<CLI>, then config "max_concurrent", then the
+    adapter's own max_concurrent, then the default. The global
+    COUNCIL_MAX_CONCURRENT env sits with the per-CLI one, so it overrides
+    every adapter's config too.
+    """
+    env_name = re.sub(r"[^A-Z0-9]", "_", cli.upper())
+    env = os.environ.get(f"COUNCIL_MAX_CONCURRENT_{env_name}") or os.environ.get("COUNCIL_MAX_CONCURRENT")
+    if env is None:
+        limits = (config if config is not None else load_config()).get("max_concurrent", {})
+        env = limits.get(cli) if isinstance(limits, dict) else limits
+        if env is None:
+            env = provider_adapters().get(cli, {}).get("max_concurrent")
+        if env is None and isinstance(limits, dict):
+            env = limits.get("default")
+    try:
+        return max(1, int(env)) if env is not None else DEFAULT_MAX_CONCURRENT
+    except (TypeError, ValueError):
+        return DEFAULT_MAX_CONCURRENT
+
+
+@contextmanager
+def provider_slot(cli, limit, wait_timeout):
+    """Hold one of `limit` machine-wide slots for `cli` while the block runs.
+
+    Slots are flock'd files under LOCKS_DIR, so they are shared by every
+    council process and released by the kernel if a process dies. Yields
+    (slot, queue_wait_ms); raises TimeoutError if no slot frees up in time.
+    """
+    if fcntl is None:
+        yield None, 0
+        return
+    LOCKS_DIR.mkdir(parents=True, exist_ok=True)
+    start = time.monotonic()
+    while True:
+        for slot in range(limit):
+            fd = os.open(LOCKS_DIR / f"{cli}.{slot}.lock", os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                os.close(fd)
+                continue
+            try:
+                yield slot, int((time.monotonic() - start) * 1000)
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+            return
+        if time.monotonic() - start >= wait_timeout:
+            raise TimeoutError(f"no free {cli} slot after {wait_timeout}s (limit {limit})")
+        time.sleep(GOVERNOR_POLL)
+
+
+# ---------------------------------------------------------------------------
+# Circuit breakers (per provider, persisted across councils)
+# ---------------------------------------------------------------------------
+
+BREAKER_THRESHOLD = 3  # consecutive failures/timeouts before a provider's breaker opens
+BREAKER_COOLDOWN = 300  # seconds an open breaker stays open before a half-open trial
+BREAKER_TRIAL_GRACE = 30  # a trial claim outlives the trial seat's queue wait + timeout by this much
+
+
+def _breaker_settings(config=None):
+    """(threshold, cooldown) from COUNCIL_BREAKER_THRESHOLD/_COOLDOWN, then config, then defaults."""
+    breaker = (config if config is not None else load_config()).get("breaker", {})
+    if not isinstance(breaker, dict):
+        breaker = {}
+    try:
+        threshold = int(os.environ.get("COUNCIL_BREAKER_THRESHOLD", breaker.get("threshold", BREAKER_THRESHOLD)))
+        cooldown = float(os.environ.get("COUNCIL_BREAKER_COOLDOWN", breaker.get("cooldown", BREAKER_COOLDOWN)))
+    except (TypeError, ValueError):
+        threshold, cooldown = BREAKER_THRESHOLD, BREAKER_COOLDOWN
+    return max(1, threshold), cooldown
+
+
+def _read_breakers():
+    try:
+        data = json.loads(BREAKERS_FILE.read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def breaker_state(entry, cooldown, now=None):
+    """Effective state of a stored breaker entry: closed, open or half-open.
+
+    Half-open means the cooldown has elapsed and nobody holds the trial; while
+    a council's claimed trial is in flight, everyone else still sees open.
+    """
+    if not entry or entry.get("state") != "open":
+        return "closed"
+    now = now or time.time()
+    if now - entry.get("opened_at", 0) < cooldown or entry.get("trial_expires_at", 0) > now:
+        return "open"
+    return "half-open"
+
+
+def breaker_states(config=None):
+    """Effective breaker state for every known provider."""
+    _, cooldown = _breaker_settings(config)
+    stored = _read_breakers()
+    return {cli: breaker_state(stored.get(cli), cooldown) for cli in provider_adapters()}
+
+
+def _claim_breaker_trial(cli, ttl, config=None):
+    """Take the single half-open trial for a provider, machine-wide. True if this caller got it.
+
+    The claim lapses after ttl seconds, so a trial whose outcome never gets
+    recorded (killed process, full local queue) doesn't wedge the breaker.
+    """
+    _, cooldown = _breaker_settings(config)
+    now = time.time()
+    with locked_json_update(BREAKERS_FILE, "breakers", indent=2) as breakers:
+        entry = breakers.get(cli)
+        if breaker_state(entry, cooldown, now) != "half-open":
+            return False
+        entry.update(trial_started_at=now, trial_expires_at=now + ttl)
+    return True
+
+
+def _record_breaker(cli, ok, error=None, config=None):
+    """Fold one live seat outcome into the provider's breaker (read-modify-write under a lock).
+
+    A success on a healthy breaker changes nothing, so it's checked against an
+    unlocked read first and most seats never take the lock.
+    """
+    if ok:
+        entry = _read_breakers().get(cli)
+        if not entry or (entry.get("state") == "closed" and not entry.get("failures")):
+            return
+    threshold, cooldown = _breaker_settings(config)
+    with locked_json_update(BREAKERS_FILE, "breakers", indent=2) as breakers:
+        entry = breakers.get(cli, {"state": "closed", "failures": 0})
+        if ok and entry.get("state") == "closed" and not entry.get("failures"):
+            return
+        # A claimed trial reporting back is the half-open outcome, even though others see it as open
+        previous = "half-open" if "trial_started_at" in entry else breaker_state(entry, cooldown)
+        if ok:
+            entry = {"state": "closed", "failures": 0}
+        else:
+            entry["failures"] = entry.get("failures", 0) + 1
+            entry["last_error"] = error
+            # A failed half-open trial re-opens immediately; otherwise open at the threshold.
+            # Stragglers failing on an already-open breaker neither re-trip it nor restart the cooldown.
+            if previous == "half-open" or (previous == "closed" and entry["failures"] >= threshold):
+                entry["state"] = "open"
+                entry["opened_at"] = time.time()
+                entry.pop("trial_started_at", None)
+                entry.pop("trial_expires_at", None)
+                telemetry_count("council_breaker_trips_total", {"provider": cli})
+        entry["updated_at"] = time.time()
+        breakers[cli] = entry
+
+
+def _seat_blocked(seat, cli, states, trials=None):
+    """Whether a seat may not run on cli: its breaker is open, or half-open with the trial held by another seat."""
+    state = states.get(cli, "closed")
+    return state == "open" or (state == "half-open" and (trials or {}).get(cli) != seat)
+
+
+def _substitute_open_seats(seat_agents, states, available, trials=None):
+    """Reassign seats that may not run on their provider (see _seat_blocked) to a healthy CLI.
+
+    Picks the available, closed-breaker CLI currently holding the fewest
+    seats, so the council keeps as much provider diversity as it can.
+    Returns (seat_agents, substitutions) where substitutions maps seat ->
+    original CLI.
+    """
+    healthy = [cli for cli, adapter in provider_adapters().items()
+               if adapter["substitute"] and cli in available and states.get(cli, "closed") == "closed"]
+    assigned = dict(seat_agents)
+    substitutions = {}
+    for seat, cli in seat_agents.items():
+        if not _seat_blocked(seat, cli, states, trials) or not healthy:
+            continue
+        replacement = min(healthy, key=lambda c: sum(1 for a in assigned.values() if a == c))
+        assigned[seat] = replacement
+        substitutions[seat] = cli
+    return assigned, substitutions
+
+
+# ---------------------------------------------------------------------------
+# Quorum dispatch (detached seats, late arrivals)
+# ---------------------------------------------------------------------------
+
+QUORUM_POLL = 0.05  # seconds between result checks while waiting for a quorum
+SPOOL_RUN_TTL = 3600  # quorum run directories older than this are removed
+
+
+def _spool_gc():
+    """Remove quorum run directories left over from earlier councils."""
+    cutoff = time.time() - SPOOL_RUN_TTL
+    for run_dir in SPOOL_DIR.glob("run-*"):
+        try:
+            if run_dir.stat().st_mtime < cutoff:
+                shutil.rmtree(run_dir, ignore_errors=True)
+        except OSError:
+            continue
+
+
+def _claim_seat(run_dir, seat):
+    """Claim a finished seat's result exactly once — by dispatch (on time) or its helper (late)."""
+    try:
+        with open(run_dir / f"{seat}.claim", "x"):
+            return True
+    except FileExistsError:
+        return False
+
+
+def _read_seat_result(run_dir, seat):
+    try:
+        return json.loads((run_dir / f"{seat}.json").read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def _quorum_run(prompts, seat_agents, quorum, grace_ms, timeout, live, blocked, substitutions, run_kwargs, session_id):
+    """Launch every seat as a detached `dispatch-seat` process and wait for a quorum.
+
+    Returns (responses, quorum_info). Seats still running when dispatch
+    returns keep going; each records itself as a late arrival on the session
+    when it finishes.
+    """
+    SPOOL_DIR.mkdir(parents=True, exist_ok=True)
+    _spool_gc()
+    run_id = f"run-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+    run_dir = SPOOL_DIR / run_id
+    run_dir.mkdir()
+
+    round_num = None
+    if session_id:
+        data, _ = load_session(session_id, resolve=False)
+        round_num = len(data.get("rounds", [])) + 1 if data else None
+
+    responses, launched = {}, []
+    for seat, prompt in prompts.items():
+        cli = seat_agents[seat]
+        if seat in blocked:
+            responses[seat] = _circuit_open_result(cli)
+            continue
+        spec = {
+            "seat": seat, "agent": cli, "prompt": prompt, "run_kwargs": run_kwargs(cli),
+            "live": live, "substituted_from": substitutions.get(seat),
+            "run_dir": str(run_dir), "session_id": session_id, "round": round_num,
+        }
+        spec_path = run_dir / f"{seat}.spec.json"
+        spec_path.write_text(json.dumps(spec))
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "dispatch-seat", "--spec", str(spec_path)],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            start_new_session=os.name == "posix",
+        )
+        launched.append(seat)
+
+    quorum = min(quorum, len(prompts))
+    deadline = time.monotonic() + 2 * timeout  # queue wait + run, both bounded by timeout
+    quorum_at = None
+    finished = {}
+    while time.monotonic() < deadline:
+        for seat in launched:
+            if seat not in finished:
+                result = _read_seat_result(run_dir, seat)
+                if result is not None:
+                    finished[seat] = result
+        answered = sum(1 for r in list(finished.values()) + list(responses.values()) if not r.get("error"))
+        if answered >= quorum and quorum_at is None:
+            quorum_at = time.monotonic()
+        if len(finished) == len(launched):
+            break
+        if quorum_at is not None and (time.monotonic() - quorum_at) * 1000 >= grace_ms:
+            break
+        time.sleep(QUORUM_POLL)
+
+    # Close the run, then claim whatever has landed; a helper that finishes
+    # after this point finds the run closed and records itself as late.
+    (run_dir / "closed").touch()
+    pending = []
+    for seat in launched:
+        result = _read_seat_result(run_dir, seat)
+        if result is not None and _claim_seat(run_dir, seat):
+            responses[seat] = result
+        else:
+            pending.append(seat)
+
+    answered = sum(1 for r in responses.values() if not r.get("error"))
+    return responses, {
+        "k": quorum,
+        "grace_ms": grace_ms,
+        "met": answered >= quorum,
+        "answered": answered,
+        "pending": pending,
+        "run_id": run_id,
+        "session_id": session_id,
+        "round": round_num,
+    }
+
+
+def _merge_late_arrivals(data):
+    """Move late arrivals whose round now exists into that round. Returns the number merged.
+
+    An arrival belongs to the round finalized from its dispatch (matched by
+    run_id): concurrent dispatches on one session can't know which round
+    number they'll end up as. Entries without a run_id fall back to the
+    round number guessed at dispatch time.
+    """
+    rounds = data.get("rounds", [])
+    by_run = {rnd["dispatch_run"]: rnd for rnd in rounds if rnd.get("dispatch_run")}
+    waiting = []
+    for entry in data.get("late_arrivals", []):
+        num = entry.get("round")
+        if entry.get("run_id"):
+            target = by_run.get(entry["run_id"])
+        else:
+            target = rounds[num - 1] if num and num <= len(rounds) else None
+        if target is not None:
+            target.setdefault("late_arrivals", {})[entry["seat"]] = {
+                k: v for k, v in entry.items() if k not in ("seat", "round", "run_id")}
+        else:
+            waiting.append(entry)
+    merged = len(data.get("late_arrivals", [])) - len(waiting)
+    if waiting:
+        data["late_arrivals"] = waiting
+    else:
+        data.pop("late_arrivals", None)
+    return merged
+
+
+def _session_late_logic(session_id, resynthesize=False):
+    """Late arrivals on a session; optionally a fresh synthesis prompt for the latest round that has them."""
+    data, _ = load_session(session_id)
+    if not data:
+        return {"error": f"session not found: {session_id}"}
+
+    arrivals = [dict(entry, merged=False) for entry in data.get("late_arrivals", [])]
+    for rnd in data.get("rounds", []):
+        for seat, entry in rnd.get("late_arrivals", {}).items():
+            arrivals.append(dict(entry, seat=seat, round=rnd.get("round"), merged=True))
+    result = {"id": session_id, "late_arrivals": [
+        {k: entry.get(k) for k in ("round", "seat", "agent", "arrived_at", "elapsed_ms", "error", "truncated", "merged")}
+        for entry in arrivals]}
+
+    if resynthesize:
+        rounds = [rnd for rnd in data.get("rounds", []) if rnd.get("late_arrivals")]
+        if not rounds:
+            return {"error": "no merged late arrivals to re-synthesize"}
+        rnd = rounds[-1]
+        responses = {seat: rnd[seat] for seat in _advisor_keys(rnd)}
+        analysis = dict(rnd.get("analysis", {}))
+        for seat, entry in rnd["late_arrivals"].items():
+            if entry.get("response"):
+                responses[seat] = entry["response"]
+                analysis[seat] = entry.get("analysis") or _analyze_response(entry["response"])
+        drift = None
+        if rnd.get("round", 1) > 1:
+            drift = _position_drift(data["rounds"][rnd["round"] - 2], responses, analysis)
+        synth = _synthesis_prompt_logic(
+            responses, data.get("question", ""),
+            personas_json_str=json.dumps(data.get("personas", {})),
+            labels_json_str=json.dumps(data.get("labels", {})),
+            prior_context=data.get("prior_context"),
+            analysis={seat: analysis[seat] for seat in responses if seat in analysis},
+            drift=drift,
+        )
+        result.update({"round": rnd.get("round"), "synthesis_prompt": synth["prompt"]})
+    return result
+
+
+def _record_late_arrival(session_id, round_num, seat, result, run_id=None):
+    """Save a straggler's result on its session (merged into the round once it exists)."""
+    entry = dict(result, seat=seat, round=round_num, run_id=run_id, arrived_at=datetime.now().isoformat(timespec="seconds"))
+    entry["analysis"] = _analyze_response(result.get("response", ""))
+
+    def add(data):
+        data.setdefault("late_arrivals", []).append(entry)
+        _merge_late_arrivals(data)
+    _session_update_logic(session_id, add)
+
+
+def cmd_dispatch_seat(args):
+    """Internal: run one quorum seat in a detached process (spawned by dispatch --quorum)."""
+    spec = json.loads(Path(args.spec).read_text())
+    run_dir, seat = Path(spec["run_dir"]), spec["seat"]
+    result = _dispatch_seat(seat, spec["agent"], spec["prompt"], spec["run_kwargs"], spec["live"],
+                            substituted_from=spec.get("substituted_from"))
+    tmp = run_dir / f"{seat}.json.tmp"
+    tmp.write_text(json.dumps(result))
+    os.replace(tmp, run_dir / f"{seat}.json")
+    if (run_dir / "closed").exists() and _claim_seat(run_dir, seat):
+        result["late"] = True
+        telemetry_count("council_late_arrivals_total", {"provider": spec["agent"]})
+        if spec.get("session_id"):
+            _record_late_arrival(spec["session_id"], spec.get("round"), seat, result, run_dir.name)
+
+
+# ---------------------------------------------------------------------------
+# Subcommand: dispatch (run advisor CLIs, optionally via cassettes)
+# ---------------------------------------------------------------------------
+
+def _agent_argv(cli, prompt, prompt_file=None):
+    """Build the argv for an adapter. Returns (argv, stdin_text).
+
+    prompt_via "file" expects the caller to write the prompt to prompt_file.
+    """
+    info = provider_adapters()[cli]
+    if info["prompt_via"] == "stdin":
+        return list(info["command"]), prompt
+    if info["prompt_via"] == "file":
+        return [part.replace("{prompt_file}", str(prompt_file)) for part in info["command"]], None
+    return [part.replace("{prompt}", prompt) for part in info["command"]], None
+
+
+def _parse_output(cli, stdout):
+    """Pull the response text out of an adapter's stdout. Returns (text, error).
+
+    "text" adapters return stdout as-is. "json" adapters print one JSON
+    document (or JSON lines, last one wins); output_field is a dotted path
+    to the answer inside it.
+    """
+    info = provider_adapters()[cli]
+    text = stdout.strip()
+    if info["output"] != "json" or not text:
+        return text, None
+    try:
+        doc = json.loads(text)
+    except json.JSONDecodeError:
+        try:
+            doc = json.loads(text.splitlines()[-1])
+        except json.JSONDecodeError:
+            return text, "unparseable JSON output"
+    for key in info["output_field"].split(".") if info["output_field"] else []:
+        if isinstance(doc, list) and key.lstrip("-").isdigit() and -len(doc) <= int(key) < len(doc):
+            doc = doc[int(key)]
+        elif isinstance(doc, dict) and key in doc:
+            doc = doc[key]
+        else:
+            return text, f"output_field {info['output_field']} not found"
+    return (doc if isinstance(doc, str) else json.dumps(doc)).strip(), None
+
+
+def _seat_timeout(cli, timeout=None):
+    """Per-seat timeout: the --timeout flag, then the adapter's own, then DEFAULT_SEAT_TIMEOUT."""
+    if timeout is not None:
+        return timeout
+    return provider_adapters().get(cli, {}).get("timeout") or DEFAULT_SEAT_TIMEOUT
+
+
+def _default_seat_agents(seats):
+    """Map advisor seats to CLIs in Agent Configuration order; extra seats go to claude."""
+    clis = list(BUILTIN_ADAPTERS)
+    return {seat: clis[i] if i < len(clis) else "claude" for i, seat in enumerate(seats)}
+
+
+def _capture_process(argv, stdin_text, timeout, max_bytes, spool_path):
+    """Run argv, streaming stdout into spool_path as it arrives.
+
+    Unlike subprocess.run, whatever the process printed before a timeout
+    survives it, and stdout is capped at max_bytes (the process is killed
+    once it passes the cap). Returns (stdout, stderr, exit_code, timed_out,
+    truncated).
+    """
+    proc = subprocess.Popen(
+        argv,
+        stdin=subprocess.PIPE if stdin_text is not None else subprocess.DEVNULL,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        start_new_session=os.name == "posix",  # own process group, so kill() takes its children too
+    )
+    over_limit = threading.Event()
+
+    def kill():
+        try:
+            if os.name == "posix":
+                os.killpg(proc.pid, 9)
+            else:
+                proc.kill()
+        except OSError:
+            pass
+    stderr_chunks = []
+
+    def feed_stdin():
+        try:
+            proc.stdin.write(stdin_text.encode())
+            proc.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+
+    def pump_stdout():
+        written = 0
+        with open(spool_path, "wb") as spool:
+            for chunk in iter(lambda: proc.stdout.read1(65536), b""):
+                room = max_bytes - written
+                spool.write(chunk[:room])
+                spool.flush()
+                written += min(len(chunk), room)
+                if len(chunk) > room:
+                    over_limit.set()
+                    kill()
+                    break
+
+    def pump_stderr():
+        kept = 0
+        for chunk in iter(lambda: proc.stderr.read1(65536), b""):
+            if kept < STDERR_KEEP:
+                stderr_chunks.append(chunk[:STDERR_KEEP - kept])
+                kept += len(stderr_chunks[-1])
+
+    threads = [threading.Thread(target=pump_stdout, daemon=True), threading.Thread(target=pump_stderr, daemon=True)]
+    if stdin_text is not None:
+        threads.append(threading.Thread(target=feed_stdin, daemon=True))
+    for t in threads:
+        t.start()
+
+    timed_out = False
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        timed_out = True
+        kill()
+        proc.wait()
+    deadline = time.monotonic() + 2  # an escaped grandchild may still hold a pipe open; don't wait on it
+    for t in threads:
+        t.join(timeout=max(0, deadline - time.monotonic()))
+
+    try:
+        stdout = spool_path.read_bytes().decode("utf-8", errors="replace")
+        spool_path.unlink()
+    except OSError:
+        stdout = ""
+    stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace")
+    exit_code = None if timed_out else proc.returncode
+    return stdout, stderr, exit_code, timed_out, timed_out or over_limit.is_set()
+
+
+def _run_seat(seat, cli, prompt, timeout=DEFAULT_SEAT_TIMEOUT, cassette=None, cassette_mode=None, replay_speed=1.0,
+              limit=DEFAULT_MAX_CONCURRENT, max_bytes=DEFAULT_MAX_SEAT_BYTES, cassette_fallback=False):
+    """Run one advisor CLI (or replay it from a cassette). Returns a seat result dict.
+
+    Live runs first take a provider slot from the concurrency governor; the
+    time spent queued is reported as queue_wait_ms and doesn't count against
+    the seat timeout. Output is captured incrementally, so a seat that times
+    out or exceeds max_bytes still returns what it produced, marked
+    truncated.
+    """
+    result = {
+        "response": "",
+        "agent": cli,
+        "exit_code": None,
+        "elapsed_ms": 0,
+        "timed_out": False,
+        "error": None,
+        "source": "live",
+        "truncated": False,
+    }
+    if cli not in provider_adapters():
+        result["error"] = f"unknown agent: {cli}"
+        return result
+
+    prompt_file = None
+    if provider_adapters()[cli]["prompt_via"] == "file":
+        prompt_file = SPOOL_DIR / f"{os.getpid()}-{threading.get_ident()}-{seat}-{cli}.prompt"
+    argv, stdin_text = _agent_argv(cli, prompt, prompt_file)
+    cassette_dir = _cassette_dir(cassette) if cassette else None
+
+    if cassette_dir and cassette_mode == "replay":
+        entry, match = _cassette_lookup(cassette_dir, seat, cli, prompt, cassette_fallback)
+        telemetry_count("council_cache_requests_total", {"cache": "cassette", "result": "hit" if entry else "miss"})
+        result["source"] = "cassette"
+        if not entry:
+            result["error"] = f"no cassette entry for {seat}/{cli} in {cassette_dir}"
+            return result
+        if replay_speed > 0:
+            time.sleep(entry.get("elapsed_ms", 0) / 1000.0 * replay_speed)
+        response, parse_error = _parse_output(cli, entry.get("stdout", ""))
+        result.update({
+            "response": response,
+            "exit_code": entry.get("exit_code"),
+            "elapsed_ms": entry.get("elapsed_ms", 0),
+            "timed_out": entry.get("timed_out", False),
+            "truncated": entry.get("truncated", False),
+            "cassette_match": match,
+        })
+        if match == "seat":
+            result["warning"] = f"cassette fallback: replayed {seat}/{cli}'s latest recording of a different prompt"
+        if result["timed_out"]:
+            result["error"] = "timed out"
+        elif result["exit_code"] != 0:
+            result["error"] = f"exit code {result['exit_code']}"
+        elif parse_error and not result["truncated"]:
+            result["error"] = parse_error
+        return result
+
+    stdout, stderr, exit_code = "", "", None
+    result["queue_wait_ms"] = 0
+    SPOOL_DIR.mkdir(parents=True, exist_ok=True)
+    spool_path = SPOOL_DIR / f"{os.getpid()}-{threading.get_ident()}-{seat}-{cli}.out"
+    try:
+        with provider_slot(cli, limit, wait_timeout=timeout) as (_, waited_ms):
+            result["queue_wait_ms"] = waited_ms
+            start = time.monotonic()
+            try:
+                if prompt_file:
+                    prompt_file.write_text(prompt)
+                stdout, stderr, exit_code, timed_out, truncated = _capture_process(
+                    argv, stdin_text, timeout, max_bytes, spool_path)
+                result.update({"timed_out": timed_out, "truncated": truncated})
+                if timed_out:
+                    result["error"] = "timed out"
+                elif exit_code != 0 and not truncated:
+                    result["error"] = f"exit code {exit_code}"
+            except FileNotFoundError:
+                result["error"] = "not on PATH"
+            finally:
+                if prompt_file:
+                    prompt_file.unlink(missing_ok=True)
+            elapsed_ms = int((time.monotonic() - start) * 1000)
+    except TimeoutError as e:
+        result.update({"error": str(e), "queue_wait_ms": int(timeout * 1000)})
+        return result
+
+    response, parse_error = _parse_output(cli, stdout)
+    if parse_error and not result["error"] and not result["truncated"]:
+        result["error"] = parse_error
+    result.update({"response": response, "exit_code": exit_code, "elapsed_ms": elapsed_ms})
+
+    if cassette_dir and cassette_mode == "record" and result["error"] != "not on PATH":
+        _cassette_record(cassette_dir, seat, cli, argv, prompt, stdout, stderr,
+                         exit_code, elapsed_ms, result["timed_out"], result["truncated"])
+    return result
+
+
+def _dispatch_seat(seat, cli, prompt, run_kwargs, live, config=None, substituted_from=None):
+    """Run one seat and fold a live outcome into the provider's circuit breaker."""
+    result = _run_seat(seat, cli, prompt, **run_kwargs)
+    if substituted_from:
+        result["substituted_from"] = substituted_from
+    if live and (result["exit_code"] is not None or result["timed_out"]):
+        outcome = "timeout" if result["timed_out"] else "error" if result["error"] else "ok"
+        telemetry_observe("council_dispatch_seconds", result["elapsed_ms"] / 1000.0, DISPATCH_BUCKETS,
+                          {"provider": cli, "outcome": outcome})
+        if result["timed_out"]:
+            telemetry_count("council_dispatch_timeouts_total", {"provider": cli})
+        if result["truncated"]:
+            telemetry_count("council_dispatch_truncated_total", {"provider": cli})
+    # Only provider-side failures count; a missing binary or a full local queue doesn't.
+    if live and (result["exit_code"] is not None or result["timed_out"]):
+        _record_breaker(cli, ok=not result["error"], error=result["error"], config=config)
+    return result
+
+
+def _circuit_open_result(cli):
+    return {"response": "", "agent": cli, "exit_code": None, "elapsed_ms": 0,
+            "timed_out": False, "truncated": False, "error": "circuit open", "source": "breaker"}
+
+
+def _dispatch_logic(prompts, seat_agents, mode="parallel", timeout=None,
+                    cassette=None, cassette_mode=None, replay_speed=1.0, max_bytes=DEFAULT_MAX_SEAT_BYTES, cassette_fallback=False,
+                    quorum=None, grace_ms=0, session_id=None):
+    """Run every seat according to the dispatch mode. Returns dict with 'responses' keyed by seat.
+
+    Live runs consult the provider circuit breakers first: a seat whose
+    provider is open is moved to a healthy CLI (or fails fast if there is
+    none), and every live outcome is recorded back into the breakers. With
+    a quorum, seats run as detached processes and dispatch returns once
+    `quorum` of them have answered and `grace_ms` has passed. A timeout of
+    None lets each seat use its adapter's timeout.
+    """
+    seats = list(prompts)
+    config = load_config()
+    live = cassette_mode != "replay"
+    states, substitutions, blocked = {}, {}, set()
+    if live:
+        states = breaker_states(config)
+        seat_agents = {seat: seat_agents[seat] for seat in seats}
+        # A half-open provider gets one trial seat, claimed machine-wide; if
+        # another council holds the claim, it stays open for this one
+        trials = {}
+        for seat in seats:
+            cli = seat_agents[seat]
+            if states.get(cli) == "half-open" and cli not in trials:
+                ttl = 2 * _seat_timeout(cli, timeout) + BREAKER_TRIAL_GRACE
+                trials[cli] = seat if _claim_breaker_trial(cli, ttl, config) else None
+                if trials[cli] is None:
+                    states[cli] = "open"
+        seat_agents, substitutions = _substitute_open_seats(
+            seat_agents, states, _agent_status_logic()["available"], trials)
+        for seat, original in substitutions.items():
+            telemetry_count("council_seat_substitutions_total", {"from": original, "to": seat_agents[seat]})
+        # Seats with nowhere healthy to go fail fast instead of piling onto the trial
+        blocked = {seat for seat in seats if _seat_blocked(seat, seat_agents[seat], states, trials)}
+    limits = {cli: _provider_limit(cli, config) for cli in set(seat_agents[seat] for seat in seats)}
+
+    def run_kwargs(cli):
+        return {"timeout": _seat_timeout(cli, timeout), "cassette": cassette, "cassette_mode": cassette_mode,
+                "replay_speed": replay_speed, "limit": limits[cli], "max_bytes": max_bytes,
+                "cassette_fallback": cassette_fallback}
+
+    def run(seat):
+        cli = seat_agents[seat]
+        if seat in blocked:
+            return seat, _circuit_open_result(cli)
+        return seat, _dispatch_seat(seat, cli, prompts[seat], run_kwargs(cli), live, config, substitutions.get(seat))
+
+    start = time.monotonic()
+    quorum_info = None
+    if quorum:
+        longest = max(_seat_timeout(seat_agents[seat], timeout) for seat in seats)
+        responses, quorum_info = _quorum_run(
+            prompts, seat_agents, quorum, grace_ms, longest, live, blocked, substitutions, run_kwargs, session_id)
+        mode = "quorum"
+    else:
+        # parallel: everyone at once; staggered: all but the last together, then
+        # the last (heaviest) seat alone; sequential: one at a time.
+        if mode == "sequential":
+            batches = [[seat] for seat in seats]
+        elif mode == "staggered" and len(seats) > 1:
+            batches = [seats[:-1], seats[-1:]]
+        else:
+            batches = [seats]
+
+        responses = {}
+        for batch in batches:
+            with ThreadPoolExecutor(max_workers=len(batch)) as pool:
+                for seat, result in pool.map(run, batch):
+                    responses[seat] = result
+
+    output = {
+        "responses": {seat: responses[seat] for seat in seats if seat in responses},
+        "mode": mode,
+        "elapsed_ms": int((time.monotonic() - start) * 1000),
+        "queue_wait_ms": max((r.get("queue_wait_ms", 0) for r in responses.values()), default=0),
+        "limits": limits,
+        "breakers": states or None,
+        "substitutions": substitutions or None,
+        "cassette": {"path": str(_cassette_dir(cassette)), "mode": cassette_mode} if cassette else None,
+    }
+    if quorum_info:
+        output["quorum"] = quorum_info
+    return output
+
+
+def cmd_dispatch(args):
+    """Run the advisor CLIs for each seat's prompt and collect their responses."""
     if not args.stdin:
-        err("--stdin required: pipe agent responses as JSON")
+        err("--stdin required: pipe pipeline output or a seat->prompt JSON object")
 
     data = read_stdin_json()
+    prompts = data.get("prompts", data) if isinstance(data, dict) else None
+    if not isinstance(prompts, dict) or not prompts:
+        err("no prompts found on stdin")
+
+    seat_agents = _seat_agents_from_args(list(prompts), args.agents_json)
+    options = _dispatch_options(args)
+    session_id = args.session_id or (data.get("session_id") if "prompts" in data else None)
+
+    emit(_dispatch_logic(
+        prompts, seat_agents,
+        mode=args.mode,
+        timeout=args.timeout,
+        quorum=args.quorum,
+        grace_ms=args.grace_ms,
+        session_id=session_id,
+        **options,
+    ))
+
+
+def _seat_agents_from_args(seats, agents_json=None):
+    """Default seat->CLI mapping overlaid with --agents-json; exits on unknown agents."""
+    seat_agents = _default_seat_agents(seats)
+    if agents_json:
+        try:
+            seat_agents.update(json.loads(agents_json))
+        except json.JSONDecodeError:
+            err("invalid JSON for --agents-json")
+    unknown = sorted({cli for cli in seat_agents.values() if cli not in provider_adapters()})
+    if unknown:
+        err(f"unknown agent(s): {', '.join(unknown)}")
+    return seat_agents
+
+
+def _dispatch_options(args):
+    """Cassette, replay speed and output cap from flags or their COUNCIL_* environment variables."""
+    cassette = args.cassette or os.environ.get("COUNCIL_CASSETTE")
+    cassette_mode = args.cassette_mode or os.environ.get("COUNCIL_CASSETTE_MODE") or ("replay" if cassette else None)
+    if cassette_mode and cassette_mode not in ("record", "replay"):
+        err(f"invalid cassette mode: {cassette_mode}")
+    if cassette_mode and not cassette:
+        err("--cassette required with --cassette-mode")
+    replay_speed = args.replay_speed
+    if replay_speed is None:
+        try:
+            replay_speed = float(os.environ.get("COUNCIL_REPLAY_SPEED", "1.0"))
+        except ValueError:
+            err("COUNCIL_REPLAY_SPEED must be a number")
+    max_bytes = args.max_bytes
+    if max_bytes is None:
+        try:
+            max_bytes = int(os.environ.get("COUNCIL_MAX_SEAT_BYTES", DEFAULT_MAX_SEAT_BYTES))
+        except ValueError:
+            err("COUNCIL_MAX_SEAT_BYTES must be an integer")
+    if args.quorum is not None and args.quorum < 1:
+        err("--quorum must be at least 1")
+    cassette_fallback = args.cassette_fallback or os.environ.get("COUNCIL_CASSETTE_FALLBACK", "") not in ("", "0")
+    return {"cassette": cassette, "cassette_mode": cassette_mode, "replay_speed": replay_speed, "max_bytes": max_bytes,
+            "cassette_fallback": cassette_fallback}
+
+
+# ---------------------------------------------------------------------------
+# Subcommand: finalize (post-dispatch: similarity + synthesis-prompt + session append)
+# ---------------------------------------------------------------------------
+
+TRUNCATED_NOTE = "\n\n[PARTIAL RESPONSE: this advisor was cut off (timeout or size limit) — weigh what is here, don't infer the rest]"
+
+
+def _finalize_logic(data, session_id, question, personas_json_str=None, labels_json_str=None, prior_context=None,
+                    agent_status=None, mode=None, compact=False, synthesis_input="full",
+                    digest_tokens=DEFAULT_DIGEST_TOKENS):
+    """Similarity + analysis + synthesis prompt + session append. Returns the finalize output dict (or {'error'})."""
+    # Accept `dispatch` output as-is: unwrap its seat results
+    dispatch_run = (data.get("quorum") or {}).get("run_id") if isinstance(data.get("quorum"), dict) else None
+    if isinstance(data.get("responses"), dict):
+        data = data["responses"]
+
+    # Seats that failed (circuit open, not on PATH, exit code, ...) said nothing:
+    # keep them out of similarity, analysis, drift and the synthesis prompt.
+    # A truncated seat that produced text still counts.
+    failed_seats = {}
+    for key, val in list(data.items()):
+        if isinstance(val, dict) and val.get("error") and not (val.get("truncated") and val.get("response")):
+            failed_seats[key] = {k: v for k, v in val.items() if k != "response"}
+    data = {key: val for key, val in data.items() if key not in failed_seats}
+    if not data:
+        return {"error": "every seat failed: " + ", ".join(f"{k} ({v['error']})" for k, v in failed_seats.items())}
 
     # Normalize: accept both plain text and {persona, response} objects
     responses = {}
+    synth_data = dict(data)
     for key, val in data.items():
         if isinstance(val, dict) and "response" in val:
             responses[key] = val["response"]
+            if val.get("truncated") and val["response"]:
+                # Partial output from a seat that timed out or hit the size cap
+                synth_data[key] = {**val, "response": val["response"] + TRUNCATED_NOTE}
         else:
             responses[key] = str(val)
 
     # 1. Similarity check
-    similarity_result = _similarity_logic(dict(responses))
+    with profile_stage("similarity"):
+        similarity_result = _similarity_logic(dict(responses))
+
+    # 2. Parse claim tags and recommendations per seat
+    with profile_stage("analysis"):
+        analysis = {agent: _analyze_response(text) for agent, text in responses.items()}
+
+    # Follow-up rounds: how far each seat moved since the previous round
+    drift = None
+    with profile_stage("drift"):
+        session, _ = load_session(session_id, resolve=False)
+        if session and session.get("rounds"):
+            drift = _position_drift(resolve_blobs(session["rounds"][-1]), responses, analysis)
+
+    # 3. Build synthesis prompt
+    with profile_stage("synthesis_prompt"):
+        synth_result = _synthesis_prompt_logic(
+            synth_data,  # original data (may have persona info), truncated seats flagged
+            question,
+            personas_json_str=personas_json_str,
+            labels_json_str=labels_json_str,
+            prior_context=prior_context,
+            agent_status=agent_status,
+            mode=mode,
+            compact=compact,
+            synthesis_input=synthesis_input,
+            digest_tokens=digest_tokens,
+            analysis=analysis,
+            drift=drift,
+        )
+
+    # 4. Session append — save raw responses (dispatch run metadata kept apart)
+    round_data = dict(data)  # raw advisor responses
+    dispatch_meta = {}
+    for key, val in data.items():
+        if isinstance(val, dict) and "agent" in val:
+            round_data[key] = val.get("response", "")
+            dispatch_meta[key] = {k: v for k, v in val.items() if k != "response"}
+    if dispatch_meta:
+        round_data["dispatch"] = dispatch_meta
+    if dispatch_run:
+        round_data["dispatch_run"] = dispatch_run  # quorum stragglers from this dispatch merge into this round
+    if failed_seats:
+        round_data["failed_seats"] = failed_seats
+    round_data["analysis"] = analysis
+    if drift:
+        round_data["drift"] = drift
+    append_result = _session_append_logic(session_id, round_data)
+    if "error" in append_result:
+        return append_result
+
+    output = {
+        "synthesis_prompt": synth_result["prompt"],
+        "similarity": similarity_result,
+        "analysis": analysis,
+        "session_updated": True,
+        "round": append_result["round"],
+    }
+    if "digest" in synth_result:
+        output["digest"] = synth_result["digest"]
+    if drift:
+        output["drift"] = drift
+    if failed_seats:
+        output["failed_seats"] = failed_seats
+    warnings = {key: val["warning"] for key, val in data.items() if isinstance(val, dict) and val.get("warning")}
+    if warnings:
+        output["warnings"] = warnings
+    return output
+
 
-    # 2. Build synthesis prompt
-    synth_result = _synthesis_prompt_logic(
-        dict(data),  # pass original data (may have persona info)
+def cmd_finalize(args):
+    """Single call replacing similarity + synthesis-prompt + session append."""
+    if not args.stdin:
+        err("--stdin required: pipe agent responses as JSON")
+    profiler = profile_start(args)
+
+    result = _finalize_logic(
+        read_stdin_json(),
+        args.session_id,
         args.question,
         personas_json_str=args.personas_json,
         labels_json_str=args.labels_json,
@@ -1385,32 +4706,521 @@ def cmd_finalize(args):
         agent_status=args.agent_status,
         mode=args.mode,
         compact=args.compact,
+        synthesis_input=args.synthesis_input,
+        digest_tokens=args.digest_tokens,
+    )
+    if "error" in result:
+        err(result["error"])
+    emit(profile_finish(args, profiler, result))
+
+
+# ---------------------------------------------------------------------------
+# Subcommand: run (pipeline + dispatch + finalize + synthesis + checkpoint)
+# ---------------------------------------------------------------------------
+
+DEFAULT_SYNTHESIS_TIMEOUT = 180
+COMPACT_DELIMITER = "===COMPACT==="
+
+
+def _synthesis_agent(requested, available):
+    """CLI that writes the briefing: flag, COUNCIL_SYNTHESIS_AGENT, config 'synthesis_agent', else claude."""
+    agent = requested or os.environ.get("COUNCIL_SYNTHESIS_AGENT") or load_config().get("synthesis_agent")
+    if agent in provider_adapters():
+        return agent
+    return "claude" if "claude" in available or not available else available[0]
+
+
+def _checkpoint_synthesis(session_id, round_num, full, compact, meta):
+    """Save the briefing into its round — the step SKILL.md otherwise does with a manual Write."""
+    data, filepath = load_session(session_id)
+    if not data:
+        return
+    with session_lock(filepath):
+        data, filepath = load_session(session_id)
+        rnd = data["rounds"][round_num - 1]
+        rnd["synthesis"] = full
+        if compact:
+            rnd["synthesis_compact"] = compact
+        rnd["synthesis_run"] = meta
+        write_session_file(filepath, data)
+
+
+def _run_logic(question, seat_agents_json=None, mode="parallel", timeout=None, quorum=None,
+               grace_ms=0, dispatch_options=None, synthesis_agent=None, synthesis_timeout=DEFAULT_SYNTHESIS_TIMEOUT,
+               synthesis_input="full", digest_tokens=DEFAULT_DIGEST_TOKENS, **pipeline_kwargs):
+    """One whole council: pipeline, dispatch, finalize, synthesis CLI, checkpoint. Returns the briefing."""
+    dispatch_options = dispatch_options or {}
+    start = time.monotonic()
+    if synthesis_agent and synthesis_agent not in provider_adapters():
+        return {"error": f"unknown synthesis agent: {synthesis_agent}"}
+
+    with profile_stage("pipeline"):
+        pipeline = _pipeline_logic(question, **pipeline_kwargs)
+    if "error" in pipeline:
+        return pipeline
+    session_id = pipeline["session_id"]
+    available = pipeline["agent_status"]["available"]
+
+    # Seats on the default mapping whose CLI isn't installed move to an
+    # installed one (live runs only; a cassette replay doesn't need the CLIs).
+    # Seats pinned with --agents-json keep their CLI and fail visibly instead.
+    seat_agents = _seat_agents_from_args(list(pipeline["prompts"]), seat_agents_json)
+    pinned = set(json.loads(seat_agents_json)) if seat_agents_json else set()
+    substitutions = {}
+    if dispatch_options.get("cassette_mode") != "replay" and available:
+        missing = {cli: "open" for cli in provider_adapters() if cli not in available}
+        movable, substitutions = _substitute_open_seats(
+            {seat: cli for seat, cli in seat_agents.items() if seat not in pinned}, missing, available)
+        seat_agents.update(movable)
+        for seat, original in substitutions.items():
+            telemetry_count("council_seat_substitutions_total", {"from": original, "to": seat_agents[seat]})
+
+    with profile_stage("dispatch"):
+        dispatched = _dispatch_logic(pipeline["prompts"], seat_agents, mode=mode, timeout=timeout,
+                                     quorum=quorum, grace_ms=grace_ms, session_id=session_id, **dispatch_options)
+
+    personas = {seat: info["persona"] for seat, info in pipeline["assignment"].items()}
+    adapters = provider_adapters()
+    labels = {seat: adapters[r["agent"]]["label"] for seat, r in dispatched["responses"].items() if r.get("agent") in adapters}
+    with profile_stage("finalize"):
+        finalized = _finalize_logic(
+            dispatched, session_id, question,
+            personas_json_str=json.dumps(personas),
+            labels_json_str=json.dumps(labels),
+            prior_context=pipeline_kwargs.get("prior_context"),
+            agent_status=pipeline["agent_status"],
+            mode=dispatched["mode"],
+            compact=True,
+            synthesis_input=synthesis_input,
+            digest_tokens=digest_tokens,
+        )
+    if "error" in finalized:
+        return finalized
+
+    agent = _synthesis_agent(synthesis_agent, available)
+    live = dispatch_options.get("cassette_mode") != "replay"
+    run_kwargs = {k: dispatch_options[k] for k in ("cassette", "cassette_mode", "replay_speed", "max_bytes", "cassette_fallback")
+                  if k in dispatch_options}
+    with profile_stage("synthesis"):
+        synth = _dispatch_seat("synthesis", agent, finalized["synthesis_prompt"],
+                               dict(run_kwargs, timeout=synthesis_timeout, limit=_provider_limit(agent)), live)
+
+    advisors = {seat: {k: r.get(k) for k in ("agent", "elapsed_ms", "error", "truncated", "substituted_from") if r.get(k) is not None}
+                for seat, r in dispatched["responses"].items()}
+    for seat in advisors:
+        advisors[seat]["persona"] = personas.get(seat)
+        if seat in substitutions:
+            advisors[seat].setdefault("substituted_from", substitutions[seat])
+    output = {
+        "session_id": session_id,
+        "round": finalized["round"],
+        "advisors": advisors,
+        "substitutions": {seat: {"from": original, "to": seat_agents[seat]} for seat, original in substitutions.items()},
+        "pending": (dispatched.get("quorum") or {}).get("pending", []),
+        "synthesis_agent": agent,
+    }
+
+    if synth["error"] or not synth["response"]:
+        # Hand the prompt back so the caller can still synthesize it itself
+        output.update({"briefing": None, "synthesis_error": synth["error"] or "empty response",
+                       "synthesis_prompt": finalized["synthesis_prompt"]})
+    else:
+        full, sep, compact = synth["response"].partition(COMPACT_DELIMITER)
+        full, compact = full.strip(), compact.strip() if sep else None
+        with profile_stage("checkpoint"):
+            _checkpoint_synthesis(session_id, finalized["round"], full, compact,
+                                  {"agent": agent, "elapsed_ms": synth["elapsed_ms"], "truncated": synth["truncated"]})
+        output["briefing"] = {"full": full, "compact": compact}
+
+    output["elapsed_ms"] = int((time.monotonic() - start) * 1000)
+    return output
+
+
+def cmd_run(args):
+    """Whole council in one process; prints only the briefing and run summary."""
+    profiler = profile_start(args)
+    result = _run_logic(
+        args.question,
+        seat_agents_json=args.agents_json,
+        mode=args.mode,
+        timeout=args.timeout,
+        quorum=args.quorum,
+        grace_ms=args.grace_ms,
+        dispatch_options=_dispatch_options(args),
+        synthesis_agent=args.synthesis_agent,
+        synthesis_timeout=args.synthesis_timeout,
+        synthesis_input=args.synthesis_input,
+        digest_tokens=args.digest_tokens,
+        **_pipeline_kwargs(args),
     )
+    if "error" in result:
+        err(result["error"])
+    emit(profile_finish(args, profiler, result))
 
-    # 3. Session append — save raw responses
-    round_data = dict(data)  # raw advisor responses
-    append_result = _session_append_logic(args.session_id, round_data)
-    if "error" in append_result:
-        err(append_result["error"])
 
-    emit({
-        "synthesis_prompt": synth_result["prompt"],
-        "similarity": similarity_result,
-        "session_updated": True,
-        "round": append_result["round"],
-    })
+# ---------------------------------------------------------------------------
+# Subcommand: loadtest (concurrent councils against fake advisor CLIs)
+# ---------------------------------------------------------------------------
+
+LATENCY_KINDS = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2, "exp": 1}
+DEFAULT_FAKE = {"latency": "lognormal:1500:0.5", "fail_rate": 0.0, "response_bytes": 2000}
+
+# A stand-in advisor CLI. Accepts the built-in adapters' argv (prompt on
+# stdin or after -p), sleeps a sampled latency, then fails or prints a
+# tagged response of about response_bytes.
+FAKE_ADVISOR = r'''#!__PYTHON__
+import hashlib, math, random, sys, time
+CONF = __CONF__
+if "--version" in sys.argv[1:]:
+    print(CONF["name"] + " 0.0.0-loadtest")
+    sys.exit(0)
+prompt = sys.argv[sys.argv.index("-p") + 1] if "-p" in sys.argv[:-1] else sys.stdin.read()
+seed = CONF["seed"]
+rng = random.Random(None if seed is None else f"{seed}:{CONF['name']}:{hashlib.sha256(prompt.encode()).hexdigest()}")
+kind, a, b = (CONF["latency"] + [0.0])[:3]
+ms = {"fixed": lambda: a, "uniform": lambda: rng.uniform(a, b), "normal": lambda: rng.gauss(a, b),
+      "lognormal": lambda: a * math.exp(rng.gauss(0, b)), "exp": lambda: rng.expovariate(1.0 / a) if a else 0}[kind]()
+time.sleep(max(0.0, ms) / 1000.0)
+if rng.random() < CONF["fail_rate"]:
+    sys.stderr.write(CONF["name"] + ": simulated provider failure\n")
+    sys.exit(1)
+words = "cache queue latency shard replica budget rollout schema index lock retry backoff tenant cost migration".split()
+lines = [f"[ANCHORED] {CONF['name']} read the question ({len(prompt)} chars of prompt).",
+         f"[INFERRED] The {rng.choice(words)} path dominates once load grows."]
+size = sum(len(line) + 1 for line in lines)
+while size < CONF["response_bytes"]:
+    line = "[SPECULATIVE] " + " ".join(rng.choice(words) for _ in range(12)) + "."
+    lines.append(line)
+    size += len(line) + 1
+lines.append(f"RECOMMENDATION: prioritize the {rng.choice(words)} work first.")
+print("\n".join(lines))
+'''
+
+
+def _parse_latency(spec):
+    """'kind:a[:b]' (ms) -> [kind, a, b]. Kinds: fixed:MS, uniform:LO:HI, normal:MEAN:SD, lognormal:MEDIAN:SIGMA, exp:MEAN."""
+    kind, *params = str(spec).split(":")
+    if kind not in LATENCY_KINDS or len(params) != LATENCY_KINDS[kind]:
+        raise ValueError(f"invalid latency {spec!r}: use fixed:MS, uniform:LO:HI, normal:MEAN:SD, lognormal:MEDIAN:SIGMA or exp:MEAN")
+    try:
+        values = [float(p) for p in params]
+    except ValueError:
+        raise ValueError(f"invalid latency {spec!r}: parameters must be numbers")
+    if any(v < 0 for v in values):
+        raise ValueError(f"invalid latency {spec!r}: parameters must be >= 0")
+    return [kind, *values]
+
+
+def _fake_profiles(defaults, overrides=None):
+    """Per-provider fake settings: defaults overlaid with overrides[cli]. Raises ValueError."""
+    overrides = overrides or {}
+    unknown = sorted(set(overrides) - set(BUILTIN_ADAPTERS))
+    if unknown:
+        raise ValueError(f"no fake for: {', '.join(unknown)} (fakes stand in for {', '.join(BUILTIN_ADAPTERS)})")
+    profiles = {}
+    for cli in BUILTIN_ADAPTERS:
+        conf = {**defaults, **(overrides.get(cli) or {})}
+        fail_rate = float(conf["fail_rate"])
+        if not 0 <= fail_rate <= 1:
+            raise ValueError(f"{cli}: fail_rate must be between 0 and 1")
+        profiles[cli] = {"latency": _parse_latency(conf["latency"]), "fail_rate": fail_rate,
+                         "response_bytes": max(0, int(conf["response_bytes"]))}
+    return profiles
+
+
+def _install_fakes(bin_dir, profiles, seed=None):
+    """Write one executable fake per provider into bin_dir."""
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    for cli, conf in profiles.items():
+        script = FAKE_ADVISOR.replace("__PYTHON__", sys.executable).replace(
+            "__CONF__", repr({**conf, "name": cli, "seed": seed}))
+        path = bin_dir / cli
+        path.write_text(script)
+        path.chmod(0o755)
+
+
+def _percentiles(values):
+    """Nearest-rank p50/p90/p95/p99 plus mean and max, or None for no values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    pick = lambda q: ordered[min(len(ordered) - 1, max(0, int(math.ceil(q * len(ordered))) - 1))]
+    return {"p50": pick(0.5), "p90": pick(0.9), "p95": pick(0.95), "p99": pick(0.99),
+            "max": ordered[-1], "mean": round(sum(ordered) / len(ordered), 1), "n": len(ordered)}
+
+
+def _series_label(key, label):
+    m = re.search(rf'{label}="([^"]*)"', key)
+    return m.group(1) if m else ""
+
+
+def _lock_contention(metrics):
+    """Per-lock acquisitions, contended waits and wait time from a metrics.json snapshot."""
+    locks = {}
+    for key, n in metrics.get("counters", {}).get("council_lock_acquisitions_total", {}).items():
+        locks[_series_label(key, "lock")] = {"acquisitions": n, "contended": 0, "wait_ms_total": 0.0}
+    waits = metrics.get("histograms", {}).get("council_lock_wait_seconds", {})
+    for key, entry in waits.get("series", {}).items():
+        lock = locks.setdefault(_series_label(key, "lock"), {"acquisitions": 0, "contended": 0, "wait_ms_total": 0.0})
+        lock["contended"] = entry["count"]
+        lock["wait_ms_total"] = round(entry["sum"] * 1000, 1)
+    for lock in locks.values():
+        lock["contended_ratio"] = round(lock["contended"] / lock["acquisitions"], 3) if lock["acquisitions"] else None
+        lock["wait_ms_mean"] = round(lock["wait_ms_total"] / lock["contended"], 1) if lock["contended"] else 0.0
+    return locks
+
+
+def _loadtest_logic(runs=20, concurrency=None, sessions=None, seats=3, profiles=None, seed=None, mode="parallel",
+                    timeout=None, quorum=None, grace_ms=0, store=None, keep=False):
+    """Drive `runs` concurrent pipeline -> dispatch -> finalize councils through the CLI against fake advisors.
+
+    Every step is a separate council_cli process with HOME pointed at a temp
+    store and the fakes first on PATH, so file locks, provider slots and
+    the session/metrics files are exercised exactly as concurrent windows
+    would. With fewer sessions than runs, the extra runs append rounds to
+    the same sessions concurrently. Returns the report dict.
+    """
+    concurrency = concurrency or runs
+    sessions = min(sessions or runs, runs)
+    root = Path(store).expanduser() if store else Path(tempfile.mkdtemp(prefix="council-loadtest-"))
+    home, bin_dir = root / "home", root / "bin"
+    home.mkdir(parents=True, exist_ok=True)
+    _install_fakes(bin_dir, profiles or _fake_profiles(DEFAULT_FAKE), seed)
+    env = {k: v for k, v in os.environ.items() if not k.startswith("COUNCIL_")}
+    env.update(HOME=str(home), PATH=f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}")
+    cli_path = str(Path(__file__).resolve())
+
+    def call(argv, payload=None):
+        start = time.monotonic()
+        proc = subprocess.run([sys.executable, cli_path, "--compact-json", *argv], input=payload,
+                              capture_output=True, text=True, env=env)
+        elapsed_ms = int((time.monotonic() - start) * 1000)
+        if proc.returncode != 0:
+            lines = proc.stderr.strip().splitlines()
+            raise RuntimeError(f"{argv[0]}: {lines[-1] if lines else f'exit code {proc.returncode}'}")
+        return json.loads(proc.stdout), elapsed_ms
+
+    dispatch_flags = ["--mode", mode]
+    if timeout is not None:
+        dispatch_flags += ["--timeout", str(timeout)]
+    if quorum:
+        dispatch_flags += ["--quorum", str(quorum), "--grace-ms", str(grace_ms)]
+    created = [None] * sessions
+    ready = [threading.Event() for _ in range(sessions)]
+
+    def one(i):
+        slot = i % sessions
+        question = f"Load test council {slot}: should service {slot} move its {['cache', 'queue', 'index'][slot % 3]} to a shared cluster?"
+        record = {"run": i, "session_slot": slot, "stages_ms": {}, "seats": [], "error": None}
+        start = time.monotonic()
+        try:
+            if i < sessions:
+                try:
+                    created[slot], record["stages_ms"]["pipeline"] = call(
+                        ["pipeline", "--question", question, "--seats", str(seats), "--grounding", "off"])
+                finally:
+                    ready[slot].set()
+            else:
+                ready[slot].wait()
+            pipeline = created[slot]
+            if pipeline is None:
+                raise RuntimeError("pipeline: session was not created")
+            session_id = pipeline["session_id"]
+            record["session_id"] = session_id
+            dispatched, record["stages_ms"]["dispatch"] = call(
+                ["dispatch", "--stdin", "--session-id", session_id, *dispatch_flags],
+                json.dumps({"prompts": pipeline["prompts"], "session_id": session_id}))
+            record["seats"] = [{k: r.get(k) for k in ("agent", "elapsed_ms", "queue_wait_ms", "error", "timed_out")}
+                               for r in dispatched["responses"].values()]
+            record["pending"] = len((dispatched.get("quorum") or {}).get("pending", []))
+            personas = {seat: info["persona"] for seat, info in pipeline["assignment"].items()}
+            finalized, record["stages_ms"]["finalize"] = call(
+                ["finalize", "--stdin", "--session-id", session_id, "--question", question,
+                 "--personas-json", json.dumps(personas), "--agent-status", "cached", "--mode", dispatched["mode"]],
+                json.dumps(dispatched))
+            record["round"] = finalized["round"]
+        except (RuntimeError, json.JSONDecodeError, KeyError) as e:
+            record["error"] = str(e)
+        record["elapsed_ms"] = int((time.monotonic() - start) * 1000)
+        return record
+
+    start = time.monotonic()
+    # pool.map submits in order, so every session's creator starts before the runs waiting on it
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        records = list(pool.map(one, range(runs)))
+    elapsed = time.monotonic() - start
+
+    # Quorum stragglers finish in detached processes; each bumps the late-arrival
+    # counter after saving itself, so wait for the counter to cover them
+    council_dir = home / ".claude" / "council"
+    pending = sum(r.get("pending", 0) for r in records)
+
+    def read_metrics():
+        try:
+            return json.loads((council_dir / "metrics.json").read_text())
+        except (OSError, json.JSONDecodeError):
+            return {}
+    metrics = read_metrics()
+    deadline = time.monotonic() + 2 * (timeout or DEFAULT_SEAT_TIMEOUT) + 5
+    while pending and time.monotonic() < deadline:
+        if sum(metrics.get("counters", {}).get("council_late_arrivals_total", {}).values()) >= pending:
+            break
+        time.sleep(0.25)
+        metrics = read_metrics()
+
+    # Lost writes: every successful finalize must have left its round in the
+    # session file, and every straggler its late arrival
+    stored, late_stored = {}, 0
+    for f in [*(council_dir / "sessions").glob("*/*/*.json"), *(council_dir / "sessions").glob("*.json")]:
+        try:
+            data = read_session(f)
+        except (OSError, json.JSONDecodeError):
+            continue
+        stored[data.get("id", f.stem)] = [r.get("round") for r in data.get("rounds", [])]
+        late_stored += len(data.get("late_arrivals", [])) + sum(len(r.get("late_arrivals", {})) for r in data.get("rounds", []))
+    expected, claimed = {}, {}
+    for r in records:
+        if r.get("round") is not None:
+            expected[r["session_id"]] = expected.get(r["session_id"], 0) + 1
+            claimed.setdefault(r["session_id"], []).append(r["round"])
+    lost = sum(max(0, n - len(stored.get(sid, []))) for sid, n in expected.items())
+    duplicate = sum(len(rounds) - len(set(rounds)) for rounds in claimed.values())
+    counters = metrics.get("counters", {})
+    rounds_counted = sum(counters.get("council_rounds_total", {}).values())
+
+    ok = [r for r in records if not r["error"]]
+    errors = {}
+    for r in records:
+        if r["error"]:
+            errors[r["error"]] = errors.get(r["error"], 0) + 1
+    seat_results = [s for r in records for s in r["seats"]]
+    by_agent = {}
+    for s in seat_results:
+        agent = by_agent.setdefault(s["agent"], {"seats": 0, "failed": 0, "timed_out": 0})
+        agent["seats"] += 1
+        agent["failed"] += bool(s["error"])
+        agent["timed_out"] += bool(s["timed_out"])
+    report = {
+        "config": {"runs": runs, "concurrency": concurrency, "sessions": sessions, "seats": seats, "mode": mode,
+                   "timeout": timeout, "quorum": quorum, "seed": seed, "fakes": profiles},
+        "elapsed_s": round(elapsed, 2),
+        "runs": {"ok": len(ok), "failed": runs - len(ok), "errors": errors},
+        "throughput": {"runs_per_s": round(len(ok) / elapsed, 3) if elapsed else None,
+                       "runs_per_min": round(len(ok) * 60 / elapsed, 1) if elapsed else None},
+        "latency_ms": {
+            "run": _percentiles([r["elapsed_ms"] for r in ok]),
+            **{stage: _percentiles([r["stages_ms"][stage] for r in records if stage in r["stages_ms"]])
+               for stage in ("pipeline", "dispatch", "finalize")},
+            "seat": _percentiles([s["elapsed_ms"] for s in seat_results if not s["error"]]),
+        },
+        "seats": {"total": len(seat_results), "failed": sum(1 for s in seat_results if s["error"]),
+                  "pending": pending, "by_agent": by_agent},
+        "writes": {
+            "sessions_created": sum(1 for c in created if c),
+            "rounds_expected": sum(expected.values()),
+            "rounds_stored": sum(len(stored.get(sid, [])) for sid in expected),
+            "lost": lost,
+            "duplicate_round_numbers": duplicate,
+            "metrics_rounds_counted": rounds_counted,
+            "metrics_lost_increments": max(0, sum(expected.values()) - rounds_counted),
+            "late_arrivals_expected": pending,
+            "late_arrivals_stored": late_stored,
+            "late_arrivals_lost": max(0, pending - late_stored),
+        },
+        "contention": {
+            "locks": _lock_contention(metrics),
+            "provider_queue_wait_ms": _percentiles([s["queue_wait_ms"] for s in seat_results if s.get("queue_wait_ms")]),
+            "breaker_trips": sum(counters.get("council_breaker_trips_total", {}).values()),
+            "seat_substitutions": sum(counters.get("council_seat_substitutions_total", {}).values()),
+        },
+    }
+    if store or keep:
+        report["store"] = str(root)
+    else:
+        shutil.rmtree(root, ignore_errors=True)
+    return report
+
+
+def cmd_loadtest(args):
+    """Run concurrent councils against fake advisor CLIs and report throughput, latency, lost writes and contention."""
+    if args.runs < 1 or (args.concurrency is not None and args.concurrency < 1):
+        err("--runs and --concurrency must be at least 1")
+    if args.sessions is not None and args.sessions < 1:
+        err("--sessions must be at least 1")
+    overrides = None
+    if args.fakes_json:
+        try:
+            overrides = json.loads(args.fakes_json)
+        except json.JSONDecodeError:
+            err("invalid JSON for --fakes-json")
+        if not isinstance(overrides, dict):
+            err("--fakes-json must be an object keyed by provider")
+    defaults = {"latency": args.latency, "fail_rate": args.fail_rate, "response_bytes": args.response_bytes}
+    try:
+        profiles = _fake_profiles(defaults, overrides)
+    except (ValueError, TypeError) as e:
+        err(str(e))
+    emit(_loadtest_logic(
+        runs=args.runs,
+        concurrency=args.concurrency,
+        sessions=args.sessions,
+        seats=args.seats,
+        profiles=profiles,
+        seed=args.seed,
+        mode=args.mode,
+        timeout=args.timeout,
+        quorum=args.quorum,
+        grace_ms=args.grace_ms,
+        store=args.store,
+        keep=args.keep,
+    ))
 
 
 # ---------------------------------------------------------------------------
 # Main: argparse setup
 # ---------------------------------------------------------------------------
 
+def add_pipeline_arguments(p):
+    """Flags shared by pipeline and run."""
+    p.add_argument("--question", required=True)
+    p.add_argument("--topic", default=None)
+    p.add_argument("--personas", default=None, help="Comma-separated persona overrides")
+    p.add_argument("--fun", action="store_true")
+    p.add_argument("--seats", type=int, default=3)
+    p.add_argument("--prior-context", default=None)
+    p.add_argument("--context", default=None, help="Codebase or background context for prompts")
+    p.add_argument("--context-file", action="append", default=None, help="File to include as context (repeatable)")
+    p.add_argument("--context-glob", action="append", default=None, help="Glob of files to include as context, ** allowed (repeatable)")
+    p.add_argument("--context-budget", type=int, default=None, help=f"Byte budget for file context (default {CONTEXT_BUDGET})")
+    p.add_argument("--context-tokens", type=int, default=None, help="Token budget for file context (overrides --context-budget)")
+    p.add_argument("--grounding-facts", default=None, help="Verified current-state facts to inject as authoritative context")
+    p.add_argument("--grounding", choices=["auto", "off"], default=None, help="auto: cache --grounding-facts and attach fresh cached facts for the question/topic. Env: COUNCIL_GROUNDING")
+    p.add_argument("--grounding-source", action="append", default=None, help="Source URL/path for --grounding-facts, kept with the cached entry (repeatable)")
+    p.add_argument("--labels-json", default=None, help="JSON map of agent->label")
+    p.add_argument("--prompt-layout", choices=PROMPT_LAYOUTS, default=None, help="classic (role first) or cache (shared blocks first, persona last). Env: COUNCIL_PROMPT_LAYOUT")
+
+
+def add_dispatch_arguments(p):
+    """Flags shared by dispatch and run."""
+    p.add_argument("--agents-json", default=None, help="JSON map of seat->agent CLI (default: codex, gemini, claude in order)")
+    p.add_argument("--mode", choices=["parallel", "staggered", "sequential"], default="parallel")
+    p.add_argument("--timeout", type=int, default=None, help=f"Per-seat timeout in seconds (default: the adapter's timeout, else {DEFAULT_SEAT_TIMEOUT})")
+    p.add_argument("--cassette", default=None, help="Cassette name (under ~/.claude/council/cassettes) or directory path. Env: COUNCIL_CASSETTE")
+    p.add_argument("--cassette-mode", choices=["record", "replay"], default=None, help="Record live calls or replay recorded ones. Env: COUNCIL_CASSETTE_MODE")
+    p.add_argument("--cassette-fallback", action="store_true", help="On replay, use the seat's latest recording when no recording matches the prompt exactly (flagged with a warning). Env: COUNCIL_CASSETTE_FALLBACK=1")
+    p.add_argument("--replay-speed", type=float, default=None, help="Scale recorded latency on replay (0 = instant). Env: COUNCIL_REPLAY_SPEED")
+    p.add_argument("--max-bytes", type=int, default=None, help=f"Per-seat stdout cap; longer output is cut and marked truncated (default {DEFAULT_MAX_SEAT_BYTES}). Env: COUNCIL_MAX_SEAT_BYTES")
+    p.add_argument("--quorum", type=int, default=None, help="Return once K seats have answered (plus --grace-ms); stragglers are saved as late arrivals")
+    p.add_argument("--grace-ms", type=int, default=0, help="With --quorum: extra wait after the K-th answer for the rest")
+
+
 def main():
     parser = argparse.ArgumentParser(
         prog="council_cli",
         description="CLI helper for the claude-council skill",
     )
     parser.add_argument("--version", action="version", version=f"council_cli {__version__}")
+    parser.add_argument("--compact-json", action="store_true", help="Emit single-line JSON instead of indented. Env: COUNCIL_COMPACT_JSON=1")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # parse
@@ -1441,6 +5251,8 @@ def main():
     p_prompt.add_argument("--other-positions", default=None)
     p_prompt.add_argument("--mediator-synthesis", default=None)
     p_prompt.add_argument("--user-followup", default=None)
+    p_prompt.add_argument("--layout", choices=PROMPT_LAYOUTS, default=None, help="Prompt layout: classic (role first) or cache (shared blocks first, persona last). Env: COUNCIL_PROMPT_LAYOUT")
+    p_prompt.add_argument("--session-id", default=None, help="Follow-up: reuse the session's layout and round-1 prompt prefix")
 
     # synthesis-prompt
     p_synth = subparsers.add_parser("synthesis-prompt", help="Build synthesis prompt")
@@ -1448,14 +5260,16 @@ def main():
     p_synth.add_argument("--personas-json", default=None, help="JSON map of agent->persona")
     p_synth.add_argument("--labels-json", default=None, help="JSON map of agent->label (e.g. 'Claude', 'Codex (OpenAI)')")
     p_synth.add_argument("--prior-context", default=None)
-    p_synth.add_argument("--agent-status", default=None, help="JSON agent status from 'agents' subcommand for briefing header")
+    p_synth.add_argument("--agent-status", default=None, help="JSON agent status from 'agents' subcommand for briefing header, or 'cached' to read the health cache")
     p_synth.add_argument("--mode", default=None, help="Dispatch mode (parallel/staggered/sequential) for briefing header")
     p_synth.add_argument("--compact", action="store_true", help="Include compact format delimited by ===COMPACT===")
+    p_synth.add_argument("--synthesis-input", choices=["full", "digest"], default="full", help="Paste full advisor responses or a local digest (recommendation, tagged claims, top sentences)")
+    p_synth.add_argument("--digest-tokens", type=int, default=DEFAULT_DIGEST_TOKENS, help="Token budget for all digested responses combined")
     p_synth.add_argument("--stdin", action="store_true")
 
     # session (with sub-actions)
     p_session = subparsers.add_parser("session", help="Session CRUD operations")
-    p_session.add_argument("session_action", choices=["create", "load", "append", "list", "rate", "outcome"])
+    p_session.add_argument("session_action", choices=["create", "load", "append", "list", "rate", "outcome", "archive", "migrate", "late"])
     p_session.add_argument("--id", default=None)
     p_session.add_argument("--question", default=None)
     p_session.add_argument("--topic", default=None)
@@ -1465,18 +5279,30 @@ def main():
     p_session.add_argument("--rating", type=int, choices=[1, 2, 3, 4, 5], default=None)
     p_session.add_argument("--status", default=None)
     p_session.add_argument("--note", default=None)
+    p_session.add_argument("--fields", default=None, help="load: comma-separated top-level keys to return; rounds.X selects keys inside each round")
+    p_session.add_argument("--rounds", default=None, help="load: which rounds to return — all, last:N, N or N-M")
+    p_session.add_argument("--ndjson", action="store_true", help="list: stream one JSON session summary per line")
+    p_session.add_argument("--all-unarchived", action="store_true", help="archive: export every session not yet archived")
+    p_session.add_argument("--resynthesize", action="store_true", help="late: also return a synthesis prompt that includes the late arrivals")
     p_session.add_argument("--stdin", action="store_true")
 
     # historian
     p_hist = subparsers.add_parser("historian", help="Find related past sessions")
     p_hist.add_argument("--question", required=True)
 
+    # search
+    p_search = subparsers.add_parser("search", help="Full-text search over past sessions")
+    p_search.add_argument("--query", required=True)
+    p_search.add_argument("--limit", type=int, default=10)
+    p_search.add_argument("--any", action="store_true", help="Match any term instead of all terms")
+
     # similarity
     p_sim = subparsers.add_parser("similarity", help="Check response similarity")
     p_sim.add_argument("--stdin", action="store_true")
 
     # agents (fast PATH check)
-    subparsers.add_parser("agents", help="Check which agent CLIs are on PATH")
+    p_agents = subparsers.add_parser("agents", help="Check which agent CLIs are on PATH")
+    p_agents.add_argument("--refresh", action="store_true", help="Ignore the health cache and re-check PATH")
 
     # doctor (thorough health check)
     subparsers.add_parser("doctor", help="Run thorough health check on all components")
@@ -1484,17 +5310,49 @@ def main():
     # tip
     subparsers.add_parser("tip", help="Return a random tip")
 
+    # warmup (SessionStart background cache refresh)
+    p_warmup = subparsers.add_parser("warmup", help="Refresh session/search indexes and the agent health cache")
+    p_warmup.add_argument("--budget-ms", type=int, default=15000, help="Stop starting new steps after this long")
+    p_warmup.add_argument("--force", action="store_true", help="Run even if a warm-up ran in the last minute")
+
+    # blobs
+    p_blobs = subparsers.add_parser("blobs", help="Blob store (large session text) stats and garbage collection")
+    p_blobs.add_argument("blobs_action", choices=["stats", "gc"])
+    p_blobs.add_argument("--dry-run", action="store_true", help="gc: report what would be removed")
+    p_blobs.add_argument("--rebuild", action="store_true", help="gc: rebuild the reference table from the session files first")
+
+    # grounding
+    p_grounding = subparsers.add_parser("grounding", help="Cache of verified grounding facts (get/put)")
+    p_grounding.add_argument("grounding_action", choices=["get", "put"])
+    p_grounding.add_argument("--query", default=None, help="The question or search the facts answer")
+    p_grounding.add_argument("--topic", default=None)
+    p_grounding.add_argument("--facts", default=None, help="put: the verified facts")
+    p_grounding.add_argument("--source", action="append", default=None, help="put: source URL/path (repeatable)")
+    p_grounding.add_argument("--ttl", type=int, default=None, help=f"put: seconds the facts stay fresh (default {GROUNDING_TTL}). Env: COUNCIL_GROUNDING_TTL")
+    p_grounding.add_argument("--include-stale", action="store_true", help="get: include expired entries (marked fresh: false)")
+    p_grounding.add_argument("--stdin", action="store_true", help="put: read the facts from stdin")
+
+    # metrics
+    p_metrics = subparsers.add_parser("metrics", help="Export council telemetry (OpenMetrics/Prometheus text)")
+    p_metrics.add_argument("--format", choices=["openmetrics", "prometheus", "json"], default=None,
+                           help="Exposition format (default: openmetrics; prometheus with --textfile)")
+    p_metrics.add_argument("--textfile", default=None, help="Write atomically to this path (e.g. node_exporter textfile collector dir/council.prom)")
+
     # pipeline (pre-dispatch: historian + assign + prompts + session create)
     p_pipeline = subparsers.add_parser("pipeline", help="Pre-dispatch: historian + assign + prompts + session create")
-    p_pipeline.add_argument("--question", required=True)
-    p_pipeline.add_argument("--topic", default=None)
-    p_pipeline.add_argument("--personas", default=None, help="Comma-separated persona overrides")
-    p_pipeline.add_argument("--fun", action="store_true")
-    p_pipeline.add_argument("--seats", type=int, default=3)
-    p_pipeline.add_argument("--prior-context", default=None)
-    p_pipeline.add_argument("--context", default=None, help="Codebase or background context for prompts")
-    p_pipeline.add_argument("--grounding-facts", default=None, help="Verified current-state facts to inject as authoritative context")
-    p_pipeline.add_argument("--labels-json", default=None, help="JSON map of agent->label")
+    add_pipeline_arguments(p_pipeline)
+    p_pipeline.add_argument("--profile", action="store_true", help="Add per-stage 'timings' to the output. Env: COUNCIL_PROFILE=1")
+    p_pipeline.add_argument("--profile-out", default=None, help="Also dump cProfile stats to this file. Env: COUNCIL_PROFILE_OUT")
+
+    # dispatch (run advisor CLIs, optionally recording/replaying cassettes)
+    p_dispatch = subparsers.add_parser("dispatch", help="Run advisor CLIs for each seat's prompt")
+    add_dispatch_arguments(p_dispatch)
+    p_dispatch.add_argument("--session-id", default=None, help="Session for late arrivals (default: session_id from pipeline output)")
+    p_dispatch.add_argument("--stdin", action="store_true")
+
+    # dispatch-seat (internal: one detached quorum seat)
+    p_dseat = subparsers.add_parser("dispatch-seat", help="Internal: run one seat for dispatch --quorum")
+    p_dseat.add_argument("--spec", required=True)
 
     # finalize (post-dispatch: similarity + synthesis-prompt + session append)
     p_final = subparsers.add_parser("finalize", help="Post-dispatch: similarity + synthesis-prompt + session append")
@@ -1502,13 +5360,48 @@ def main():
     p_final.add_argument("--question", required=True)
     p_final.add_argument("--personas-json", required=True, help="JSON map of agent->persona")
     p_final.add_argument("--labels-json", default=None, help="JSON map of agent->label")
-    p_final.add_argument("--agent-status", default=None, help="JSON agent status for briefing header")
+    p_final.add_argument("--agent-status", default=None, help="JSON agent status for briefing header, or 'cached' to read the health cache")
     p_final.add_argument("--mode", default=None, help="Dispatch mode for briefing header")
     p_final.add_argument("--compact", action="store_true", help="Include compact format delimited by ===COMPACT===")
     p_final.add_argument("--prior-context", default=None)
+    p_final.add_argument("--synthesis-input", choices=["full", "digest"], default="full", help="Paste full advisor responses or a local digest (recommendation, tagged claims, top sentences)")
+    p_final.add_argument("--digest-tokens", type=int, default=DEFAULT_DIGEST_TOKENS, help="Token budget for all digested responses combined")
+    p_final.add_argument("--profile", action="store_true", help="Add per-stage 'timings' to the output. Env: COUNCIL_PROFILE=1")
+    p_final.add_argument("--profile-out", default=None, help="Also dump cProfile stats to this file. Env: COUNCIL_PROFILE_OUT")
     p_final.add_argument("--stdin", action="store_true")
 
+    # run (pipeline + dispatch + finalize + synthesis + checkpoint)
+    p_run = subparsers.add_parser("run", help="Whole council in one call: returns the final briefing")
+    add_pipeline_arguments(p_run)
+    add_dispatch_arguments(p_run)
+    p_run.add_argument("--synthesis-agent", default=None, help="CLI that writes the briefing (default: claude if available). Env: COUNCIL_SYNTHESIS_AGENT")
+    p_run.add_argument("--synthesis-timeout", type=int, default=DEFAULT_SYNTHESIS_TIMEOUT, help="Synthesis timeout in seconds")
+    p_run.add_argument("--synthesis-input", choices=["full", "digest"], default="full")
+    p_run.add_argument("--digest-tokens", type=int, default=DEFAULT_DIGEST_TOKENS)
+    p_run.add_argument("--profile", action="store_true", help="Add per-stage 'timings' to the output. Env: COUNCIL_PROFILE=1")
+    p_run.add_argument("--profile-out", default=None, help="Also dump cProfile stats to this file. Env: COUNCIL_PROFILE_OUT")
+
+    # loadtest
+    p_load = subparsers.add_parser("loadtest", help="Concurrent pipeline/dispatch/finalize runs against fake advisor CLIs")
+    p_load.add_argument("--runs", type=int, default=20, help="Councils to run")
+    p_load.add_argument("--concurrency", type=int, default=None, help="Runs in flight at once (default: all)")
+    p_load.add_argument("--sessions", type=int, default=None, help="Distinct sessions; fewer than --runs makes runs append rounds to shared sessions concurrently (default: one per run)")
+    p_load.add_argument("--seats", type=int, default=3)
+    p_load.add_argument("--latency", default=DEFAULT_FAKE["latency"], help="Fake advisor latency in ms: fixed:MS, uniform:LO:HI, normal:MEAN:SD, lognormal:MEDIAN:SIGMA or exp:MEAN")
+    p_load.add_argument("--fail-rate", type=float, default=DEFAULT_FAKE["fail_rate"], help="Fraction of fake advisor calls that exit non-zero")
+    p_load.add_argument("--response-bytes", type=int, default=DEFAULT_FAKE["response_bytes"], help="Approximate size of each fake response")
+    p_load.add_argument("--fakes-json", default=None, help='Per-provider overrides, e.g. {"gemini": {"latency": "uniform:2000:9000", "fail_rate": 0.2}}')
+    p_load.add_argument("--seed", default=None, help="Make fake latency, failures and text deterministic per prompt")
+    p_load.add_argument("--mode", choices=["parallel", "staggered", "sequential"], default="parallel")
+    p_load.add_argument("--timeout", type=int, default=None, help="Per-seat dispatch timeout in seconds")
+    p_load.add_argument("--quorum", type=int, default=None, help="Dispatch with --quorum K")
+    p_load.add_argument("--grace-ms", type=int, default=0)
+    p_load.add_argument("--store", default=None, help="Directory for the fake PATH and session store (kept afterwards; default: a temp dir that is removed)")
+    p_load.add_argument("--keep", action="store_true", help="Keep the temp store and report its path")
+
     args = parser.parse_args()
+    if args.compact_json:
+        OUTPUT["compact"] = True
 
     dispatch = {
         "parse": cmd_parse,
@@ -1518,15 +5411,27 @@ def main():
         "synthesis-prompt": cmd_synthesis_prompt,
         "session": cmd_session,
         "historian": cmd_historian,
+        "search": cmd_search,
         "similarity": cmd_similarity,
         "agents": cmd_agents,
         "doctor": cmd_doctor,
         "tip": cmd_tip,
+        "warmup": cmd_warmup,
+        "metrics": cmd_metrics,
+        "grounding": cmd_grounding,
+        "blobs": cmd_blobs,
         "pipeline": cmd_pipeline,
+        "dispatch": cmd_dispatch,
+        "dispatch-seat": cmd_dispatch_seat,
+        "run": cmd_run,
+        "loadtest": cmd_loadtest,
         "finalize": cmd_finalize,
     }
 
-    dispatch[args.command](args)
+    try:
+        dispatch[args.command](args)
+    finally:
+        telemetry_flush()
 
 
 if __name__ == "__main__":
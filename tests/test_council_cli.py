@@ -0,0 +1,608 @@
+"""Unit tests for skills/council/council_cli.py."""
+
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+import unittest.mock
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "skills" / "council"))
+
+import council_cli  # noqa: E402
+
+
+class StoreTestCase(unittest.TestCase):
+    """Points every path under ~/.claude/council (and the archive dir) at a temp directory."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        council_dir = council_cli.COUNCIL_DIR
+        for name, value in list(vars(council_cli).items()):
+            if isinstance(value, Path) and (value == council_dir or council_dir in value.parents):
+                patcher = unittest.mock.patch.object(council_cli, name, self.root / "council" / value.relative_to(council_dir))
+                patcher.start()
+                self.addCleanup(patcher.stop)
+        patcher = unittest.mock.patch.object(council_cli, "ARCHIVE_DIR", self.root / "archive")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_session(self, question="Should we shard the store?", **kwargs):
+        return council_cli._session_create_logic(question, **kwargs)["id"]
+
+
+class ContextDigestTest(unittest.TestCase):
+    def test_large_file_goes_through_mmap(self):
+        lines = []
+        for i in range(40000):
+            lines.append(f"def handler_{i}(request):\n    return {i}\n\n")
+        data = "".join(lines).encode()
+        self.assertGreaterEqual(len(data), council_cli.CONTEXT_MMAP_BYTES)
+        with tempfile.NamedTemporaryFile(suffix=".py", delete=False) as fh:
+            fh.write(data)
+        try:
+            doc = council_cli._read_context_file(fh.name, len(data))
+        finally:
+            os.unlink(fh.name)
+        self.assertEqual(doc["mode"], "digest")
+        self.assertIn("Outline of the rest", doc["text"])
+        # Outline line numbers come from newline counts over the mmap
+        first = doc["text"].split("(line: definition):]\n", 1)[1].splitlines()[0]
+        lineno, definition = first.split(": ", 1)
+        self.assertEqual(data.decode().splitlines()[int(lineno) - 1].strip(), definition)
+
+    def test_binary_file_is_none(self):
+        self.assertIsNone(council_cli._digest_buffer(b"\0\1\2" * 10, 30))
+
+
+class LateArrivalMergeTest(unittest.TestCase):
+    def test_arrivals_follow_their_dispatch_not_the_guessed_round(self):
+        # Two concurrent dispatches both guessed round 1; finalize order made them rounds 1 and 2
+        data = {
+            "rounds": [{"round": 1, "dispatch_run": "run-b"}, {"round": 2, "dispatch_run": "run-a"}],
+            "late_arrivals": [
+                {"seat": "advisor_2", "round": 1, "run_id": "run-a", "response": "from a"},
+                {"seat": "advisor_2", "round": 1, "run_id": "run-b", "response": "from b"},
+                {"seat": "advisor_3", "round": 1, "run_id": "run-c", "response": "not finalized yet"},
+            ],
+        }
+        self.assertEqual(council_cli._merge_late_arrivals(data), 2)
+        self.assertEqual(data["rounds"][0]["late_arrivals"]["advisor_2"]["response"], "from b")
+        self.assertEqual(data["rounds"][1]["late_arrivals"]["advisor_2"]["response"], "from a")
+        self.assertEqual([e["run_id"] for e in data["late_arrivals"]], ["run-c"])
+
+    def test_legacy_entries_use_the_round_number(self):
+        data = {"rounds": [{"round": 1}], "late_arrivals": [{"seat": "advisor_1", "round": 1, "response": "x"}]}
+        self.assertEqual(council_cli._merge_late_arrivals(data), 1)
+        self.assertNotIn("late_arrivals", data)
+
+
+class BreakerTripTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        patcher = unittest.mock.patch.object(council_cli, "BREAKERS_FILE", Path(tmp.name) / "breakers.json")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        council_cli.TELEMETRY["counters"].pop("council_breaker_trips_total", None)
+        self.config = {"breaker": {"threshold": 2, "cooldown": 300}}
+
+    def trips(self):
+        return sum(council_cli.TELEMETRY["counters"].get("council_breaker_trips_total", {}).values())
+
+    def test_trip_counted_once_per_transition_to_open(self):
+        for _ in range(5):
+            council_cli._record_breaker("gemini", False, "timeout", self.config)
+        entry = council_cli._read_breakers()["gemini"]
+        self.assertEqual(entry["state"], "open")
+        self.assertEqual(entry["failures"], 5)
+        self.assertEqual(self.trips(), 1)
+
+    def test_failed_half_open_trial_trips_again(self):
+        for _ in range(2):
+            council_cli._record_breaker("gemini", False, "timeout", self.config)
+        breakers = council_cli._read_breakers()
+        breakers["gemini"]["opened_at"] -= 600
+        council_cli.BREAKERS_FILE.write_text(json.dumps(breakers))
+        self.assertTrue(council_cli._claim_breaker_trial("gemini", 60, self.config))
+        council_cli._record_breaker("gemini", False, "timeout", self.config)
+        self.assertEqual(self.trips(), 2)
+        self.assertNotIn("trial_started_at", council_cli._read_breakers()["gemini"])
+
+    def test_success_on_healthy_breaker_skips_the_lock(self):
+        council_cli._record_breaker("codex", True, config=self.config)
+        self.assertFalse(council_cli.BREAKERS_FILE.with_suffix(".lock").exists())
+        council_cli._record_breaker("codex", False, "exit 1", self.config)
+        council_cli._record_breaker("codex", True, config=self.config)
+        self.assertEqual(council_cli._read_breakers()["codex"], {"state": "closed", "failures": 0,
+                                                                 "updated_at": unittest.mock.ANY})
+
+
+class MetricLabelTest(unittest.TestCase):
+    def test_label_values_are_escaped(self):
+        self.assertEqual(council_cli._metric_labels({"b": 'say "hi"\n', "a": "x\\y"}),
+                         'a="x\\\\y",b="say \\"hi\\"\\n"')
+
+
+class AdapterTest(unittest.TestCase):
+    def use_adapter(self, **spec):
+        adapter = council_cli._normalize_adapter("local", spec)
+        patcher = unittest.mock.patch.object(council_cli, "_ADAPTERS", ({"local": adapter}, {}))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return adapter
+
+    def test_string_command_is_split(self):
+        adapter = council_cli._normalize_adapter("local", {"command": "llm -m 'big model' {prompt}"})
+        self.assertEqual(adapter["command"], ["llm", "-m", "big model", "{prompt}"])
+        self.assertEqual(adapter["binary"], "llm")
+
+    def test_prompt_via_is_inferred_from_placeholders(self):
+        infer = lambda command: council_cli._normalize_adapter("local", {"command": command})["prompt_via"]
+        self.assertEqual(infer(["llm", "{prompt}"]), "arg")
+        self.assertEqual(infer(["llm", "-f", "{prompt_file}"]), "file")
+        self.assertEqual(infer(["llm"]), "stdin")
+        with self.assertRaises(ValueError):
+            council_cli._normalize_adapter("local", {"command": ["llm"], "prompt_via": "arg"})
+
+    def test_bool_timeout_is_rejected(self):
+        for value in (True, 0, -5, "60"):
+            with self.assertRaises(ValueError):
+                council_cli._normalize_adapter("local", {"command": ["llm"], "timeout": value})
+
+    def test_agent_argv(self):
+        self.use_adapter(command=["llm", "-p", "{prompt}"])
+        self.assertEqual(council_cli._agent_argv("local", "hi there"), (["llm", "-p", "hi there"], None))
+        self.use_adapter(command=["llm", "--file={prompt_file}"])
+        self.assertEqual(council_cli._agent_argv("local", "hi", "/tmp/p.txt"), (["llm", "--file=/tmp/p.txt"], None))
+        self.use_adapter(command=["llm"])
+        self.assertEqual(council_cli._agent_argv("local", "hi"), (["llm"], "hi"))
+
+    def test_output_field_negative_list_index(self):
+        self.use_adapter(command=["llm"], output="json", output_field="choices.-1.text")
+        stdout = json.dumps({"choices": [{"text": "first"}, {"text": " last "}]})
+        self.assertEqual(council_cli._parse_output("local", stdout), ("last", None))
+        stdout = json.dumps({"choices": []})
+        self.assertEqual(council_cli._parse_output("local", stdout)[1], "output_field choices.-1.text not found")
+
+    def test_json_lines_last_line_wins(self):
+        self.use_adapter(command=["llm"], output="json")
+        stdout = '{"event": "start"}\n{"response": "done"}\n'
+        self.assertEqual(council_cli._parse_output("local", stdout), ("done", None))
+        self.assertEqual(council_cli._parse_output("local", "not json")[1], "unparseable JSON output")
+
+
+class PersonaCatalogTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = Path(tmp.name)
+        (self.dir / "personas").mkdir()
+        for name, value in (("PERSONAS_DIR", self.dir / "personas"), ("PERSONA_CACHE", self.dir / "cache.json"),
+                            ("_PERSONA_CATALOG", {})):
+            patcher = unittest.mock.patch.object(council_cli, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_string_alias_is_one_alias(self):
+        catalog = {"personas": {"The Security Reviewer": {"description": "Threat models", "aliases": "secrev"}}}
+        (self.dir / "personas" / "team.json").write_text(json.dumps(catalog))
+        self.assertEqual(council_cli.lookup_persona("secrev")[0], "The Security Reviewer")
+        self.assertIsNone(council_cli.lookup_persona("s")[0])
+        self.assertTrue(council_cli.PERSONA_CACHE.exists())
+
+    def test_malformed_catalogs_are_reported_not_fatal(self):
+        bad = {
+            "list.json": [1, 2],
+            "sections.json": {"personas": ["The Auditor"], "topics": ["audit"], "topic_keywords": "x"},
+            "entries.json": {"personas": {"The Auditor": {"description": "Checks", "aliases": [1]}},
+                             "topics": {"audit": "The Auditor"}, "topic_keywords": {"audit": [None]}},
+        }
+        for name, body in bad.items():
+            (self.dir / "personas" / name).write_text(json.dumps(body))
+        catalog = council_cli.persona_catalog()
+        self.assertEqual(len(catalog["errors"]), 6)
+        self.assertIsNone(council_cli.lookup_persona("The Auditor")[0])
+        self.assertEqual(council_cli.lookup_persona("contrarian")[0], "The Contrarian")
+        self.assertEqual(catalog["topics"]["audit"], ["The Auditor"])
+
+    def test_catalog_files_are_scanned_once_per_process(self):
+        with unittest.mock.patch.object(council_cli, "_persona_catalog_files", return_value=[]) as files:
+            council_cli.lookup_persona("The Contrarian")
+            council_cli.lookup_persona("The Contrarian")
+        self.assertEqual(files.call_count, 1)
+
+
+class ArchiveTest(StoreTestCase):
+    def test_target_is_claimed_before_rendering(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            first, second = ({"id": f"2026-01-01-000{i}", "date": "2026-01-01", "topic": "pricing"} for i in (1, 2))
+            path = council_cli._archive_target(first, Path(tmp))
+            self.assertEqual(path.name, "2026-01-01-pricing.md")
+            self.assertEqual(council_cli._archive_target(second, Path(tmp)).name, "2026-01-01-0002.md")
+            self.assertEqual(council_cli._archive_target(first, Path(tmp)), path)
+
+    def test_same_day_same_topic_sessions_get_their_own_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            files = []
+            for i in range(16):
+                f = tmp / f"s{i}.json"
+                council_cli.write_session_file(f, {"id": f"2026-01-01-{i:04d}", "date": "2026-01-01",
+                                                   "topic": "pricing", "question": "q", "rounds": []})
+                files.append(f)
+            result = council_cli._archive_logic(files, tmp / "archive", workers=8)
+            self.assertEqual(result["errors"], [])
+            targets = [a["archive_file"] for a in result["archived"]]
+            self.assertEqual(len(set(targets)), 16)
+            self.assertIn(str(tmp / "archive" / "2026-01-01-pricing.md"), targets)
+            for a in result["archived"]:
+                self.assertIn(a["id"], Path(a["archive_file"]).read_text().splitlines()[0])
+            self.assertEqual(sorted(p.suffix for p in (tmp / "archive").iterdir()), [".md"] * 16)
+
+    def test_one_unwritable_archive_doesnt_stop_the_batch(self):
+        ok, bad = self.create_session(topic="kept"), self.create_session(topic="blocked")
+        (council_cli.ARCHIVE_DIR / f"{datetime.now():%Y-%m-%d}-blocked.md").mkdir(parents=True)
+        files = [council_cli.load_session(sid)[1] for sid in (ok, bad)]
+        result = council_cli._archive_logic(files)
+        self.assertEqual([a["id"] for a in result["archived"]], [ok])
+        self.assertEqual([e["file"] for e in result["errors"]], [str(files[1])])
+        self.assertTrue(council_cli.load_session(ok)[0]["archived"])
+        self.assertFalse(council_cli.load_session(bad)[0]["archived"])
+
+
+class SessionReadTest(unittest.TestCase):
+    def test_legacy_files_are_upgraded_on_read(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            f = Path(tmp) / "legacy.json"
+            f.write_text(json.dumps({"id": "legacy", "personas": {"codex": "The Contrarian"},
+                                     "rounds": [{"round": 1, "codex": {"response": "no"}, "briefing": "b"}]}))
+            data = council_cli.read_session(f)
+        self.assertEqual(data["schema_version"], council_cli.SCHEMA_VERSION)
+        self.assertEqual(data["personas"], {"advisor_1": "The Contrarian"})
+        self.assertEqual(data["rounds"][0]["advisor_1"], "no")
+        self.assertEqual(data["rounds"][0]["synthesis"], "b")
+
+
+class SessionUpdateTest(StoreTestCase):
+    def test_rate_and_late_arrivals_dont_drop_each_other(self):
+        sid = self.create_session()
+        council_cli._session_append_logic(sid, {"advisor_1": "yes"})
+
+        def late(i):
+            council_cli._record_late_arrival(sid, 5, f"advisor_{i}", {"response": f"late {i}"}, "run-x")
+
+        def rate(i):
+            council_cli._session_update_logic(sid, lambda data: data.update(rating=i % 5 + 1))
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: (late if i % 2 else rate)(i), range(16)))
+        data, _ = council_cli.load_session(sid)
+        self.assertEqual(sorted(e["seat"] for e in data["late_arrivals"]), [f"advisor_{i}" for i in (1, 11, 13, 15, 3, 5, 7, 9)])
+        self.assertIn(data["rating"], range(1, 6))
+
+    def test_missing_session_is_none(self):
+        self.assertIsNone(council_cli._session_update_logic("2026-01-01-00-00-nope", lambda data: None))
+
+
+class SessionStoreTest(StoreTestCase):
+    def test_ids_sort_in_creation_order(self):
+        start = datetime(2026, 3, 9, 23, 59, 58, 999000)
+        times = [start + timedelta(milliseconds=ms) for ms in (0, 1, 2, 999, 1000, 61000, 3600000)]
+        ids = [council_cli.new_session_id(t, "same-topic") for t in times]
+        self.assertEqual(sorted(ids), ids)
+        self.assertEqual(len({council_cli.new_session_id(start, "same-topic") for _ in range(100)}), 100)
+
+    def test_session_path_shards_by_year_and_month(self):
+        path = council_cli.session_path("2026-03-09-23-59-0abc123456-pricing")
+        self.assertEqual(path.relative_to(council_cli.SESSIONS_DIR).parts,
+                         ("2026", "03", "2026-03-09-23-59-0abc123456-pricing.json"))
+        self.assertEqual(council_cli.session_path("imported").parent, council_cli.SESSIONS_DIR)
+
+    def test_migrate_moves_flat_files_and_upgrades_them(self):
+        council_cli.SESSIONS_DIR.mkdir(parents=True)
+        legacy = {"id": "2025-11-02-old-topic", "personas": {"codex": "The Contrarian"}, "rounds": []}
+        (council_cli.SESSIONS_DIR / "renamed-by-hand.json").write_text(json.dumps(legacy))
+        self.assertEqual(council_cli.load_session("2025-11-02-old-topic")[0]["personas"], {"advisor_1": "The Contrarian"})
+
+        layout = council_cli._migrate_layout_logic()
+        schema = council_cli._migrate_schema_logic()
+        target = council_cli.SESSIONS_DIR / "2025" / "11" / "2025-11-02-old-topic.json"
+        self.assertEqual(layout["moved"], [{"id": "2025-11-02-old-topic", "file": str(target)}])
+        self.assertEqual(schema["count"], 1)
+        self.assertEqual(json.loads(target.read_text())["schema_version"], council_cli.SCHEMA_VERSION)
+        self.assertEqual(list(council_cli.SESSIONS_DIR.glob("*.json")), [])
+        self.assertEqual(council_cli.load_session("2025-11-02-old-topic")[1], target)
+
+    def test_miss_only_scans_flat_files(self):
+        sid = self.create_session()
+        with unittest.mock.patch.object(council_cli, "read_session", wraps=council_cli.read_session) as read:
+            self.assertEqual(council_cli.load_session("2026-01-01-00-00-0000000000-missing"), (None, None))
+        self.assertEqual(read.call_count, 0)
+        self.assertIsNotNone(council_cli.load_session(sid)[0])
+
+    def test_failed_create_releases_the_id(self):
+        with unittest.mock.patch.object(council_cli, "write_session_file", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.create_session()
+        self.assertEqual(council_cli.session_files(), [])
+
+
+class ContextFilesTest(StoreTestCase):
+    def write(self, name, text):
+        path = self.root / name
+        path.write_text(text, encoding="utf-8")
+        return str(path)
+
+    def test_budget_counts_utf8_bytes(self):
+        lines = "".join(f"ligne {i}: café crème brûlée — ünïcödé\n" for i in range(400))
+        path = self.write("notes.md", lines)
+        result = council_cli._context_files_logic("café notes", files=[path], budget=4096)
+        self.assertEqual(result["files"][0]["mode"], "truncated")
+        self.assertLessEqual(len(result["context"].encode()), 4096)
+        self.assertLessEqual(result["bytes"], 4096)
+        self.assertTrue(result["context"].endswith("[... truncated to fit the context budget]"))
+
+    def test_locked_cache_falls_back_to_uncached_reads(self):
+        path = self.write("a.py", "def handler():\n    return 1\n")
+        council_cli._context_files_logic("handler", files=[path])
+        holder = sqlite3.connect(council_cli.CONTEXT_CACHE_DB)
+        holder.execute("BEGIN EXCLUSIVE")
+        try:
+            with unittest.mock.patch.object(council_cli, "CONTEXT_CACHE_TIMEOUT", 0.05):
+                result = council_cli._context_files_logic("handler", files=[path])
+        finally:
+            holder.rollback()
+            holder.close()
+        self.assertEqual([f["path"] for f in result["files"]], [path])
+        self.assertEqual(result["cache_hits"], 0)
+        self.assertEqual(council_cli._context_files_logic("handler", files=[path])["cache_hits"], 1)
+
+
+class CassetteTest(StoreTestCase):
+    def setUp(self):
+        super().setUp()
+        adapter = council_cli._normalize_adapter("echo", {
+            "command": [sys.executable, "-c", "import sys; print('echo: ' + sys.stdin.read())"]})
+        patcher = unittest.mock.patch.object(council_cli, "_ADAPTERS", ({"echo": adapter}, {}))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.tape = str(self.root / "tape")
+
+    def run_seat(self, prompt, seat="advisor_1", **kwargs):
+        return council_cli._run_seat(seat, "echo", prompt, timeout=30, cassette=self.tape, replay_speed=0, **kwargs)
+
+    def test_record_then_replay(self):
+        live = self.run_seat("first prompt", cassette_mode="record")
+        self.assertEqual((live["source"], live["response"], live["error"]), ("live", "echo: first prompt", None))
+        self.assertEqual([p.suffix for p in Path(self.tape).iterdir()], [".json"])
+
+        replayed = self.run_seat("first prompt", cassette_mode="replay")
+        self.assertEqual((replayed["source"], replayed["cassette_match"]), ("cassette", "exact"))
+        self.assertEqual((replayed["response"], replayed["error"]), ("echo: first prompt", None))
+        # An exact prompt match replays on any seat
+        self.assertEqual(self.run_seat("first prompt", "advisor_2", cassette_mode="replay")["cassette_match"], "exact")
+
+    def test_concurrent_runs_of_one_seat_keep_their_own_output(self):
+        prompts = [f"prompt {i} " + "x" * 20000 for i in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda p: council_cli._run_seat("advisor_1", "echo", p, timeout=30, limit=8), prompts))
+        self.assertEqual([r["response"] for r in results], [f"echo: {p}" for p in prompts])
+
+    def test_seat_fallback_is_opt_in(self):
+        self.run_seat("Tuesday's prompt", cassette_mode="record")
+        missed = self.run_seat("Wednesday's prompt", cassette_mode="replay")
+        self.assertIn("no cassette entry", missed["error"])
+        fallback = self.run_seat("Wednesday's prompt", cassette_mode="replay", cassette_fallback=True)
+        self.assertEqual((fallback["cassette_match"], fallback["response"]), ("seat", "echo: Tuesday's prompt"))
+        self.assertIn("cassette fallback", fallback["warning"])
+
+    def test_corrupt_recordings_are_skipped(self):
+        self.run_seat("same prompt", "advisor_2", cassette_mode="record")
+        self.run_seat("same prompt", cassette_mode="record")
+        exact = next(Path(self.tape).glob("advisor_1-*.json"))
+        exact.write_text('{"stdout": "trunc')
+        replayed = self.run_seat("same prompt", cassette_mode="replay")
+        self.assertEqual((replayed["cassette_match"], replayed["response"]), ("exact", "echo: same prompt"))
+        for path in Path(self.tape).glob("*.json"):
+            path.write_text("")
+        self.assertIn("no cassette entry", self.run_seat("same prompt", cassette_mode="replay", cassette_fallback=True)["error"])
+
+
+class RunSubstitutionTest(unittest.TestCase):
+    def run_council(self, agents_json=None):
+        seats = ["advisor_1", "advisor_2", "advisor_3"]
+        pipeline = {"session_id": "s", "agent_status": {"available": ["codex", "claude"]},
+                    "prompts": {seat: "p" for seat in seats},
+                    "assignment": {seat: {"persona": "The Contrarian"} for seat in seats}}
+        dispatched = {}
+
+        def dispatch(prompts, seat_agents, **kwargs):
+            dispatched.update(seat_agents)
+            return {"mode": "parallel", "responses": {s: {"agent": a, "response": "r"} for s, a in seat_agents.items()}}
+        with unittest.mock.patch.multiple(
+                council_cli, _pipeline_logic=lambda *a, **k: pipeline, _dispatch_logic=dispatch,
+                _finalize_logic=lambda *a, **k: {"round": 1, "synthesis_prompt": "x"},
+                _dispatch_seat=lambda *a, **k: {"error": "skipped", "response": ""},
+                _ADAPTERS=council_cli._load_adapters({})):
+            return council_cli._run_logic("q", seat_agents_json=agents_json), dispatched
+
+    def test_default_seats_on_missing_clis_move_and_are_reported(self):
+        output, dispatched = self.run_council()
+        self.assertNotEqual(dispatched["advisor_2"], "gemini")
+        self.assertEqual(output["substitutions"], {"advisor_2": {"from": "gemini", "to": dispatched["advisor_2"]}})
+        self.assertEqual(output["advisors"]["advisor_2"]["substituted_from"], "gemini")
+
+    def test_pinned_seats_keep_their_cli(self):
+        output, dispatched = self.run_council('{"advisor_3": "gemini"}')
+        self.assertEqual(dispatched["advisor_3"], "gemini")
+        self.assertNotIn("advisor_3", output["substitutions"])
+        self.assertIn("advisor_2", output["substitutions"])
+
+
+class SearchTest(StoreTestCase):
+    def add_session(self, question, *responses):
+        sid = self.create_session(question)
+        council_cli._session_append_logic(sid, {f"advisor_{i + 1}": r for i, r in enumerate(responses)})
+        return sid
+
+    def test_index_follows_new_changed_and_deleted_sessions(self):
+        first = self.add_session("Which database for the ledger?", "Use Postgres for the ledger.")
+        self.add_session("Should we adopt Kubernetes?", "Not yet; a single VM is enough.")
+        result = council_cli._search_logic("postgres")
+        self.assertEqual(result["index"], {"updated": 2, "removed": 0})
+        self.assertEqual([(h["session_id"], h["seat"], h["field"]) for h in result["hits"]], [(first, "advisor_1", "response")])
+        self.assertEqual(council_cli._search_logic("postgres")["index"], {"updated": 0, "removed": 0})
+
+        council_cli._session_update_logic(first, lambda data: data.update(
+            outcome={"status": "adopted", "note": "Migrated to CockroachDB after all", "date": "2026-01-01"}))
+        result = council_cli._search_logic("cockroachdb")
+        self.assertEqual(result["index"], {"updated": 1, "removed": 0})
+        self.assertEqual([h["field"] for h in result["hits"]], ["outcome"])
+
+        council_cli.load_session(first)[1].unlink()
+        result = council_cli._search_logic("postgres")
+        self.assertEqual((result["index"], result["count"]), ({"updated": 0, "removed": 1}, 0))
+
+    def test_ranking_and_match_modes(self):
+        dense = self.add_session("Caching plan", "Redis here, Redis there: put Redis in front of every read path.")
+        sparse = self.add_session("Observability plan",
+                                  "Start with structured logs, traces and dashboards; maybe a Redis exporter later, "
+                                  "but most of the work is agreeing on log fields, sampling and retention.")
+        for topic in ("hiring", "pricing", "roadmap"):  # bm25 needs the term to be rare to score it
+            self.add_session(f"{topic.title()} plan", f"Keep the {topic} simple.")
+        hits = council_cli._search_logic("redis")["hits"]
+        self.assertEqual([h["session_id"] for h in hits], [dense, sparse])
+        self.assertGreater(hits[0]["score"], hits[1]["score"])
+        self.assertIn("**Redis**", hits[0]["snippet"])
+
+        self.assertEqual(council_cli._search_logic("redis dashboards")["count"], 1)
+        self.assertEqual(council_cli._search_logic("caching dashboards", match_any=True)["count"], 2)
+        self.assertIn("error", council_cli._search_logic("?!"))
+
+
+HOLD_SLOT = """
+import sys
+from pathlib import Path
+sys.path.insert(0, sys.argv[1])
+import council_cli
+council_cli.LOCKS_DIR = Path(sys.argv[2])
+with council_cli.provider_slot("codex", 1, wait_timeout=5) as (slot, _):
+    print(slot, flush=True)
+    sys.stdin.read()
+"""
+
+
+class ProviderSlotTest(StoreTestCase):
+    def test_slots_are_shared_across_processes(self):
+        holder = subprocess.Popen([sys.executable, "-c", HOLD_SLOT, str(Path(council_cli.__file__).parent),
+                                   str(council_cli.LOCKS_DIR)], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        try:
+            self.assertEqual(holder.stdout.readline().strip(), "0")
+            with self.assertRaises(TimeoutError):
+                with council_cli.provider_slot("codex", 1, wait_timeout=0.2):
+                    pass
+            with council_cli.provider_slot("codex", 2, wait_timeout=0.2) as (slot, _):
+                self.assertEqual(slot, 1)
+            with council_cli.provider_slot("gemini", 1, wait_timeout=0.2) as (slot, _):
+                self.assertEqual(slot, 0)
+        finally:
+            holder.communicate("")
+        # The slot is released when the holder exits
+        with council_cli.provider_slot("codex", 1, wait_timeout=0.2) as (slot, _):
+            self.assertEqual(slot, 0)
+
+    def test_limit_caps_concurrent_holders(self):
+        running, peak, guard = [0], [0], threading.Lock()
+
+        def seat(_):
+            with council_cli.provider_slot("codex", 2, wait_timeout=10):
+                with guard:
+                    running[0] += 1
+                    peak[0] = max(peak[0], running[0])
+                time.sleep(0.05)
+                with guard:
+                    running[0] -= 1
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            list(pool.map(seat, range(6)))
+        self.assertEqual(peak[0], 2)
+
+
+class PositionDriftTest(unittest.TestCase):
+    BASE = ("[ANCHORED] The billing service already shards by tenant. [INFERRED] Moving invoices keeps "
+            "latency flat. RECOMMENDATION: Move invoices into the billing service this quarter.")
+
+    def drift(self, text, previous=BASE):
+        previous_round = {"round": 1, "advisor_1": previous}
+        return council_cli._position_drift(previous_round, {"advisor_1": text}, {})
+
+    def test_same_position_is_held(self):
+        result = self.drift(self.BASE + " [ANCHORED] Tenants are already isolated.")
+        self.assertEqual(result["seats"]["advisor_1"]["status"], "held")
+        self.assertEqual((result["from_round"], result["shifted"]), (1, []))
+
+    def test_rewritten_reasoning_with_the_same_recommendation_is_refined(self):
+        text = ("[SPECULATIVE] Queue depth could spike at month end. [SPECULATIVE] Retries might double writes. "
+                "RECOMMENDATION: Move invoices into the billing service this quarter.")
+        seat = self.drift(text)["seats"]["advisor_1"]
+        self.assertEqual(seat["status"], "refined")
+        self.assertFalse(seat["recommendation_changed"])
+        self.assertEqual(seat["tag_shift"]["speculative"], 1.0)
+
+    def test_new_recommendation_is_shifted(self):
+        text = self.BASE.replace("Move invoices into the billing service this quarter",
+                                 "Keep invoices separate until auditors sign off")
+        result = self.drift(text)
+        seat = result["seats"]["advisor_1"]
+        self.assertEqual((seat["status"], result["shifted"]), ("shifted", ["advisor_1"]))
+        self.assertIn("this quarter", seat["previous_recommendation"])
+        self.assertIn("auditors", seat["recommendation"])
+
+    def test_seats_without_a_previous_answer_are_skipped(self):
+        self.assertEqual(self.drift(self.BASE, previous="")["seats"], {})
+        self.assertEqual(council_cli._position_drift({"round": 1}, {"advisor_2": self.BASE}, {})["seats"], {})
+
+
+class GroundingCacheTest(StoreTestCase):
+    def put(self, query, facts="Node 22 is the active LTS.", **kwargs):
+        return council_cli._grounding_put_logic(query, facts, **kwargs)
+
+    def test_reworded_question_matches_and_unrelated_doesnt(self):
+        self.put("What is the current Node LTS version?", topic="tooling", sources=["https://nodejs.org"])
+        hit = council_cli._grounding_get_logic("current LTS version of node")["facts"]
+        self.assertEqual([(f["facts"], f["fresh"], f["score"]) for f in hit], [("Node 22 is the active LTS.", True, 1.0)])
+        self.assertEqual(council_cli._grounding_get_logic("Which Postgres version supports MERGE?")["count"], 0)
+        # Same topic counts with a single shared keyword
+        self.assertEqual(council_cli._grounding_get_logic("node release schedule", topic="tooling")["count"], 1)
+        self.assertEqual(council_cli._grounding_get_logic("node release schedule")["count"], 0)
+
+    def test_ttl_and_stale_entries(self):
+        old = time.time() - 7200
+        self.put("current node lts version", ttl=3600, checked_at=old)
+        self.assertEqual(council_cli._grounding_get_logic("current node lts version")["count"], 0)
+        stale = council_cli._grounding_get_logic("current node lts version", include_stale=True)["facts"]
+        self.assertEqual([(f["fresh"], f["age_hours"]) for f in stale], [(False, 2.0)])
+
+        # Expired long enough ago, entries are pruned on the next put
+        self.put("current node lts version", ttl=1, checked_at=time.time() - council_cli.GROUNDING_KEEP_STALE - 10)
+        self.put("latest python release", facts="Python 3.14 is current.")
+        self.assertEqual(sorted(council_cli._read_grounding()), ["latest python release"])
+
+    def test_put_replaces_the_same_question_and_rejects_empty(self):
+        self.put("current node lts version", facts="Node 20 is the active LTS.")
+        self.put("node lts current version?", facts="Node 22 is the active LTS.")
+        self.assertEqual([e["facts"] for e in council_cli._read_grounding().values()], ["Node 22 is the active LTS."])
+        self.assertIn("error", self.put("the and of"))
+        self.assertIn("error", self.put("node lts", facts="  "))
+
+
+if __name__ == "__main__":
+    unittest.main()